@@ -0,0 +1,88 @@
+"""
+Measures the memory held per loaded Character.
+
+    python benchmarks/character_memory.py [--count N]
+
+Each character is parsed from its own JSON text, as CharacterStore does, and
+kept alive; the live memory traced by tracemalloc is divided by the count.
+The compact Character is compared against the previous representation, a
+dataclass holding the parsed dicts.
+"""
+import argparse
+import json
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+from gamagama.cli.characters import Character
+
+STATS = ["strength", "constitution", "agility", "quickness", "self_discipline",
+         "reasoning", "memory", "intuition", "presence", "empathy"]
+SKILLS = [f"skill_{i}" for i in range(40)]
+COUNTS = ["hit_points", "power_points", "exhaustion", "fate"]
+
+
+@dataclass
+class DictCharacter:
+    """The previous Character layout: four plain dicts."""
+
+    name: str
+    system: str = "generic"
+    strings: Dict[str, str] = field(default_factory=dict)
+    stats: Dict[str, int] = field(default_factory=dict)
+    skills: Dict[str, int] = field(default_factory=dict)
+    counts: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DictCharacter":
+        counts = {key: (value[0], value[1]) for key, value in data.get("counts", {}).items()}
+        return cls(
+            name=data["name"],
+            system=data.get("system", "generic"),
+            strings=data.get("strings", {}),
+            stats=data.get("stats", {}),
+            skills=data.get("skills", {}),
+            counts=counts,
+        )
+
+
+def sample_json(i: int) -> str:
+    """A rolemaster-sized NPC: a few strings, 10 stats, 40 skills, 4 counts."""
+    return json.dumps({
+        "name": f"NPC {i}",
+        "system": "rolemaster",
+        "strings": {"race": "Orc", "profession": "Fighter", "notes": f"Guard #{i}"},
+        "stats": {stat: 20 + (i * 7 + n) % 80 for n, stat in enumerate(STATS)},
+        "skills": {skill: (i + n) % 100 for n, skill in enumerate(SKILLS)},
+        "counts": {count: [10 + n, 10 + n] for n, count in enumerate(COUNTS)},
+    })
+
+
+def bytes_per_character(character_class, texts) -> float:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        characters = [character_class.from_dict(json.loads(text)) for text in texts]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del characters
+    return (after - before) / len(texts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=5000, help="Number of characters to load (default: 5000).")
+    args = parser.parse_args()
+
+    texts = [sample_json(i) for i in range(args.count)]
+    dict_bytes = bytes_per_character(DictCharacter, texts)
+    compact_bytes = bytes_per_character(Character, texts)
+
+    print(f"{args.count} characters")
+    print(f"  dicts:   {dict_bytes:8.0f} bytes/character")
+    print(f"  compact: {compact_bytes:8.0f} bytes/character ({compact_bytes / dict_bytes:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,74 @@
+import importlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
 from .base import Character
-from .store import CharacterStore
+from .store import CharacterStore, LoadResult, Store
+
+# Store backends selectable with 'store' in the [characters] config section.
+STORE_BACKENDS = ("json", "sqlite", "roster")
+
+# Names exported from modules that are only imported when first used, so a
+# start with the default JSON store does not load sqlite3 or the roster scanner.
+_LAZY_EXPORTS = {
+    "CatalogEntry": ".catalog",
+    "CharacterCatalog": ".catalog",
+    "RosterStore": ".roster",
+    "SQLiteCharacterStore": ".sqlite_store",
+}
+
+_store_config: Dict[str, Any] = {}
+
+
+def open_store(config: Optional[Dict[str, Any]] = None) -> Store:
+    """
+    Creates the store described by a [characters] config section:
+    'store' names a backend (default "json") and 'path' overrides its location
+    (the characters directory for json, the database file for sqlite, the
+    JSON Lines or JSON array file for roster).
+    """
+    config = config or {}
+    backend = config.get("store", "json")
+    path = Path(config["path"]).expanduser() if config.get("path") else None
+
+    if backend == "sqlite":
+        from .sqlite_store import SQLiteCharacterStore
+        return SQLiteCharacterStore(path)
+    if backend == "roster":
+        from .roster import RosterStore
+        return RosterStore(path or Path.home() / ".config" / "gg-cli" / "roster.jsonl")
+    return CharacterStore(base_dir=path)
+
+
+def configure_store(config: Dict[str, Any]):
+    """Sets the [characters] config section used by default_store()."""
+    global _store_config
+    _store_config = dict(config)
+
+
+def default_store() -> Store:
+    """Creates a store as configured; sessions use this unless given one."""
+    return open_store(_store_config)
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
+
 
-__all__ = ["Character", "CharacterStore"]
+__all__ = [
+    "CatalogEntry",
+    "Character",
+    "CharacterCatalog",
+    "CharacterStore",
+    "LoadResult",
+    "RosterStore",
+    "SQLiteCharacterStore",
+    "STORE_BACKENDS",
+    "Store",
+    "configure_store",
+    "default_store",
+    "open_store",
+]
@@ -1,30 +1,104 @@
-from dataclasses import dataclass, field
-from typing import Dict, Tuple
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from .compact import CountBlock, IntBlock, StringBlock
+
+
+class _BlockField:
+    """Exposes a slot holding a compact block, converting mappings assigned to it."""
+
+    def __init__(self, slot: str, block_class):
+        self.slot = slot
+        self.block_class = block_class
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return getattr(obj, self.slot)
+
+    def __set__(self, obj, value):
+        if not isinstance(value, self.block_class):
+            value = self.block_class(value)
+        setattr(obj, self.slot, value)
 
 
-@dataclass
 class Character:
-    """Represents a player character loaded from a JSON file."""
+    """Represents a player character loaded from a JSON file.
+
+    Characters are slotted, and their four mappings are compact blocks (see
+    compact.py) that behave like dicts: keys are interned and their layout is
+    shared between characters with the same schema, and numbers are held in
+    arrays.
+    """
+
+    __slots__ = ("name", "system", "_strings", "_stats", "_skills", "_counts")
+
+    strings = _BlockField("_strings", StringBlock)
+    stats = _BlockField("_stats", IntBlock)
+    skills = _BlockField("_skills", IntBlock)
+    counts = _BlockField("_counts", CountBlock)
 
-    name: str
-    system: str = "generic"
-    strings: Dict[str, str] = field(default_factory=dict)
-    stats: Dict[str, int] = field(default_factory=dict)
-    skills: Dict[str, int] = field(default_factory=dict)
-    counts: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    def __init__(
+        self,
+        name: str,
+        system: str = "generic",
+        strings: Optional[Mapping[str, str]] = None,
+        stats: Optional[Mapping[str, int]] = None,
+        skills: Optional[Mapping[str, int]] = None,
+        counts: Optional[Mapping[str, Tuple[int, int]]] = None,
+    ):
+        self.name = name
+        self.system = system
+        self.strings = strings or {}
+        self.stats = stats or {}
+        self.skills = skills or {}
+        self.counts = counts or {}
 
     @classmethod
     def from_dict(cls, data: dict) -> "Character":
         """Create a Character from a dictionary (parsed JSON)."""
-        counts = {}
-        for key, value in data.get("counts", {}).items():
-            counts[key] = (value[0], value[1])
-
         return cls(
             name=data["name"],
             system=data.get("system", "generic"),
             strings=data.get("strings", {}),
             stats=data.get("stats", {}),
             skills=data.get("skills", {}),
-            counts=counts,
+            counts=data.get("counts", {}),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the character as a dictionary in its JSON file layout."""
+        return {
+            "name": self.name,
+            "system": self.system,
+            "strings": dict(self.strings),
+            "stats": dict(self.stats),
+            "skills": dict(self.skills),
+            "counts": {key: list(value) for key, value in self.counts.items()},
+        }
+
+    def copy(self) -> "Character":
+        """Return a copy that shares no mutable state with this character."""
+        clone = Character.__new__(Character)
+        clone.name = self.name
+        clone.system = self.system
+        clone._strings = self._strings.copy()
+        clone._stats = self._stats.copy()
+        clone._skills = self._skills.copy()
+        clone._counts = self._counts.copy()
+        return clone
+
+    def _fields(self) -> tuple:
+        return (self.name, self.system, self.strings, self.stats, self.skills, self.counts)
+
+    def __eq__(self, other):
+        if not isinstance(other, Character):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Character(name={self.name!r}, system={self.system!r}, strings={self.strings!r}, "
+            f"stats={self.stats!r}, skills={self.skills!r}, counts={self.counts!r})"
         )
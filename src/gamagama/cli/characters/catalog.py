@@ -0,0 +1,143 @@
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .base import Character
+
+CATALOG_FORMAT = 1
+
+# The index lives next to the characters it describes. Without a '.json'
+# suffix it is never mistaken for a character file.
+CATALOG_FILE = ".gg-catalog"
+
+
+@dataclass
+class CatalogEntry:
+    """What the catalog knows about one character file, without loading it."""
+
+    name: str  # The file name without '.json', as used by 'load player <name>'
+    character_name: str
+    system: str
+    path: str
+    mtime_ns: int
+    size: int
+    strings: Dict[str, str] = field(default_factory=dict)
+    # The file is not a valid character. It stays in the index, so it is not
+    # parsed again until it changes, but is never listed.
+    invalid: bool = False
+
+    def matches(self, text: str) -> bool:
+        """True if text occurs (case-insensitively) in the names or string fields."""
+        text = text.lower()
+        fields = [self.name, self.character_name, *self.strings.values()]
+        return any(text in str(value).lower() for value in fields)
+
+
+class CharacterCatalog:
+    """
+    An index of the character files in a directory, kept in a file there.
+
+    refresh() brings the index up to date by comparing each file's mtime and
+    size with the index, so only new or changed files are parsed. Files that
+    are not valid characters are indexed too (marked invalid) and skipped.
+    """
+
+    def __init__(self, base_dir: Path, index_path: Optional[Path] = None):
+        self.base_dir = base_dir
+        self.index_path = index_path if index_path is not None else base_dir / CATALOG_FILE
+        self._entries: Optional[Dict[str, CatalogEntry]] = None
+
+    def entries(self) -> List[CatalogEntry]:
+        """Return the up-to-date entries, sorted by name."""
+        entries = self.refresh()
+        return [entries[name] for name in sorted(entries)]
+
+    def names(self) -> List[str]:
+        return sorted(self.refresh())
+
+    def search(self, text: str) -> List[CatalogEntry]:
+        return [entry for entry in self.entries() if entry.matches(text)]
+
+    def refresh(self) -> Dict[str, CatalogEntry]:
+        """
+        Rescan base_dir, re-reading only files whose mtime or size changed.
+        Returns the valid entries; the index file is rewritten only if an entry changed.
+        """
+        if self._entries is None:
+            self._entries = self._read_index()
+
+        try:
+            scan = [e for e in os.scandir(self.base_dir) if _is_character_file(e.name)]
+        except OSError:
+            scan = []
+
+        entries: Dict[str, CatalogEntry] = {}
+        changed = False
+        for dir_entry in scan:
+            name = dir_entry.name[:-len(".json")]
+            try:
+                st = dir_entry.stat()
+            except OSError:
+                continue
+
+            entry = self._entries.get(name)
+            if entry is None or (entry.mtime_ns, entry.size) != (st.st_mtime_ns, st.st_size):
+                new_entry = _read_entry(name, dir_entry.path, st)
+                changed = changed or new_entry != entry
+                entry = new_entry
+            entries[name] = entry
+
+        changed = changed or entries.keys() != self._entries.keys()
+        self._entries = entries
+        if changed:
+            self._write_index()
+        return {name: entry for name, entry in entries.items() if not entry.invalid}
+
+    def _read_index(self) -> Dict[str, CatalogEntry]:
+        try:
+            with open(self.index_path, "r") as f:
+                data = json.load(f)
+            if data.get("format") != CATALOG_FORMAT:
+                return {}
+            return {e["name"]: CatalogEntry(**e) for e in data["entries"]}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
+
+    def _write_index(self):
+        data = {"format": CATALOG_FORMAT, "entries": [asdict(e) for e in self._entries.values()]}
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            # A read-only or missing directory still gets an in-memory catalog.
+            pass
+
+
+def _is_character_file(file_name: str) -> bool:
+    return file_name.endswith(".json") and not file_name.startswith(".")
+
+
+def _read_entry(name: str, path: str, st) -> CatalogEntry:
+    """Parse one file into a catalog entry, marked invalid if it is not a valid character."""
+    try:
+        with open(path, "r") as f:
+            character = Character.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError, IndexError, AttributeError):
+        return CatalogEntry(
+            name=name, character_name="", system="", path=path,
+            mtime_ns=st.st_mtime_ns, size=st.st_size, invalid=True,
+        )
+
+    return CatalogEntry(
+        name=name,
+        character_name=character.name,
+        system=character.system,
+        path=path,
+        mtime_ns=st.st_mtime_ns,
+        size=st.st_size,
+        strings={k: v for k, v in character.strings.items() if isinstance(v, str)},
+    )
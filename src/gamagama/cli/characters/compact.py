@@ -0,0 +1,166 @@
+import sys
+import weakref
+from array import array
+from collections.abc import MutableMapping
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+class Layout:
+    """
+    An ordered tuple of keys and their positions, shared by every block with
+    the same keys. Keys are interned, so characters of the same schema hold
+    one copy of each key between them.
+    """
+
+    __slots__ = ("keys", "index", "__weakref__")
+
+    _registry: "weakref.WeakValueDictionary[Tuple[str, ...], Layout]" = weakref.WeakValueDictionary()
+
+    def __init__(self, keys: Tuple[str, ...]):
+        self.keys = keys
+        self.index = {key: i for i, key in enumerate(keys)}
+
+    @classmethod
+    def for_keys(cls, keys: Iterable[str]) -> "Layout":
+        """Return the shared layout for these keys, in this order."""
+        keys = tuple(sys.intern(key) if type(key) is str else key for key in keys)
+        layout = cls._registry.get(keys)
+        if layout is None:
+            layout = cls(keys)
+            cls._registry[keys] = layout
+        return layout
+
+    def with_key(self, key: str) -> "Layout":
+        return Layout.for_keys(self.keys + (key,))
+
+    def without_key(self, key: str) -> "Layout":
+        return Layout.for_keys(k for k in self.keys if k != key)
+
+
+class _Block(MutableMapping):
+    """
+    A mapping stored as a shared Layout plus a flat sequence of values,
+    'width' values per key. Integer values are kept in an array; anything an
+    array cannot hold (including bools, which it would turn into ints)
+    switches the block to a list.
+    """
+
+    __slots__ = ("_layout", "_values")
+
+    width = 1
+    numeric = True
+
+    def __init__(self, data: Optional[Any] = None):
+        items = list(data.items()) if data is not None else []
+        self._layout = Layout.for_keys(key for key, _ in items)
+        flat: List[Any] = []
+        for _, value in items:
+            flat.extend(self._flatten(value))
+        self._values = self._pack(flat)
+
+    def _flatten(self, value) -> List[Any]:
+        return [value]
+
+    def _unflatten(self, i: int):
+        return self._values[i]
+
+    def _pack(self, flat: List[Any]):
+        if self.numeric and all(type(item) is int for item in flat):
+            for typecode in ("i", "q"):
+                try:
+                    return array(typecode, flat)
+                except OverflowError:
+                    continue
+        return list(flat)
+
+    def _store(self, flat: List[Any], operation):
+        """
+        Apply an in-place update that writes the items in flat. An array is
+        updated on a copy that is swapped in only if every item fit, so a
+        rejected item never leaves the block half-written.
+        """
+        values = self._values
+        if isinstance(values, array):
+            if all(type(item) is int for item in flat):
+                updated = values[:]
+                try:
+                    operation(updated)
+                except OverflowError:
+                    pass
+                else:
+                    self._values = updated
+                    return
+            # Repack, which widens the array or switches to a list as needed.
+            updated = list(values)
+            operation(updated)
+            self._values = self._pack(updated)
+        else:
+            operation(values)
+
+    def __getitem__(self, key):
+        return self._unflatten(self._layout.index[key] * self.width)
+
+    def __setitem__(self, key, value):
+        flat = self._flatten(value)
+        i = self._layout.index.get(key)
+        if i is None:
+            self._store(flat, lambda values: values.extend(flat))
+            self._layout = self._layout.with_key(key)
+        else:
+            start = i * self.width
+
+            def assign(values):
+                for offset, item in enumerate(flat):
+                    values[start + offset] = item
+            self._store(flat, assign)
+
+    def __delitem__(self, key):
+        start = self._layout.index[key] * self.width
+        del self._values[start:start + self.width]
+        self._layout = self._layout.without_key(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout.keys)
+
+    def __len__(self) -> int:
+        return len(self._layout.keys)
+
+    def __contains__(self, key) -> bool:
+        return key in self._layout.index
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def copy(self):
+        clone = self.__class__.__new__(self.__class__)
+        clone._layout = self._layout
+        clone._values = self._values[:]
+        return clone
+
+
+class IntBlock(_Block):
+    """A str -> int mapping backed by an array (stats, skills)."""
+
+    __slots__ = ()
+
+
+class StringBlock(_Block):
+    """A str -> str mapping sharing its key layout with similar characters."""
+
+    __slots__ = ()
+
+    numeric = False
+
+
+class CountBlock(_Block):
+    """A str -> (current, maximum) mapping stored as one flat array of pairs."""
+
+    __slots__ = ()
+
+    width = 2
+
+    def _flatten(self, value) -> List[Any]:
+        return [value[0], value[1]]
+
+    def _unflatten(self, i: int):
+        return (self._values[i], self._values[i + 1])
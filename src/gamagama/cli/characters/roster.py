@@ -0,0 +1,243 @@
+import codecs
+import json
+import os
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .base import Character
+from .store import LoadResult
+
+INDEX_FORMAT = 1
+
+# Bytes read at a time while scanning a JSON array roster.
+CHUNK_SIZE = 1 << 16
+
+
+class RosterStore:
+    """Loads characters from one large roster file without parsing all of it.
+
+    The roster is either JSON Lines (one character object per line, '.jsonl')
+    or a JSON array of character objects. The file is scanned once, keeping
+    only a name -> (byte offset, length) index. Loading a character then reads
+    and parses just its own bytes. The index is saved next to the roster (as
+    '.<file>.idx') and reused until the roster's mtime or size changes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.duplicates: List[str] = []
+        self._index: Optional[Dict[str, Tuple[int, int]]] = None
+        self._signature: Optional[Tuple[int, int]] = None
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_name(f".{self.path.name}.idx")
+
+    def index(self) -> Dict[str, Tuple[int, int]]:
+        """Return the name -> (offset, length) index, rescanning the roster if it changed."""
+        st = os.stat(self.path)
+        signature = (st.st_mtime_ns, st.st_size)
+        if self._index is None or self._signature != signature:
+            self._index = self._read_index(signature)
+            if self._index is None:
+                self._index = self._scan()
+                self._write_index(signature)
+            self._signature = signature
+        return self._index
+
+    def load(self, name: str) -> Optional[Character]:
+        """Load a character by name.
+
+        Returns None and prints an error if the roster is missing or malformed,
+        or has no such character.
+        """
+        try:
+            span = self.index().get(name)
+        except OSError:
+            print(f"Roster file not found: {self.path}")
+            return None
+        except ValueError as e:
+            print(f"Error reading {self.path}: {e}")
+            return None
+        if span is None:
+            print(f"Character not found in {self.path}: {name}")
+            return None
+
+        try:
+            with open(self.path, "rb") as f:
+                return Character.from_dict(_read_span(f, span))
+        except OSError as e:
+            print(f"Error reading {self.path}: {e}")
+        except (ValueError, KeyError, TypeError, IndexError, AttributeError) as e:
+            print(f"Invalid character data for {name} in {self.path} ({type(e).__name__}: {e})")
+        return None
+
+    def find(self, pattern: str = "*") -> List[str]:
+        """Return the sorted names matching a glob pattern."""
+        try:
+            names = self.index()
+        except OSError:
+            return []
+        except ValueError as e:
+            print(f"Error reading {self.path}: {e}")
+            return []
+        return sorted(name for name in names if fnmatchcase(name, pattern))
+
+    def available(self, search: Optional[str] = None) -> List[str]:
+        """Return the sorted names in the roster, optionally filtered by name (case-insensitively)."""
+        names = self.find()
+        if search:
+            search = search.lower()
+            names = [name for name in names if search in name.lower()]
+        return names
+
+    def load_many(self, names: List[str], max_workers: Optional[int] = None) -> List[LoadResult]:
+        """Load several characters in one pass over the file, in offset order.
+
+        'max_workers' is accepted for compatibility with CharacterStore.
+        """
+        try:
+            index = self.index()
+        except (OSError, ValueError) as e:
+            return [LoadResult(name=name, error=str(e)) for name in names]
+
+        results = {name: LoadResult(name=name, error="not found") for name in names if name not in index}
+        wanted = sorted((index[name], name) for name in set(names) if name in index)
+        with open(self.path, "rb") as f:
+            for span, name in wanted:
+                try:
+                    results[name] = LoadResult(name=name, character=Character.from_dict(_read_span(f, span)))
+                except (ValueError, KeyError, TypeError, IndexError, AttributeError) as e:
+                    results[name] = LoadResult(name=name, error=f"invalid character data ({type(e).__name__}: {e})")
+        return [results[name] for name in names]
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        index: Dict[str, Tuple[int, int]] = {}
+        self.duplicates = []
+        with open(self.path, "rb") as f:
+            for name, span in _scan_records(f):
+                if name in index:
+                    self.duplicates.append(name)
+                else:
+                    index[name] = span
+        return index
+
+    def _read_index(self, signature: Tuple[int, int]) -> Optional[Dict[str, Tuple[int, int]]]:
+        try:
+            with open(self.index_path, "r") as f:
+                data = json.load(f)
+            if data.get("format") != INDEX_FORMAT or data.get("signature") != list(signature):
+                return None
+            return {name: (span[0], span[1]) for name, span in data["entries"].items()}
+        except (OSError, ValueError, KeyError, TypeError, IndexError, AttributeError):
+            return None
+
+    def _write_index(self, signature: Tuple[int, int]):
+        data = {"format": INDEX_FORMAT, "signature": list(signature), "entries": self._index}
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass
+
+
+def _read_span(f, span: Tuple[int, int]) -> dict:
+    f.seek(span[0])
+    return json.loads(f.read(span[1]))
+
+
+def _scan_records(f) -> Iterator[Tuple[str, Tuple[int, int]]]:
+    """Yield (name, (offset, length)) for each character object in a roster file."""
+    first = f.read(CHUNK_SIZE)
+    f.seek(0)
+    if first.lstrip()[:1] == b"[":
+        yield from _scan_array(f)
+    else:
+        yield from _scan_lines(f)
+
+
+def _scan_lines(f) -> Iterator[Tuple[str, Tuple[int, int]]]:
+    """JSON Lines: each non-blank line is one object. Only one is parsed at a time."""
+    offset = 0
+    for line_number, line in enumerate(f, start=1):
+        if line.strip():
+            try:
+                name = json.loads(line)["name"]
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"Invalid roster record on line {line_number}: {e}") from e
+            yield name, (offset, len(line))
+        offset += len(line)
+
+
+def _scan_array(f) -> Iterator[Tuple[str, Tuple[int, int]]]:
+    """
+    A JSON array of objects, decoded one element at a time from a sliding
+    window of the file. Byte offsets are tracked alongside the decoded text.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    pos = 0  # Position in buffer of the next unread character
+    offset = 0  # Byte offset in the file of buffer[pos]
+    eof = False
+
+    def fill() -> bool:
+        """Append the next chunk to the buffer, dropping what was consumed."""
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        chunk = f.read(CHUNK_SIZE)
+        eof = not chunk
+        buffer = buffer[pos:] + text_decoder.decode(chunk, final=eof)
+        pos = 0
+        return True
+
+    def next_char() -> str:
+        """Skip JSON whitespace and return the next character ('' at end of file)."""
+        nonlocal pos, offset
+        while True:
+            while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+                pos += 1
+                offset += 1
+            if pos < len(buffer) or not fill():
+                return buffer[pos:pos + 1]
+
+    if next_char() != "[":
+        raise ValueError("Invalid roster: expected a JSON array.")
+    pos += 1
+    offset += 1
+
+    if next_char() == "]":
+        return
+
+    while True:
+        if not next_char():
+            raise ValueError("Invalid roster: unexpected end of file.")
+        while True:
+            try:
+                obj, end = decoder.raw_decode(buffer, pos)
+                break
+            except json.JSONDecodeError:
+                if not fill():
+                    raise ValueError(f"Invalid roster: bad JSON at byte {offset}.")
+
+        length = len(buffer[pos:end].encode("utf-8"))
+        if not isinstance(obj, dict) or "name" not in obj:
+            raise ValueError(f"Invalid roster: element at byte {offset} is not a character.")
+        yield obj["name"], (offset, length)
+        pos = end
+        offset += length
+
+        separator = next_char()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Invalid roster: expected ',' or ']' at byte {offset}.")
+        pos += 1
+        offset += 1
+
+
+_JSON_WHITESPACE = " \t\n\r"
@@ -0,0 +1,165 @@
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from .base import Character
+from .store import LoadResult
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS characters (
+    name TEXT PRIMARY KEY,
+    character_name TEXT NOT NULL,
+    system TEXT NOT NULL,
+    search TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS characters_system ON characters (system);
+"""
+
+# SQLite's default limit on the number of '?' parameters in one statement.
+_MAX_PARAMETERS = 999
+
+
+class SQLiteCharacterStore:
+    """Loads characters from a single SQLite database.
+
+    Characters are stored as their JSON data, keyed by the same name a JSON
+    store would use (the file name without '.json'), with indexes on name and
+    system. Populate it with import_directory().
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        if path is None:
+            path = Path.home() / ".config" / "gg-cli" / "characters.db"
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The database connection, opened (and the schema created) on first use."""
+        if self._connection is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.path))
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def load(self, name: str) -> Optional[Character]:
+        """Load a character by name.
+
+        Returns None and prints an error if there is no such character.
+        """
+        row = self.connection.execute(
+            "SELECT data FROM characters WHERE name = ?", (name,)
+        ).fetchone()
+        if row is None:
+            print(f"Character not found in {self.path}: {name}")
+            return None
+        return Character.from_dict(json.loads(row[0]))
+
+    def find(self, pattern: str = "*") -> List[str]:
+        """Return the sorted names matching a glob pattern."""
+        rows = self.connection.execute(
+            "SELECT name FROM characters WHERE name GLOB ? ORDER BY name", (pattern,)
+        )
+        return [name for (name,) in rows]
+
+    def find_by_system(self, system: str) -> List[str]:
+        """Return the sorted names of the characters for a game system."""
+        rows = self.connection.execute(
+            "SELECT name FROM characters WHERE system = ? ORDER BY name", (system,)
+        )
+        return [name for (name,) in rows]
+
+    def available(self, search: Optional[str] = None) -> List[str]:
+        """Return the sorted names of all characters, optionally filtered by text.
+
+        The search matches names and string fields, case-insensitively.
+        """
+        if not search:
+            return self.find()
+        rows = self.connection.execute(
+            "SELECT name FROM characters WHERE instr(search, ?) > 0 ORDER BY name",
+            (search.lower(),),
+        )
+        return [name for (name,) in rows]
+
+    def load_many(self, names: List[str], max_workers: Optional[int] = None) -> List[LoadResult]:
+        """Load several characters with a few batched queries.
+
+        'max_workers' is accepted for compatibility with CharacterStore; a
+        single connection reads the rows.
+        """
+        rows = {}
+        for start in range(0, len(names), _MAX_PARAMETERS):
+            chunk = names[start:start + _MAX_PARAMETERS]
+            placeholders = ", ".join("?" * len(chunk))
+            rows.update(self.connection.execute(
+                f"SELECT name, data FROM characters WHERE name IN ({placeholders})", chunk
+            ))
+
+        results = []
+        for name in names:
+            if name not in rows:
+                results.append(LoadResult(name=name, error="not found"))
+                continue
+            try:
+                results.append(LoadResult(name=name, character=Character.from_dict(json.loads(rows[name]))))
+            except (ValueError, KeyError, TypeError, IndexError, AttributeError) as e:
+                results.append(LoadResult(name=name, error=f"invalid character data ({type(e).__name__}: {e})"))
+        return results
+
+    def save(self, name: str, data: dict):
+        """Insert or replace one character from its JSON data."""
+        with self.connection:
+            self.connection.execute(_UPSERT, _row(name, data))
+
+    def import_directory(self, directory: Path) -> int:
+        """Import every '*.json' character file in a directory in one transaction.
+
+        Existing characters with the same names are replaced. If any file is
+        unreadable or invalid, a ValueError naming it is raised and nothing is
+        imported. Returns the number of characters imported.
+        """
+        rows = []
+        for file_name in sorted(os.listdir(directory)):
+            if not file_name.endswith(".json") or file_name.startswith("."):
+                continue
+            file_path = Path(directory) / file_name
+            try:
+                with open(file_path, "r") as f:
+                    rows.append(_row(file_name[:-len(".json")], json.load(f)))
+            except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                raise ValueError(f"{file_path}: {e}") from e
+
+        with self.connection:
+            self.connection.executemany(_UPSERT, rows)
+        return len(rows)
+
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO characters (name, character_name, system, search, data) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+
+def _row(name: str, data: dict) -> tuple:
+    """Validate character data and build its table row."""
+    character = Character.from_dict(data)
+    return (
+        name,
+        character.name,
+        character.system,
+        _search_text([name, character.name, *character.strings.values()]),
+        json.dumps(data),
+    )
+
+
+def _search_text(values: Iterable) -> str:
+    return "\n".join(str(value).lower() for value in values)
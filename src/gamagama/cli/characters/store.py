@@ -1,29 +1,176 @@
 import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional, Protocol, Tuple, runtime_checkable
 
 from .base import Character
 
+if TYPE_CHECKING:
+    from .catalog import CharacterCatalog
+
+DEFAULT_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Counters for the CharacterStore cache, in the style of functools.lru_cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+@dataclass
+class LoadResult:
+    """The outcome of loading one character file in a batch."""
+
+    name: str
+    character: Optional[Character] = None
+    error: Optional[str] = None
+
+
+@runtime_checkable
+class Store(Protocol):
+    """Protocol for the places characters are loaded from (see STORE_BACKENDS)."""
+
+    def load(self, name: str) -> Optional[Character]:
+        """Return the named character, or None (printing an error) if there is none."""
+        ...
+
+    def find(self, pattern: str = "*") -> List[str]:
+        """Return the sorted names matching a glob pattern."""
+        ...
+
+    def load_many(self, names: List[str], max_workers: Optional[int] = None) -> List[LoadResult]:
+        """Return one LoadResult per name, in order, reporting failures per name."""
+        ...
+
+    def available(self, search: Optional[str] = None) -> List[str]:
+        """Return the sorted names of all stored characters, optionally filtered by text."""
+        ...
+
 
 class CharacterStore:
-    """Loads character JSON files from a directory on disk."""
+    """Loads character JSON files from a directory on disk.
 
-    def __init__(self, base_dir: Optional[Path] = None):
+    Parsed characters are kept in a bounded LRU cache keyed by file path. A
+    cached entry is reused only while the file's mtime and size are unchanged.
+    """
+
+    def __init__(self, base_dir: Optional[Path] = None, cache_size: int = DEFAULT_CACHE_SIZE):
         if base_dir is None:
             base_dir = Path.home() / ".config" / "gg-cli" / "characters"
         self.base_dir = base_dir
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[Path, Tuple[Tuple[int, int], Character]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._catalog: Optional["CharacterCatalog"] = None
+
+    @property
+    def catalog(self) -> "CharacterCatalog":
+        """The index of the character files in base_dir (see CharacterCatalog)."""
+        if self._catalog is None or self._catalog.base_dir != self.base_dir:
+            from .catalog import CharacterCatalog
+            self._catalog = CharacterCatalog(self.base_dir)
+        return self._catalog
 
     def load(self, name: str) -> Optional[Character]:
         """Load a character by name from a JSON file.
 
-        Returns None and prints an error if the file is not found.
+        Returns None and prints an error if the file is not found. Each call
+        returns a fresh copy, so sessions never share a Character.
         """
         file_path = self.base_dir / f"{name}.json"
-        if not file_path.exists():
+        try:
+            return self._load_file(file_path)
+        except FileNotFoundError:
             print(f"Character file not found: {file_path}")
             return None
 
+    def find(self, pattern: str = "*") -> List[str]:
+        """Return the sorted names of the character files matching a glob pattern."""
+        try:
+            entries = os.listdir(self.base_dir)
+        except OSError:
+            return []
+
+        names = [entry[:-len(".json")] for entry in entries if entry.endswith(".json")]
+        return sorted(name for name in names if fnmatchcase(name, pattern))
+
+    def available(self, search: Optional[str] = None) -> List[str]:
+        """Return the names of the character files, from the catalog."""
+        entries = self.catalog.search(search) if search else self.catalog.entries()
+        return [entry.name for entry in entries]
+
+    def load_many(self, names: List[str], max_workers: Optional[int] = None) -> List[LoadResult]:
+        """Load several characters concurrently.
+
+        Returns one LoadResult per name, in order. A file that is missing or
+        malformed is reported in its result's 'error' instead of aborting the batch.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self._try_load, names))
+
+    def _try_load(self, name: str) -> LoadResult:
+        file_path = self.base_dir / f"{name}.json"
+        try:
+            return LoadResult(name=name, character=self._load_file(file_path))
+        except FileNotFoundError:
+            return LoadResult(name=name, error="file not found")
+        except (OSError, ValueError) as e:
+            return LoadResult(name=name, error=str(e))
+        except (KeyError, TypeError, IndexError, AttributeError) as e:
+            return LoadResult(name=name, error=f"invalid character data ({type(e).__name__}: {e})")
+
+    def _load_file(self, file_path: Path) -> Character:
+        """Return a copy of the character in file_path, parsing it only if the cache is stale."""
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
+            with self._lock:
+                self._cache.pop(file_path, None)
+            raise
+
+        signature = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._cache.get(file_path)
+            if cached is not None and cached[0] == signature:
+                self.hits += 1
+                self._cache.move_to_end(file_path)
+                return cached[1].copy()
+            self.misses += 1
+
         with open(file_path, "r") as f:
             data = json.load(f)
+        character = Character.from_dict(data)
+
+        if self.cache_size > 0:
+            with self._lock:
+                self._cache[file_path] = (signature, character)
+                self._cache.move_to_end(file_path)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return character.copy()
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.cache_size,
+            currsize=len(self._cache),
+        )
 
-        return Character.from_dict(data)
+    def cache_clear(self):
+        """Empty the cache and reset its counters."""
+        with self._lock:
+            self._cache.clear()
+        self.hits = 0
+        self.misses = 0
@@ -3,19 +3,43 @@ import inspect
 import pkgutil
 
 from .base import CommandBase
+from . import manifest
 from gamagama.cli.core.registry import CommandSpec
 from gamagama.cli.core.domain import DomainBranch
 
 
-def discover_commands(tree):
-    """Discovers and registers all commands and domains in this package into the tree."""
+def discover_commands(tree, manifest_path=None):
+    """
+    Discovers and registers all commands and domains in this package into the tree.
+
+    If 'manifest_path' is given, a manifest of the discovered commands is kept
+    there. While it matches the installed package (version and the mtimes of
+    every gamagama.cli module, since commands read defaults such as the
+    explode depth from other packages), the tree is built from it without importing any command module until that
+    command's handler runs.
+    """
+    if manifest_path is not None:
+        key = manifest.manifest_key(_cli_package_paths())
+        entries = manifest.load_manifest(manifest_path, key)
+        if entries is not None:
+            manifest.build_from_manifest(tree, entries)
+            return
+
     # Track registered domains to avoid duplicates
     registered_domains = set()
+    entries = []
 
     for _, name, is_pkg in pkgutil.iter_modules(__path__, f"{__name__}."):
         module = importlib.import_module(name)
 
-        for _, member in inspect.getmembers(module):
+        # Register a module's domains before its commands, so that a command
+        # placed under a domain (e.g. 'player import') finds the domain in the tree.
+        members = sorted(
+            inspect.getmembers(module),
+            key=lambda m: not (inspect.isclass(m[1]) and issubclass(m[1], DomainBranch)),
+        )
+
+        for _, member in members:
             # Handle DomainBranch classes
             if (
                 inspect.isclass(member)
@@ -27,10 +51,13 @@ def discover_commands(tree):
                     domain_instance = member()
                     tree.insert([domain_name], domain_instance)
                     registered_domains.add(domain_name)
+                    entries.append(manifest.domain_entry(member, [domain_name]))
 
                     # Check for nested domains in submodules
                     if is_pkg:
-                        _discover_nested_domains(name, domain_instance, tree, registered_domains)
+                        _discover_nested_domains(
+                            name, domain_instance, tree, registered_domains, entries
+                        )
 
             # Handle CommandBase classes (traditional commands)
             elif (
@@ -56,9 +83,13 @@ def discover_commands(tree):
                 # Register using the command's defined path
                 full_path = command_instance.path + [command_instance.name]
                 tree.register_command(full_path, spec)
+                entries.append(manifest.command_entry(member, full_path, spec))
 
+    if manifest_path is not None:
+        manifest.write_manifest(manifest_path, key, entries)
 
-def _discover_nested_domains(parent_module_name, parent_domain, tree, registered_domains):
+
+def _discover_nested_domains(parent_module_name, parent_domain, tree, registered_domains, entries):
     """Discover nested domains in submodules and attach them to the parent."""
     parent_module = importlib.import_module(parent_module_name)
 
@@ -77,5 +108,13 @@ def _discover_nested_domains(parent_module_name, parent_domain, tree, registered
                 domain_name = getattr(member, "name", None)
                 if domain_name and domain_name not in registered_domains:
                     domain_instance = member()
-                    parent_domain.add_child(domain_instance)
+                    tree.attach(parent_domain, domain_instance)
                     registered_domains.add(domain_name)
+                    entries.append(
+                        manifest.domain_entry(member, [parent_domain.name, domain_name])
+                    )
+
+
+def _cli_package_paths():
+    """The paths of the gamagama.cli package, which the manifest key covers."""
+    return importlib.import_module("gamagama.cli").__path__
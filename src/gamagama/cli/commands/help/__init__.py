@@ -1,6 +1,11 @@
+import sys
+
 from ..base import CommandBase
-from gamagama.cli.core.tree import NodeVisitor, MapBranch, Branch
-from gamagama.cli.core.registry import CommandSpec
+from gamagama.cli.core.tree import NodeVisitor, MapBranch
+from gamagama.cli.core.registry import CommandSpec, FAILED
+
+# Commands per page for 'help --all --page N'
+DEFAULT_PAGE_SIZE = 20
 
 
 class HelpDescriptionVisitor(NodeVisitor):
@@ -14,7 +19,11 @@ class HelpDescriptionVisitor(NodeVisitor):
 
 
 class HelpPrinterVisitor(NodeVisitor):
-    """Visitor to print the full help output for a node."""
+    """
+    Visitor to render the full help output for a node, as a list of lines.
+    Visiting renders the static part, which depends only on the tree, so it
+    can be cached; dynamic_lines() renders the session-dependent part.
+    """
 
     def __init__(self, path, session=None):
         self.path = path
@@ -22,45 +31,55 @@ class HelpPrinterVisitor(NodeVisitor):
         self.session = session
 
     def visit_CommandSpec(self, node):
-        print(f"Help for '{self.path_str}':")
+        lines = [f"Help for '{self.path_str}':"]
         text = node.description if node.description else node.help
-        for line in text.strip().splitlines():
-            print(f"  {line}")
-        
-        if node.dynamic_help and self.session:
-            extra_help = node.dynamic_help(self.session)
-            if extra_help:
-                print()
-                for line in extra_help.strip().splitlines():
-                    print(f"  {line}")
+        lines.extend(f"  {line}" for line in text.strip().splitlines())
+        return lines
+
+    def dynamic_lines(self, node):
+        """Returns the dynamic help for a command, rendered for the session."""
+        if not isinstance(node, CommandSpec) or not node.dynamic_help or not self.session:
+            return []
+        extra_help = node.dynamic_help(self.session)
+        if not extra_help:
+            return []
+        return [""] + [f"  {line}" for line in extra_help.strip().splitlines()]
 
     def visit_MapBranch(self, node):
         header = f"Available commands in '{node.name}':" if node.name != "root" else "Available commands:"
-        print(header)
-        self._print_tree(node, indent=2)
-
-    def _print_tree(self, branch, indent):
-        children = list(branch)
-        if not children:
-            return
+        return [header] + self._tree_lines(node, indent=2)
 
-        # Calculate padding for this specific level
-        max_len = max(len(c.name) for c in children)
+    def _tree_lines(self, branch, indent):
+        lines = []
         desc_visitor = HelpDescriptionVisitor()
-
-        for child in sorted(children, key=lambda x: x.name):
+        # Each entry is (children still to render at one level, indent, padding).
+        # A branch's children are rendered right after it, before its next sibling.
+        stack = [self._level(branch, indent)]
+        while stack:
+            children, level_indent, width = stack[-1]
+            if not children:
+                stack.pop()
+                continue
+            child = children.pop()
             description = desc_visitor.visit(child)
-            prefix = " " * indent
-            
-            # Print the current node (Command or Branch)
-            print(f"{prefix}{child.name:<{max_len + 2}}{description}")
 
-            # If it's a branch, recurse immediately to show its children
+            # Render the current node (Command or Branch)
+            lines.append(f"{' ' * level_indent}{child.name:<{width}}{description}")
+
+            # If it's a branch, show its children before moving on
             if isinstance(child, MapBranch):
-                self._print_tree(child, indent + 2)
+                stack.append(self._level(child, level_indent + 2))
+        return lines
+
+    def _level(self, branch, indent):
+        """Returns one stack entry for _tree_lines: the sorted children reversed for pop()."""
+        children = sorted(branch, key=lambda x: x.name)[::-1]
+        # Padding is calculated for this specific level
+        width = max((len(c.name) for c in children), default=0) + 2
+        return children, indent, width
 
     def generic_visit(self, node):
-        print(f"Node '{self.path_str}' is not a command or group.")
+        return [f"Node '{self.path_str}' is not a command or group."]
 
 
 class HelpCommand(CommandBase):
@@ -71,64 +90,104 @@ class HelpCommand(CommandBase):
 
     def __init__(self):
         self.tree = None  # Injected by loader
+        # Static help lines and command lists by node, valid for one tree version
+        self._rendered = {}
+        self._commands = {}
+        self._cache_version = None
 
     def setup(self, spec):
         spec.add_argument(
             "command_name", nargs="*", help="The command path to get help for."
         )
+        spec.add_argument(
+            "--all", action="store_true",
+            help="Show the full help of every command (under the given path, if any)."
+        )
+        spec.add_argument(
+            "--page", type=int,
+            help="With --all, show only this page of commands (starting at 1)."
+        )
+        spec.add_argument(
+            "--page-size", type=int, default=DEFAULT_PAGE_SIZE,
+            help=f"Commands per page for --page (default: {DEFAULT_PAGE_SIZE})."
+        )
 
     def handle(self, args):
         """Prints help for a specific command or a list of all commands."""
         session = getattr(args, "_session", None)
         start_node = session.current_node if session else self.tree.root
-        
+
         path = args.command_name if args.command_name else []
 
-        if not path:
-            target_node = start_node
-        else:
-            target_node = self._resolve_target(start_node, path)
+        target_node = self.tree.resolve(start_node, path)
 
         if not target_node:
             print(f"Unknown command: '{' '.join(path)}'")
+            return FAILED
+
+        if getattr(args, "all", False):
+            return self._print_all(target_node, session, getattr(args, "page", None),
+                                   getattr(args, "page_size", DEFAULT_PAGE_SIZE))
+
+        for line in self._render(target_node, session):
+            print(line)
+
+    def _render(self, node, session):
+        """Returns the help lines for a node: cached static lines plus fresh dynamic help."""
+        self._check_cache()
+        visitor = HelpPrinterVisitor(self._get_node_path(node), session)
+        lines = self._rendered.get(node)
+        if lines is None:
+            lines = self._rendered[node] = visitor.visit(node)
+        return lines + visitor.dynamic_lines(node)
+
+    def _print_all(self, node, session, page, page_size):
+        """Prints every command under node, one at a time, optionally one page only."""
+        commands = self._commands_under(node)
+        if not commands:
+            print("No commands.")
             return
-
-        display_path = self._get_node_path(target_node)
-        visitor = HelpPrinterVisitor(display_path, session)
-        visitor.visit(target_node)
-
-    def _resolve_target(self, start_node, path_parts):
-        first = path_parts[0]
-        rest = path_parts[1:]
-        
-        # 1. Bubbling lookup for the first component
-        curr = start_node
-        found_node = None
-        
-        while curr:
-            if isinstance(curr, Branch):
-                child = curr.get_child(first)
-                if child:
-                    found_node = child
-                    break
-            curr = curr.parent
-            
-        if not found_node:
-            return None
-            
-        # 2. Strict lookup for the rest
-        current = found_node
-        for part in rest:
-            if isinstance(current, Branch):
-                child = current.get_child(part)
-                if child:
-                    current = child
-                else:
-                    return None
-            else:
-                return None
-                
-        return current
+        if page is not None:
+            if page < 1 or page_size < 1:
+                print("Error: --page and --page-size must be at least 1.")
+                return FAILED
+            pages = max(1, -(-len(commands) // page_size))
+            if page > pages:
+                print(f"Error: There are only {pages} pages.")
+                return FAILED
+            commands = commands[(page - 1) * page_size:page * page_size]
+
+        for i, command in enumerate(commands):
+            if i:
+                print()
+            for line in self._render(command, session):
+                print(line)
+            # Let a reader on a pipe see each command as it is rendered
+            sys.stdout.flush()
+
+        if page is not None:
+            print()
+            print(f"Page {page} of {pages}.")
+
+    def _commands_under(self, node):
+        """Returns the commands at or below node, sorted by path; cached like _render."""
+        self._check_cache()
+        commands = self._commands.get(node)
+        if commands is None:
+            found = self.tree.preorder() if node is self.tree.root else self.tree.walk(node)
+            commands = sorted(
+                (n for n in found if isinstance(n, CommandSpec)),
+                key=self._get_node_path,
+            )
+            self._commands[node] = commands
+        return commands
+
+    def _check_cache(self):
+        """Drops cached help if the tree has changed since it was rendered."""
+        if self._cache_version != self.tree.version:
+            self._rendered.clear()
+            self._commands.clear()
+            self._cache_version = self.tree.version
 
     def _get_node_path(self, node):
         path = []
@@ -0,0 +1,196 @@
+import importlib
+import json
+import os
+from importlib.metadata import version, PackageNotFoundError
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from gamagama.cli.core.registry import CommandSpec
+
+MANIFEST_FORMAT = 1
+
+# Argument 'type' callables that can be stored in the manifest by name.
+_ARGUMENT_TYPES = {"int": int, "float": float, "str": str}
+
+
+def default_manifest_path() -> Path:
+    """Returns the default location of the command manifest."""
+    return Path.home() / ".cache" / "gg-cli" / "commands.json"
+
+
+def manifest_key(package_paths: Iterable[str]) -> Dict[str, Any]:
+    """
+    Builds the key a manifest must match to be reused: the manifest format,
+    the installed package version and the mtime of every module under the
+    given package paths.
+    """
+    modules = {}
+    for package_path in package_paths:
+        for dirpath, dirnames, filenames in os.walk(package_path):
+            dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+            for filename in sorted(filenames):
+                if filename.endswith(".py"):
+                    file_path = os.path.join(dirpath, filename)
+                    rel_path = os.path.relpath(file_path, package_path)
+                    modules[rel_path] = os.stat(file_path).st_mtime_ns
+
+    try:
+        package_version = version("gamagama-cli")
+    except PackageNotFoundError:
+        package_version = "unknown"
+
+    return {"format": MANIFEST_FORMAT, "version": package_version, "modules": modules}
+
+
+def load_manifest(path: Path, key: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """Returns the manifest entries at 'path', or None if missing, unreadable or stale."""
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get("key") != key:
+        return None
+    return data.get("entries")
+
+
+def write_manifest(path: Path, key: Dict[str, Any], entries: List[Dict[str, Any]]) -> bool:
+    """
+    Writes the manifest atomically. Returns False (leaving any old manifest in
+    place) if an entry cannot be serialized or the file cannot be written.
+    """
+    try:
+        text = json.dumps({"key": key, "entries": entries})
+    except (TypeError, ValueError):
+        return False
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except OSError:
+        return False
+    return True
+
+
+def domain_entry(domain_class, path: List[str]) -> Dict[str, Any]:
+    """Describes a discovered DomainBranch class registered at 'path'."""
+    return {
+        "kind": "domain",
+        "path": list(path),
+        "module": domain_class.__module__,
+        "class": domain_class.__qualname__,
+    }
+
+
+def command_entry(command_class, path: List[str], spec: CommandSpec) -> Dict[str, Any]:
+    """Describes a discovered CommandBase class and the spec it configured."""
+    return {
+        "kind": "command",
+        "path": list(path),
+        "module": command_class.__module__,
+        "class": command_class.__qualname__,
+        "help": spec.help,
+        "description": spec.description,
+        "arguments": [_encode_argument(arg) for arg in spec.arguments],
+        "dynamic_help": spec.dynamic_help is not None,
+    }
+
+
+def build_from_manifest(tree, entries: List[Dict[str, Any]]):
+    """
+    Registers manifest entries into the tree. Domains are instantiated right
+    away since they form the tree's structure; command modules are imported
+    only when their handler (or dynamic help) is first used.
+    """
+    for entry in entries:
+        path = entry["path"]
+
+        if entry["kind"] == "domain":
+            domain_instance = _import_class(entry["module"], entry["class"])()
+            if len(path) == 1:
+                tree.insert(path, domain_instance)
+            else:
+                tree.attach(tree.get(path[:-1]), domain_instance)
+            continue
+
+        command = LazyCommand(entry["module"], entry["class"], tree)
+        spec = CommandSpec(
+            name=path[-1],
+            handler=command.handle,
+            help=entry["help"],
+            description=entry["description"],
+            arguments=[_decode_argument(arg) for arg in entry["arguments"]],
+        )
+        if entry["dynamic_help"]:
+            spec.dynamic_help = command.dynamic_help
+        tree.register_command(path, spec)
+
+
+class LazyCommand:
+    """Stands in for a command instance, importing its module on first use."""
+
+    def __init__(self, module_name: str, class_name: str, tree):
+        self.module_name = module_name
+        self.class_name = class_name
+        self.tree = tree
+        self._instance = None
+        self._spec = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._instance is not None
+
+    def load(self):
+        """Imports and sets up the command exactly as eager discovery would."""
+        if self._instance is None:
+            command_instance = _import_class(self.module_name, self.class_name)()
+            if hasattr(command_instance, "tree"):
+                command_instance.tree = self.tree
+
+            spec = CommandSpec(
+                name=command_instance.name,
+                handler=command_instance.handle,
+                help=command_instance.help,
+                description=command_instance.description or command_instance.help
+            )
+            command_instance.setup(spec)
+            self._instance, self._spec = command_instance, spec
+        return self._instance
+
+    def handle(self, args):
+        return self.load().handle(args)
+
+    def dynamic_help(self, session):
+        self.load()
+        if self._spec.dynamic_help:
+            return self._spec.dynamic_help(session)
+        return ""
+
+
+def _import_class(module_name: str, qualname: str):
+    obj = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _encode_argument(arg: Dict[str, Any]) -> Dict[str, Any]:
+    kwargs = dict(arg["kwargs"])
+    arg_type = kwargs.get("type")
+    if arg_type is not None:
+        for type_name, type_value in _ARGUMENT_TYPES.items():
+            if arg_type is type_value:
+                kwargs["type"] = type_name
+                break
+    return {"args": list(arg["args"]), "kwargs": kwargs}
+
+
+def _decode_argument(arg: Dict[str, Any]) -> Dict[str, Any]:
+    kwargs = dict(arg["kwargs"])
+    if "type" in kwargs:
+        kwargs["type"] = _ARGUMENT_TYPES[kwargs["type"]]
+    return {"args": tuple(arg["args"]), "kwargs": kwargs}
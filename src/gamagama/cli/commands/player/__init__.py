@@ -1,7 +1,11 @@
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Dict, List, Optional, Set
 
+from gamagama.cli.characters import CharacterStore
 from gamagama.cli.core.domain import DomainBranch
+from gamagama.cli.core.registry import FAILED
+from ..base import CommandBase
 
 
 @dataclass(eq=False)
@@ -31,10 +35,10 @@ class PlayerDomain(DomainBranch):
     def show_item(self, session, name: Optional[str]) -> Optional[str]:
         """Return player details as a string."""
         target = name if name else session.active_player
-        if not target or target not in session.players:
+        char = session.players.get(target) if target else None
+        if char is None:
             return None
 
-        char = session.players[target]
         lines = [
             f"Name: {char.name}",
             f"System: {char.system}",
@@ -70,6 +74,18 @@ class PlayerDomain(DomainBranch):
         """No nested domains."""
         return {}
 
+    def list_available(self, session, search: Optional[str] = None) -> Optional[List[str]]:
+        """Return the names of the characters in the session's store."""
+        return session.store.available(search)
+
+    def complete_item(self, session, verb: str, text: str) -> List[str]:
+        """Complete character files for 'load' and loaded players for other verbs."""
+        if verb == "load":
+            names = [n for n in session.store.available() if n not in session.players]
+        else:
+            names = sorted(session.players)
+        return [n for n in names if n.startswith(text)]
+
     def load_item(self, session, name: str) -> bool:
         """Load a player from disk."""
         if name in session.players:
@@ -83,6 +99,24 @@ class PlayerDomain(DomainBranch):
             return True
         return False
 
+    def load_matching(self, session, pattern: str) -> bool:
+        """Load every player whose file name matches a glob pattern, in parallel."""
+        names = [n for n in session.store.find(pattern) if n not in session.players]
+        if not names:
+            print(f"No unloaded characters match '{pattern}'.")
+            return False
+
+        results = session.store.load_many(names)
+        failed = [r for r in results if r.error is not None]
+        for result in results:
+            if result.character is not None:
+                session.players[result.name] = result.character
+
+        print(f"Loaded {len(results) - len(failed)} of {len(results)} characters.")
+        for result in failed:
+            print(f"  {result.name}: {result.error}")
+        return not failed
+
     def drop_item(self, session, name: Optional[str]) -> bool:
         """Drop a player from the session."""
         target = name if name else session.active_player
@@ -103,3 +137,32 @@ class PlayerDomain(DomainBranch):
             print("Active player cleared.")
 
         return True
+
+
+class ImportCommand(CommandBase):
+    """Import character JSON files into the configured store."""
+
+    name = "import"
+    help = "Import character JSON files into the character store."
+    path = ["player"]
+
+    def setup(self, spec):
+        spec.add_argument(
+            "directory", nargs="?",
+            help="Directory of character JSON files (default: the JSON characters directory)"
+        )
+
+    def handle(self, args):
+        session = args._session
+        store = session.store
+        if not hasattr(store, "import_directory"):
+            print("The current character store reads JSON files directly; there is nothing to import.")
+            return
+
+        directory = Path(args.directory).expanduser() if getattr(args, "directory", None) else CharacterStore().base_dir
+        try:
+            count = store.import_directory(directory)
+        except (OSError, ValueError) as e:
+            print(f"Import failed, nothing was imported: {e}")
+            return FAILED
+        print(f"Imported {count} characters from {directory}.")
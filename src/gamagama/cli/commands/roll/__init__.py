@@ -1,6 +1,17 @@
-import re
-
 from ..base import CommandBase
+from gamagama.cli.core.registry import FAILED
+from gamagama.cli.systems.dice import DiceEngine, DiceSpecError, compile_spec
+from gamagama.cli.systems.dice.bulk import roll_many, summarize
+from gamagama.cli.systems.dice.distribution import distribution
+from gamagama.cli.systems.dice.explode import DEFAULT_EXPLODE_DEPTH, ExplosionStats
+
+HISTOGRAM_WIDTH = 40
+HISTOGRAM_ROWS = 40
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+class _RollError(Exception):
+    """Raised by the roll helpers for a spec that cannot be rolled."""
 
 
 class RollCommand(CommandBase):
@@ -8,11 +19,13 @@ class RollCommand(CommandBase):
 
     name = "roll"
     help = "Rolls dice based on one or more specifications."
-    description = """
+    description = f"""
 Rolls dice based on one or more specifications.
 
 Syntax: [count]d[sides][!][modifier]
 
+Terms can be chained with + and -, e.g. 2d6+1d4+3.
+
 Examples:
   3d6      - Roll 3 six-sided dice
   d20      - Roll 1 twenty-sided die
@@ -20,6 +33,22 @@ Examples:
   1d20+5   - Roll 1d20 and add 5
   2d8-2    - Roll 2d8 and subtract 2
   d%       - Roll a percentile die (1-100)
+  2d6+1d4  - Roll 2d6 and 1d4 and add them together
+
+Bulk rolling:
+  --times N  - Roll each spec N times in one batch and print summary
+               statistics (NumPy is used if installed). Systems with their
+               own dice rules are rolled die by die instead.
+               Exploding specs also report chain-length statistics.
+  --raw      - With --times, print every total instead of the summary
+
+Probabilities:
+  --dist     - Print the exact distribution of each spec (mean, variance,
+               percentiles and a histogram) instead of rolling. Only
+               available for standard dice.
+
+With --times and --dist, exploding dice are rerolled at most
+--explode-depth times per die (default: {DEFAULT_EXPLODE_DEPTH}).
 """
 
     def setup(self, spec):
@@ -28,6 +57,27 @@ Examples:
             nargs="+",
             help="One or more dice specifications (e.g., '3d6', '1d20+5').",
         )
+        spec.add_argument(
+            "--times",
+            type=int,
+            help="Roll each specification this many times in one batch.",
+        )
+        spec.add_argument(
+            "--raw",
+            action="store_true",
+            help="With --times, print every total instead of summary statistics.",
+        )
+        spec.add_argument(
+            "--dist",
+            action="store_true",
+            help="Print the exact outcome distribution instead of rolling.",
+        )
+        spec.add_argument(
+            "--explode-depth",
+            type=int,
+            default=DEFAULT_EXPLODE_DEPTH,
+            help="Maximum rerolls per exploding die with --times and --dist.",
+        )
         
         def get_dice_help(session):
             if session and session.system:
@@ -40,36 +90,143 @@ Examples:
         """Handler for the 'roll' command."""
         session = getattr(args, "_session", None)
         system = session.system if session else None
+        times = getattr(args, "times", None)
+        raw = getattr(args, "raw", False)
+        dist = getattr(args, "dist", False)
+        max_depth = getattr(args, "explode_depth", DEFAULT_EXPLODE_DEPTH)
 
-        for spec in args.dice_spec:
-            print(self._roll_dice(spec, system))
-
-    def _roll_dice(self, spec, system):
-        """Parses a single dice spec (e.g., '3d6!+5') and returns the roll result."""
-        match = re.match(r"^(\d*)d(\d+|%)(!?)([+-]\d+)?$", spec, re.IGNORECASE)
-        if not match:
-            return f"{spec}: Invalid dice specification."
+        if times is not None and times < 1:
+            print("Error: --times must be at least 1.")
+            return FAILED
 
-        num_dice_str, sides_str, explode_str, modifier_str = match.groups()
+        if dist and times is not None:
+            print("Error: --dist and --times cannot be combined.")
+            return FAILED
 
-        num_dice = int(num_dice_str) if num_dice_str else 1
-        sides = 100 if sides_str == "%" else int(sides_str)
-        should_explode = bool(explode_str)
-        modifier = int(modifier_str) if modifier_str else 0
+        if max_depth < 0:
+            print("Error: --explode-depth cannot be negative.")
+            return FAILED
 
-        if sides == 0:
-            return f"{spec}: Cannot roll a 0-sided die."
+        failed = False
+        for spec in args.dice_spec:
+            try:
+                if dist:
+                    print(self._roll_dist(spec, max_depth, system))
+                elif times is None:
+                    print(self._roll_dice(spec, system))
+                else:
+                    print(self._roll_bulk(spec, system, times, raw, max_depth))
+            except _RollError as e:
+                # Keep rolling the remaining specs, but report the failure.
+                print(f"{spec}: {e}")
+                failed = True
+        if failed:
+            return FAILED
 
-        if sides == 1 and should_explode:
-            return f"{spec}: Cannot explode a 1-sided die (infinite loop)."
+    def _roll_dice(self, spec, system):
+        """Compiles a dice spec (e.g., '3d6!+5' or '2d6+1d4') and returns the roll result."""
+        try:
+            expression = compile_spec(spec)
+        except DiceSpecError as e:
+            raise _RollError(e) from e
 
         if not system:
-            return f"{spec}: Error - No game system loaded."
+            raise _RollError("Error - No game system loaded.")
 
-        rolls = []
-        for _ in range(num_dice):
-            rolls.append(system.dice.roll(sides, should_explode))
+        result = expression.evaluate(system.dice)
 
-        total = sum(rolls) + modifier
+        return f"{spec}: {result.total} {result.rolls}"
 
-        return f"{spec}: {total} {rolls}"
+    def _roll_bulk(self, spec, system, times, raw, max_depth=DEFAULT_EXPLODE_DEPTH):
+        """Rolls a dice spec 'times' times in one batch and returns the totals or a summary."""
+        try:
+            expression = compile_spec(spec)
+        except DiceSpecError as e:
+            raise _RollError(e) from e
+
+        if not system:
+            raise _RollError("Error - No game system loaded.")
+
+        engine = system.dice
+        stats = None
+        if _is_standard(engine):
+            stats = ExplosionStats() if expression.explodes else None
+            totals = roll_many(expression, times, max_depth=max_depth, stats=stats)
+        elif hasattr(engine, "roll_many"):
+            # The system's engine rolls batches itself, with its own rules.
+            totals = engine.roll_many(expression, times)
+        else:
+            # Custom dice rules: roll die by die through the system's engine.
+            totals = [expression.evaluate(engine).total for _ in range(times)]
+
+        if raw:
+            return "\n".join(map(str, totals))
+
+        summary = summarize(totals)
+        lines = [
+            f"{spec} x{summary.count}: mean {summary.mean:.2f}, "
+            f"stdev {summary.stdev:.2f}, min {summary.minimum}, max {summary.maximum}"
+        ]
+        if stats is not None:
+            lines.extend(self._format_explosions(stats, max_depth))
+        return "\n".join(lines)
+
+    def _format_explosions(self, stats, max_depth):
+        """Renders chain-length statistics for exploding dice."""
+        lines = [
+            f"  explosions: {stats.exploded} of {stats.dice} dice, "
+            f"mean chain {stats.mean_chain:.3f}, longest chain {stats.longest_chain}, "
+            f"{stats.capped} capped at depth {max_depth}"
+        ]
+        lengths = stats.chain_lengths()
+        if lengths:
+            counts = ", ".join(f"{length}: {count}" for length, count in lengths.items())
+            lines.append(f"  chain lengths: {counts}")
+        return lines
+
+    def _roll_dist(self, spec, max_depth=DEFAULT_EXPLODE_DEPTH, system=None):
+        """Computes the exact distribution of a dice spec and returns it as a report."""
+        try:
+            expression = compile_spec(spec)
+        except DiceSpecError as e:
+            raise _RollError(e) from e
+
+        if system and not _is_standard(system.dice):
+            raise _RollError(f"Error - --dist is only available for standard dice, not the {system.name} system's.")
+
+        dist = distribution(expression, max_depth)
+
+        percentiles = ", ".join(f"p{q} {dist.percentile(q / 100)}" for q in PERCENTILES)
+        lines = [
+            f"{spec}: mean {dist.mean:.2f}, variance {dist.variance:.2f}, stdev {dist.stdev:.2f}",
+            f"  percentiles: {percentiles}",
+        ]
+        lines.extend(self._format_histogram(dist))
+        return "\n".join(lines)
+
+    def _format_histogram(self, dist):
+        """Renders the distribution as ASCII bars, bucketing values when the range is wide."""
+        # Skip the (possibly very long) tails of exploding dice.
+        low = dist.percentile(0.0001)
+        high = dist.percentile(0.9999)
+        bucket = -(-(high - low + 1) // HISTOGRAM_ROWS)
+
+        rows = []
+        for start in range(low, high + 1, bucket):
+            end = min(start + bucket - 1, high)
+            p = sum(dist.probabilities[start - dist.offset:end - dist.offset + 1])
+            label = str(start) if start == end else f"{start}-{end}"
+            rows.append((label, p))
+
+        label_width = max(len(label) for label, _ in rows)
+        peak = max(p for _, p in rows)
+        lines = []
+        for label, p in rows:
+            bar = "#" * round(p / peak * HISTOGRAM_WIDTH) if peak else ""
+            lines.append(f"  {label:>{label_width}} {p * 100:6.2f}% {bar}".rstrip())
+        return lines
+
+
+def _is_standard(engine) -> bool:
+    """True if the engine rolls plain uniform dice, which the batched and exact paths model."""
+    return type(engine) is DiceEngine
@@ -0,0 +1,77 @@
+from gamagama.cli.core.registry import FAILED
+from gamagama.cli.core.snapshot import (
+    SnapshotError,
+    list_snapshots,
+    restore_snapshot,
+    save_snapshot,
+    snapshot_path,
+)
+from gamagama.cli.systems import SYSTEMS
+
+from ..base import CommandBase
+
+
+class SaveCommand(CommandBase):
+    """Save the session's players, actives, location and system to a snapshot."""
+
+    name = "save"
+    help = "Save the current session as a named snapshot."
+    path = ["session"]
+
+    def setup(self, spec):
+        spec.add_argument("snapshot", help="Name of the snapshot")
+
+    def handle(self, args):
+        session = args._session
+        try:
+            path = snapshot_path(args.snapshot)
+            save_snapshot(session, path)
+        except (OSError, SnapshotError) as e:
+            print(f"Error: Could not save session: {e}")
+            return FAILED
+        print(f"Saved session '{args.snapshot}' ({len(session.players)} players).")
+
+
+class RestoreCommand(CommandBase):
+    """Replace the session's state with a saved snapshot."""
+
+    name = "restore"
+    help = "Restore a session snapshot saved with 'session save'."
+    path = ["session"]
+
+    def setup(self, spec):
+        spec.add_argument("snapshot", help="Name of the snapshot")
+
+    def handle(self, args):
+        session = args._session
+        try:
+            path = snapshot_path(args.snapshot)
+            if not path.exists():
+                print(f"Error: No saved session named '{args.snapshot}'.")
+                return FAILED
+            warnings = restore_snapshot(session, path, SYSTEMS)
+        except (OSError, SnapshotError) as e:
+            print(f"Error: Could not restore session: {e}")
+            return FAILED
+        for warning in warnings:
+            print(f"Warning: {warning}")
+        print(f"Restored session '{args.snapshot}' ({len(session.players)} players).")
+
+
+class SnapshotsCommand(CommandBase):
+    """List the saved session snapshots."""
+
+    name = "snapshots"
+    help = "List saved session snapshots."
+    path = ["session"]
+
+    def setup(self, spec):
+        pass
+
+    def handle(self, args):
+        names = list_snapshots()
+        if not names:
+            print("No saved sessions.")
+            return
+        for name in names:
+            print(name)
@@ -1,22 +1,12 @@
 from ..base import CommandBase
 from gamagama.cli.core.domain import DomainBranch
+from gamagama.cli.core.registry import FAILED
 
 
 def _find_domain(session, domain_name):
-    """Find a domain branch by name, searching from root."""
-    from gamagama.cli.core.tree import Branch
-
-    def search(node):
-        if isinstance(node, DomainBranch) and node.name == domain_name:
-            return node
-        if isinstance(node, Branch):
-            for child in node:
-                result = search(child)
-                if result:
-                    return result
-        return None
-
-    return search(session.tree.root)
+    """Find a domain branch by name through the tree's name index."""
+    node = session.tree.find_indexed(domain_name)
+    return node if isinstance(node, DomainBranch) else None
 
 
 def _get_current_domain(session):
@@ -33,6 +23,11 @@ def _resolve_domain(session, domain_name=None):
     return _get_current_domain(session)
 
 
+def _is_pattern(name):
+    """True if name is a glob pattern rather than a single item name."""
+    return any(c in name for c in "*?[")
+
+
 def _collect_all_actives(session):
     """Collect all top-level domain actives from the tree for root-level show."""
     from gamagama.cli.core.tree import Branch
@@ -84,7 +79,7 @@ class ShowCommand(CommandBase):
                     domain = current
                 else:
                     print(f"Domain '{target}' not found.")
-                    return
+                    return FAILED
 
         if not domain:
             domain = _get_current_domain(session)
@@ -124,7 +119,7 @@ class ShowCommand(CommandBase):
         # Show item details
         if "show" not in domain.supported_verbs:
             print(f"'show' is not available in this context.")
-            return
+            return FAILED
 
         result = domain.show_item(session, name)
         if result:
@@ -133,6 +128,7 @@ class ShowCommand(CommandBase):
             target_name = name if name else domain.get_active(session)
             if target_name:
                 print(f"'{target_name}' not found.")
+                return FAILED
             else:
                 print(f"No active {domain.name}.")
 
@@ -146,6 +142,11 @@ class ListCommand(CommandBase):
 
     def setup(self, spec):
         spec.add_argument("domain", nargs="?", help="Domain to list items from")
+        spec.add_argument(
+            "--available", action="store_true",
+            help="List items in storage instead of loaded ones (loaded items are marked '+')"
+        )
+        spec.add_argument("--search", metavar="TEXT", help="With --available, only list items matching TEXT")
 
     def handle(self, args):
         session = args._session
@@ -157,11 +158,14 @@ class ListCommand(CommandBase):
                 print(f"Domain '{domain_name}' not found.")
             else:
                 print("Not in a domain context. Specify a domain: list <domain>")
-            return
+            return FAILED
 
         if "list" not in domain.supported_verbs:
             print(f"'list' is not available in this context.")
-            return
+            return FAILED
+
+        if getattr(args, "available", False) or getattr(args, "search", None):
+            return self._list_available(session, domain, getattr(args, "search", None))
 
         items = domain.list_items(session)
         active = domain.get_active(session)
@@ -174,6 +178,21 @@ class ListCommand(CommandBase):
             marker = "* " if item == active else "  "
             print(f"{marker}{item}")
 
+    def _list_available(self, session, domain, search):
+        available = domain.list_available(session, search)
+        if available is None:
+            print(f"'list --available' is not available for {domain.name}.")
+            return FAILED
+
+        if not available:
+            print(f"No {domain.name}s found in storage.")
+            return
+
+        loaded = set(domain.list_items(session))
+        for item in available:
+            marker = "+ " if item in loaded else "  "
+            print(f"{marker}{item}")
+
 
 class SetCommand(CommandBase):
     """Set the active item in a domain."""
@@ -197,7 +216,7 @@ class SetCommand(CommandBase):
             # target was a domain, name is required
             if not name:
                 print(f"Usage: set {target} <name>")
-                return
+                return FAILED
         else:
             # target might be an item name in current domain
             current = _get_current_domain(session)
@@ -206,14 +225,15 @@ class SetCommand(CommandBase):
                 domain = current
             else:
                 print(f"Domain '{target}' not found.")
-                return
+                return FAILED
 
         if "set" not in domain.supported_verbs:
             print(f"'set' is not available in this context.")
-            return
+            return FAILED
 
         if not domain.set_active(session, name):
             print(f"'{name}' not found in {domain.name}.")
+            return FAILED
 
 
 class LoadCommand(CommandBase):
@@ -224,34 +244,52 @@ class LoadCommand(CommandBase):
     path = []
 
     def setup(self, spec):
-        spec.add_argument("target", help="Domain or item name")
-        spec.add_argument("name", nargs="?", help="Item name (if target is domain)")
+        spec.add_argument("target", nargs="?", help="Domain or item name")
+        spec.add_argument("name", nargs="?", help="Item name or glob pattern (if target is domain)")
+        spec.add_argument("--all", action="store_true", help="Load every available item")
 
     def handle(self, args):
         session = args._session
-        target = args.target
+        target = getattr(args, "target", None)
         name = getattr(args, "name", None)
+        load_all = getattr(args, "all", False)
 
         # If target is a domain name, use it
-        domain = _find_domain(session, target)
+        domain = _find_domain(session, target) if target else None
         if domain:
-            if not name:
+            if not name and not load_all:
                 print(f"Usage: load {target} <name>")
-                return
+                return FAILED
         else:
             current = _get_current_domain(session)
             if current:
                 name = target
                 domain = current
-            else:
+            elif target:
                 print(f"Domain '{target}' not found.")
-                return
+                return FAILED
+            else:
+                print("Not in a domain context. Specify a domain: load <domain> <name>")
+                return FAILED
 
         if "load" not in domain.supported_verbs:
             print(f"'load' is not available in this context.")
-            return
-
-        domain.load_item(session, name)
+            return FAILED
+
+        if load_all:
+            if name:
+                print("Give either a name or --all, not both.")
+                return FAILED
+            loaded = domain.load_matching(session, "*")
+        elif not name:
+            print("Usage: load <name>")
+            return FAILED
+        elif _is_pattern(name):
+            loaded = domain.load_matching(session, name)
+        else:
+            loaded = domain.load_item(session, name)
+        if not loaded:
+            return FAILED
 
 
 class DropCommand(CommandBase):
@@ -284,17 +322,18 @@ class DropCommand(CommandBase):
                     domain = current
                 else:
                     print(f"Domain '{target}' not found.")
-                    return
+                    return FAILED
 
         if not domain:
             domain = _get_current_domain(session)
 
         if not domain:
             print("Not in a domain context. Specify a domain: drop <domain> [name]")
-            return
+            return FAILED
 
         if "drop" not in domain.supported_verbs:
             print(f"'drop' is not available in this context.")
-            return
+            return FAILED
 
-        domain.drop_item(session, name)
+        if not domain.drop_item(session, name):
+            return FAILED
@@ -0,0 +1,97 @@
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# This module is the 'gg' entry point, so it only imports the standard library:
+# a forwarded call should not pay for loading the command tree.
+
+SOCKET_ENV = "GG_CLI_SOCKET"
+SESSION_ENV = "GG_CLI_SESSION"
+
+# Global options that take a value, and those only an in-process run honours.
+_VALUE_OPTIONS = ("--system", "--profile-format")
+_LOCAL_OPTIONS = ("--script", "--stop-on-error", "--profile-startup")
+# Commands that start a server rather than run on one.
+_LOCAL_COMMANDS = ("serve", "host")
+
+
+def default_socket_path() -> Path:
+    """Returns the socket path used by 'gg-cli serve', overridable with GG_CLI_SOCKET."""
+    if os.environ.get(SOCKET_ENV):
+        return Path(os.environ[SOCKET_ENV])
+    return Path.home() / ".cache" / "gg-cli" / "server.sock"
+
+
+def send(argv: List[str], socket_path: Optional[Path] = None, session: Optional[str] = None,
+         out=None, err=None) -> int:
+    """
+    Forwards argv to a running server and writes its output to 'out' and 'err'
+    as it arrives. Returns the command's exit status. Raises OSError if no
+    server is listening.
+    """
+    out = out or sys.stdout
+    err = err or sys.stderr
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path or default_socket_path()))
+        request = {"argv": list(argv), "session": session}
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+        with sock.makefile("r", encoding="utf-8") as responses:
+            for line in responses:
+                frame = json.loads(line)
+                if "exit" in frame:
+                    return frame["exit"]
+                stream = out if frame["stream"] == "out" else err
+                stream.write(frame["data"])
+                stream.flush()
+
+    print("Error: The server closed the connection.", file=err)
+    return 1
+
+
+def main():
+    """
+    Console entry point for 'gg': runs the command on a 'gg-cli serve' daemon if
+    one is listening, and in-process otherwise. GG_CLI_SESSION names a session
+    on the server that keeps its state between calls. The prompt, scripts,
+    profiling and the server commands always run in-process.
+    """
+    if not _needs_local_run(sys.argv[1:]):
+        try:
+            return send(sys.argv[1:], session=os.environ.get(SESSION_ENV))
+        except (FileNotFoundError, ConnectionRefusedError):
+            pass
+    from .profiling import main as run_in_process
+    return run_in_process()
+
+
+def _needs_local_run(argv: List[str]) -> bool:
+    """
+    True if argv cannot be forwarded to a server: it has no command (the
+    prompt, or a script on stdin), starts a server, or uses an option only an
+    in-process run honours. Options are matched as the 'gg-cli' parser does,
+    anywhere in argv and by unambiguous prefix.
+    """
+    command = None
+    skip_value = False
+    for arg in argv:
+        if skip_value:
+            skip_value = False
+            continue
+        option = arg.split("=", 1)[0]
+        if _is_option(option, _LOCAL_OPTIONS):
+            return True
+        if _is_option(option, _VALUE_OPTIONS):
+            skip_value = "=" not in arg
+            continue
+        if command is None and not arg.startswith("-"):
+            command = arg
+    return command is None or command in _LOCAL_COMMANDS
+
+
+def _is_option(option: str, names) -> bool:
+    return option.startswith("--") and len(option) > 2 and any(name.startswith(option) for name in names)
@@ -1,4 +1,6 @@
 import readline
+from gamagama.cli.core.domain import DomainBranch
+from gamagama.cli.core.registry import CommandSpec
 from gamagama.cli.core.tree import Branch
 
 
@@ -8,10 +10,28 @@ class Completer:
     def __init__(self, tree, session=None):
         self.tree = tree
         self.session = session
+        # readline asks for candidates one 'state' at a time; they are computed
+        # once per Tab press and served from here.
+        self._cache_key = None
+        self._options = []
 
     def complete(self, text, state):
         """Returns the next possible completion for 'text'."""
-        line = readline.get_line_buffer().lstrip()
+        line = readline.get_line_buffer()
+        start_node = self.session.current_node if self.session else self.tree.root
+        key = (line, readline.get_begidx(), readline.get_endidx(), text, id(start_node))
+
+        # state 0 starts a new completion, so session state may have changed.
+        if state == 0 or key != self._cache_key:
+            self._options = self._get_options(line.lstrip(), text, start_node)
+            self._cache_key = key
+
+        if state < len(self._options):
+            return self._options[state]
+        return None
+
+    def _get_options(self, line, text, start_node):
+        """Returns every completion for 'text' on this line."""
         parts = line.split()
 
         # Determine the path to the current branch.
@@ -21,60 +41,55 @@ class Completer:
         else:
             path = parts[:-1]
 
-        start_node = self.session.current_node if self.session else self.tree.root
-        
         options = []
 
         if not path:
             # Bubbling completion for the first word
             options = self._get_bubbling_options(start_node, text)
         else:
-            # Strict traversal for subsequent words
-            target_branch = self._resolve_path(start_node, path)
-            if target_branch and isinstance(target_branch, Branch):
-                options = [node.name + " " for node in target_branch if node.name and node.name.startswith(text)]
+            # Item names after a domain verb, else strict traversal for subsequent words
+            item_options = self._get_item_options(start_node, path, text)
+            if item_options is not None:
+                options = item_options
+            else:
+                target_branch = self.tree.resolve(start_node, path)
+                if target_branch and isinstance(target_branch, Branch):
+                    options = [name + " " for name in target_branch.names_with_prefix(text)]
 
-        if state < len(options):
-            return options[state]
-        return None
+        return options
 
     def _get_bubbling_options(self, start_node, text):
         options = set()
         curr = start_node
         while curr:
             if isinstance(curr, Branch):
-                for node in curr:
-                    if node.name and node.name.startswith(text):
-                        options.add(node.name + " ")
+                options.update(name + " " for name in curr.names_with_prefix(text))
             curr = curr.parent
         return sorted(list(options))
 
-    def _resolve_path(self, start_node, path):
-        # First element bubbles
-        first = path[0]
-        curr = start_node
-        found_node = None
-        
-        while curr:
-            if isinstance(curr, Branch):
-                child = curr.get_child(first)
-                if child:
-                    found_node = child
-                    break
-            curr = curr.parent
-        
-        if not found_node:
+    def _get_item_options(self, start_node, path, text):
+        """
+        Completes item names after a verb: 'load player gan' anywhere, or
+        'load gan' inside the player domain. Returns None if path is not a verb
+        followed by an optional domain name.
+        """
+        if self.session is None or len(path) > 2:
             return None
-            
-        # Rest elements are strict children
-        current = found_node
-        for part in path[1:]:
-            if isinstance(current, Branch):
-                child = current.get_child(part)
-                if child:
-                    current = child
-                else:
-                    return None
-            else:
-                return None
-        return current
+
+        verb = self.tree.resolve(start_node, path[:1])
+        if not isinstance(verb, CommandSpec):
+            return None
+
+        if len(path) == 2:
+            domain = self._find_domain(path[1])
+        else:
+            domain = start_node if isinstance(start_node, DomainBranch) else None
+        if domain is None or verb.name not in domain.supported_verbs:
+            return None
+
+        return [name + " " for name in domain.complete_item(self.session, verb.name, text)]
+
+    def _find_domain(self, name):
+        """Finds a domain branch by name anywhere in the tree."""
+        node = self.tree.find_indexed(name)
+        return node if isinstance(node, DomainBranch) else None
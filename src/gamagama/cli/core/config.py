@@ -1,7 +1,7 @@
 import os
 import tomllib
 from pathlib import Path
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, Optional
 
 
 def load_config() -> Dict[str, Any]:
@@ -29,7 +29,11 @@ def load_config() -> Dict[str, Any]:
     return {}
 
 
-def validate_config(config: Dict[str, Any], valid_systems: Iterable[str]) -> None:
+def validate_config(
+    config: Dict[str, Any],
+    valid_systems: Iterable[str],
+    valid_stores: Optional[Iterable[str]] = None,
+) -> None:
     """
     Validates the configuration against allowed values.
     Modifies the config dictionary in-place by removing invalid entries.
@@ -39,3 +43,9 @@ def validate_config(config: Dict[str, Any], valid_systems: Iterable[str]) -> Non
         if sys_val and sys_val not in valid_systems:
             print(f"Warning: Invalid system '{sys_val}' in config file. Ignoring.")
             del config["core"]["system"]
+
+    if "characters" in config and valid_stores is not None:
+        store_val = config["characters"].get("store")
+        if store_val and store_val not in valid_stores:
+            print(f"Warning: Invalid character store '{store_val}' in config file. Ignoring.")
+            del config["characters"]["store"]
@@ -39,6 +39,8 @@ class Domain(Protocol):
 class DomainBranch(MapBranch):
     """A MapBranch that implements the Domain protocol for verb-first commands."""
 
+    indexed = True
+
     supported_verbs: Set[str] = field(default_factory=set)
 
     def list_items(self, session) -> List[str]:
@@ -65,10 +67,23 @@ class DomainBranch(MapBranch):
         """Override in subclass to return nested domain actives."""
         return {}
 
+    def list_available(self, session, search: Optional[str] = None) -> Optional[List[str]]:
+        """Override in subclass to return items in storage, loaded or not. None if unsupported."""
+        return None
+
+    def complete_item(self, session, verb: str, text: str) -> List[str]:
+        """Override in subclass to return item names completing 'text' after 'verb'."""
+        return []
+
     def load_item(self, session, name: str) -> bool:
         """Override in subclass if load is supported."""
         return False
 
+    def load_matching(self, session, pattern: str) -> bool:
+        """Override in subclass if bulk load (glob pattern or --all) is supported."""
+        print(f"Bulk load is not available for {self.name}.")
+        return False
+
     def drop_item(self, session, name: Optional[str]) -> bool:
         """Override in subclass if drop is supported."""
         return False
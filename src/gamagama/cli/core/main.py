@@ -1,78 +1,86 @@
 import argparse
-import readline
+import contextlib
 import shlex
 import sys
+import weakref
 
 from .. import commands
+from ..characters import STORE_BACKENDS, configure_store
+from ..commands.manifest import default_manifest_path
 from .parsers import NoHelpArgumentParser
-from .completer import Completer
-from .registry import CommandTree, ArgparseBuilder, CommandSpec
+from .profiling import PROFILE_FLAG, PROFILE_FORMATS, StartupProfiler
+from .registry import CommandTree, ArgparseBuilder, CommandSpec, FAILED
 from .tree import Branch
 from .domain import DomainBranch
 from .session import Session
 from .config import load_config, validate_config
-from gamagama.cli.systems import SYSTEMS
+from gamagama.cli.systems import SYSTEMS, default_index_path
 
+# Per-process cache of CLI parsers: tree -> {command path (or None): parser}
+_CLI_PARSERS = weakref.WeakKeyDictionary()
 
-def run():
+
+def run(profiler=None):
     """Main entry point for the gamagama CLI."""
+    if profiler is None:
+        profiler = StartupProfiler()
+
+    # Reuse the cached system plugin index across invocations.
+    SYSTEMS.index_path = default_index_path()
+
     # 1. Load and Validate Config
-    config = load_config()
-    validate_config(config, SYSTEMS.keys())
+    with profiler.phase("load_config"):
+        config = load_config()
+    with profiler.phase("validate_config"):
+        validate_config(config, SYSTEMS.keys(), STORE_BACKENDS)
     config_system = config.get("core", {}).get("system")
+    configure_store(config.get("characters", {}))
 
     # 2. Parse global options (like --system) first
     parser = argparse.ArgumentParser(add_help=False)
-
-    system_choices = sorted(SYSTEMS.keys())
-    parser.add_argument(
-        "--system",
-        choices=system_choices,
-        help="The game system to use."
-    )
+    _add_global_arguments(parser)
 
     # parse_known_args returns the parsed args and the 'rest' of the list
     args, remaining_args = parser.parse_known_args()
 
+    if not args.profile_startup:
+        profiler = None
+
     # 3. Determine the System
     # Priority: CLI Arg > Config > Default
     # args.system is validated by argparse choices.
     # config_system is validated by validate_config.
     system_name = args.system or config_system or "generic"
-    system_class = SYSTEMS[system_name]
+    with _phase(profiler, "load_system"):
+        system_class = SYSTEMS[system_name]
 
     # 4. Build the command tree
     tree = CommandTree()
-    commands.discover_commands(tree)
-
-    # 5. Decide Mode based on whether there are remaining arguments
+    with _phase(profiler, "discover_commands"):
+        commands.discover_commands(tree, manifest_path=default_manifest_path())
+
+    # 5. Decide Mode: a server, a script (or piped stdin), a single command, or the prompt
+    if remaining_args[:1] == ["serve"]:
+        return _run_server(tree, system_class, remaining_args[1:])
+    if remaining_args[:1] == ["host"]:
+        return _run_host(tree, system_class, remaining_args[1:])
+    if args.script is not None or (not remaining_args and not sys.stdin.isatty()):
+        if remaining_args:
+            print(f"Unexpected argument with --script: {remaining_args[0]}", file=sys.stderr)
+            return 2
+        return _run_script(tree, system_class, args, profiler)
     if remaining_args:
-        run_cli_mode(tree, system_class, remaining_args)
-    else:
-        run_interactive_mode(tree, system_class)
-
-
-def run_cli_mode(tree, system_class, cli_args):
-    """Runs the application in stateless CLI mode using argparse."""
-    parser = argparse.ArgumentParser(
-        prog="gg-cli",
-        description="A Game Master Game Manager for tabletop RPGs.",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
+        return run_cli_mode(tree, system_class, remaining_args, profiler, args.profile_format)
+    run_interactive_mode(tree, system_class, profiler, args.profile_format)
 
-    # Re-add system arg so it shows in help, even though we handled it
-    system_choices = sorted(SYSTEMS.keys())
-    parser.add_argument(
-        "--system",
-        choices=system_choices,
-        help="The game system to use."
-    )
 
-    # Build argparse structure from tree
-    builder = ArgparseBuilder(tree)
-    builder.build(parser)
+def run_cli_mode(tree, system_class, cli_args, profiler=None, profile_format="text"):
+    """Runs the application in stateless CLI mode using argparse; returns the exit status."""
+    with _phase(profiler, "argparse_build"):
+        parser = _get_cli_parser(tree, cli_args)
 
-    args = parser.parse_args(cli_args)
+    with _phase(profiler, "argparse_parse"):
+        args = parser.parse_args(cli_args)
 
     if hasattr(args, "func"):
         # Create a transient session for this command execution
@@ -80,19 +88,34 @@ def run_cli_mode(tree, system_class, cli_args):
         setattr(args, "_session", session)
         setattr(args, "_interactive", False)
 
-        args.func(args)
+        status = 1 if args.func(args) is FAILED else 0
     else:
         parser.print_help()
+        status = 0
+
+    if profiler:
+        print(profiler.report(profile_format), file=sys.stderr)
+        profiler.stop_import_tracking()
+    return status
 
 
-def run_interactive_mode(tree, system_class):
+def run_interactive_mode(tree, system_class, profiler=None, profile_format="text"):
     """Runs the application in stateful interactive mode."""
     session = Session(tree, system=system_class())
 
+    # readline is only needed for the interactive prompt.
+    with _phase(profiler, "readline"):
+        import readline
+        from .completer import Completer
+
     completer = Completer(tree, session)
     readline.set_completer(completer.complete)
     readline.parse_and_bind("tab: complete")
 
+    if profiler:
+        print(profiler.report(profile_format), file=sys.stderr)
+        profiler.stop_import_tracking()
+
     print(f"Welcome to gamagama! (System: {session.system.name})")
     print("Type 'quit' to exit.")
 
@@ -103,75 +126,232 @@ def run_interactive_mode(tree, system_class):
             prompt = f"{prompt_path}> "
 
             line = input(prompt)
-            if not line.strip():
-                continue
-
-            parts = shlex.split(line)
-            if not parts:
-                continue
-
-            # 1. Resolve the first part (bubbling lookup)
-            first_node = _resolve_node(session.current_node, parts[0])
-
-            if not first_node:
-                print(f"Command not found: {parts[0]}")
-                continue
-
-            # 2. Walk down the tree with the remaining parts (strict lookup)
-            curr_node = first_node
-            remaining_args = parts[1:]
-
-            while remaining_args and isinstance(curr_node, Branch):
-                next_child = curr_node.get_child(remaining_args[0])
-                if next_child:
-                    curr_node = next_child
-                    remaining_args.pop(0)
-                else:
-                    # Next arg is not a child, so stop walking.
-                    break
-
-            # 3. Execute or Navigate
-            if isinstance(curr_node, Branch):
-                # Check if this is a DomainBranch with a remaining arg to set active
-                if isinstance(curr_node, DomainBranch) and remaining_args:
-                    # "player gandalf" - navigate and set active
-                    name_to_set = remaining_args.pop(0)
-                    if remaining_args:
-                        # Extra args after name - error
-                        print(f"Unexpected argument: {remaining_args[0]}")
-                        continue
-
-                    # Navigate to the domain
-                    session.current_node = curr_node
-
-                    # Try to set active
-                    if not curr_node.set_active(session, name_to_set):
-                        # set_active returns False if item doesn't exist
-                        # For player domain, we might allow setting to non-loaded player
-                        # But typically this means the item wasn't found
-                        pass
-                    continue
-
-                if remaining_args:
-                    # We ended at a branch but still have args that didn't match children.
-                    print(f"Command not found: {remaining_args[0]}")
-                    continue
-
-                # Navigation: Enter the branch
-                session.current_node = curr_node
-                continue
-
-            if isinstance(curr_node, CommandSpec):
-                _execute_command(curr_node, remaining_args, session)
-                continue
-
-            print(f"Node '{curr_node.name}' is not executable.")
+            _execute_line(line, session)
 
         except (EOFError, KeyboardInterrupt):
             print("\nExiting.")
             break
 
 
+def run_script_mode(tree, system_class, lines, stop_on_error=False, profiler=None, profile_format="text"):
+    """
+    Runs lines from a script file or a pipe through the same engine as the
+    interactive prompt, sharing one session. Blank lines and lines starting
+    with '#' are skipped. Returns the number of lines that failed.
+    """
+    session = Session(tree, system=system_class())
+
+    if profiler:
+        print(profiler.report(profile_format), file=sys.stderr)
+        profiler.stop_import_tracking()
+
+    errors = 0
+    for line_number, line in enumerate(lines, start=1):
+        if session.should_exit:
+            break
+
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+
+        try:
+            ok = _execute_line(stripped, session)
+        except Exception as e:
+            print(f"Error: {e}")
+            ok = False
+
+        # Stream results as they are produced, even when stdout is a pipe.
+        sys.stdout.flush()
+
+        if not ok:
+            errors += 1
+            if stop_on_error:
+                print(f"Stopped at line {line_number}: {stripped}", file=sys.stderr)
+                break
+
+    return errors
+
+
+def _execute_line(line, session):
+    """
+    Resolves and runs one line of input against the session, navigating or
+    executing as the interactive prompt does. Returns False if the line could
+    not be resolved or its arguments could not be parsed.
+    """
+    if not line.strip():
+        return True
+
+    try:
+        parts = shlex.split(line)
+    except ValueError as e:
+        print(f"Parse error: {e}")
+        return False
+    if not parts:
+        return True
+
+    # 1. Resolve the first part by bubbling up, then walk down through
+    #    children for as long as the remaining parts name them.
+    curr_node, used = session.tree.resolve_prefix(session.current_node, parts)
+
+    if not curr_node:
+        print(f"Command not found: {parts[0]}")
+        return False
+
+    remaining_args = parts[used:]
+
+    # 2. Execute or Navigate
+    if isinstance(curr_node, Branch):
+        # Check if this is a DomainBranch with a remaining arg to set active
+        if isinstance(curr_node, DomainBranch) and remaining_args:
+            # "player gandalf" - navigate and set active
+            name_to_set = remaining_args.pop(0)
+            if remaining_args:
+                # Extra args after name - error
+                print(f"Unexpected argument: {remaining_args[0]}")
+                return False
+
+            # Navigate to the domain
+            session.current_node = curr_node
+
+            # Try to set active; set_active returns False if the item doesn't exist
+            if not curr_node.set_active(session, name_to_set):
+                print(f"'{name_to_set}' not found in {curr_node.name}.")
+                return False
+            return True
+
+        if remaining_args:
+            # We ended at a branch but still have args that didn't match children.
+            print(f"Command not found: {remaining_args[0]}")
+            return False
+
+        # Navigation: Enter the branch
+        session.current_node = curr_node
+        return True
+
+    if isinstance(curr_node, CommandSpec):
+        return _execute_command(curr_node, remaining_args, session)
+
+    print(f"Node '{curr_node.name}' is not executable.")
+    return False
+
+
+def _run_server(tree, system_class, serve_args):
+    """Runs 'gg-cli serve [--socket PATH]'. Returns the exit status."""
+    from .server import serve
+
+    parser = argparse.ArgumentParser(
+        prog="gg-cli serve",
+        description="Serve commands from a warm process over a Unix socket."
+    )
+    parser.add_argument("--socket", metavar="PATH", help="The socket to listen on.")
+    args = parser.parse_args(serve_args)
+    return serve(tree, system_class, args.socket)
+
+
+def _run_host(tree, system_class, host_args):
+    """Runs 'gg-cli host (--socket PATH | --port PORT)'. Returns the exit status."""
+    from .session_server import host
+
+    parser = argparse.ArgumentParser(
+        prog="gg-cli host",
+        description="Host many interactive sessions in one process over a line protocol."
+    )
+    listen = parser.add_mutually_exclusive_group(required=True)
+    listen.add_argument("--socket", metavar="PATH", help="Listen on a Unix socket.")
+    listen.add_argument("--port", type=int, help="Listen on a TCP port.")
+    parser.add_argument("--bind", default="127.0.0.1", help="The TCP address to bind (default: 127.0.0.1).")
+    args = parser.parse_args(host_args)
+    return host(tree, system_class, args.socket, args.bind, args.port)
+
+
+def _run_script(tree, system_class, args, profiler):
+    """Runs --script FILE ('-' or no --script reads stdin). Returns the exit status."""
+    path = args.script or "-"
+    try:
+        if path == "-":
+            errors = run_script_mode(
+                tree, system_class, sys.stdin, args.stop_on_error, profiler, args.profile_format
+            )
+        else:
+            with open(path, "r") as f:
+                errors = run_script_mode(
+                    tree, system_class, f, args.stop_on_error, profiler, args.profile_format
+                )
+    except OSError as e:
+        print(f"Error: Cannot read script '{path}': {e.strerror}", file=sys.stderr)
+        return 2
+    return 1 if errors else 0
+
+
+def _get_cli_parser(tree, cli_args):
+    """
+    Returns the argparse parser for cli_args. When they name a command, only
+    that command's subparser chain is built; otherwise (e.g. '--help' or an
+    unknown command) the full tree is. Parsers are cached per tree and path
+    until the tree's structure changes.
+    """
+    builder = ArgparseBuilder(tree)
+    path = builder.command_path(cli_args)
+    key = tuple(path) if path is not None else None
+
+    # Parsers built before the tree changed are dropped.
+    version, parsers = _CLI_PARSERS.get(tree, (None, None))
+    if version != tree.version:
+        parsers = {}
+        _CLI_PARSERS[tree] = (tree.version, parsers)
+    if key not in parsers:
+        parser = argparse.ArgumentParser(
+            prog="gg-cli",
+            description="A Game Master Game Manager for tabletop RPGs.",
+            formatter_class=argparse.RawDescriptionHelpFormatter
+        )
+
+        # Re-add global args so they show in help, even though we handled them
+        _add_global_arguments(parser)
+
+        # Build argparse structure from tree
+        builder.build(parser, path)
+        parsers[key] = parser
+
+    return parsers[key]
+
+
+def _add_global_arguments(parser):
+    """Adds the options that apply to every invocation."""
+    system_choices = sorted(SYSTEMS.keys())
+    parser.add_argument(
+        "--system",
+        choices=system_choices,
+        help="The game system to use."
+    )
+    parser.add_argument(
+        "--script",
+        metavar="FILE",
+        help="Run the commands in FILE ('-' for stdin) in one session, then exit."
+    )
+    parser.add_argument(
+        "--stop-on-error",
+        action="store_true",
+        help="With --script, stop at the first line that fails."
+    )
+    parser.add_argument(
+        PROFILE_FLAG,
+        action="store_true",
+        help="Print a breakdown of startup time to stderr."
+    )
+    parser.add_argument(
+        "--profile-format",
+        choices=PROFILE_FORMATS,
+        default="text",
+        help="Format of the --profile-startup report."
+    )
+
+
+def _phase(profiler, name):
+    """Times a startup phase if profiling is enabled."""
+    return profiler.phase(name) if profiler else contextlib.nullcontext()
+
+
 def _build_prompt_path(node, session):
     """Build prompt path showing domain actives in parentheses."""
     if node.name == "root":
@@ -199,34 +379,23 @@ def _build_prompt_path(node, session):
     return " ".join(parts)
 
 
-def _resolve_node(start_node, name):
-    """Bubbles up from start_node to find a child with the given name."""
-    curr = start_node
-    while curr:
-        if isinstance(curr, Branch):
-            child = curr.get_child(name)
-            if child:
-                return child
-        curr = curr.parent
-    return None
-
-
 def _execute_command(spec, args_list, session):
-    """Builds a temporary parser for the command and executes it."""
-    parser = argparse.ArgumentParser(
-        prog=spec.name,
-        description=spec.help
-    )
-
-    for arg in spec.arguments:
-        parser.add_argument(*arg['args'], **arg['kwargs'])
-
-    try:
-        # Parse args
-        args = parser.parse_args(args_list)
-    except SystemExit:
-        # argparse prints help and exits. We catch it to stay in the loop.
-        return
+    """
+    Parses the arguments with the command's cached parser and executes it.
+    Returns False if the arguments could not be parsed or the handler
+    returned FAILED.
+    """
+    if not spec.arguments and not args_list:
+        # Fast path: nothing to parse (e.g. '..', '/', 'quit')
+        args = argparse.Namespace()
+    else:
+        try:
+            # Parse args
+            args = spec.get_parser().parse_args(args_list)
+        except SystemExit as e:
+            # argparse prints help and exits. We catch it to stay in the loop.
+            # A bare 'cmd --help' exits cleanly and is not a failure.
+            return e.code in (0, None)
 
     # Inject session
     setattr(args, "_session", session)
@@ -237,7 +406,9 @@ def _execute_command(spec, args_list, session):
         result = spec.handler(args)
         if result is False:
             session.should_exit = True
+        return result is not FAILED
+    return True
 
 
 if __name__ == "__main__":
-    run()
+    sys.exit(run())
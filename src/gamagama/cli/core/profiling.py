@@ -0,0 +1,148 @@
+import json
+import sys
+import time
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from typing import Any, Dict, List, Optional
+
+PROFILE_FLAG = "--profile-startup"
+PROFILE_FORMATS = ("text", "json")
+SLOWEST_IMPORTS = 15
+
+
+class StartupProfiler:
+    """
+    Collects named phase timings and, once import tracking is started,
+    the time spent executing each newly imported module.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Dict[str, Any]] = []
+        self.imports: List[Dict[str, Any]] = []
+        self._import_timer: Optional["_ImportTimer"] = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Times the enclosed block as a named startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append({"name": name, "ms": (time.perf_counter() - start) * 1000})
+
+    def start_import_tracking(self):
+        """Starts timing every module imported from now on."""
+        if self._import_timer is None:
+            self._import_timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._import_timer)
+
+    def stop_import_tracking(self):
+        if self._import_timer is not None:
+            sys.meta_path.remove(self._import_timer)
+            self._import_timer = None
+
+    @property
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_ms": self.total_ms,
+            "phases": list(self.phases),
+            "imports": sorted(self.imports, key=lambda i: i["cumulative_ms"], reverse=True),
+        }
+
+    def report(self, fmt: str = "text") -> str:
+        """Renders the collected timings as a text table or as JSON."""
+        data = self.to_dict()
+        if fmt == "json":
+            return json.dumps(data, indent=2)
+
+        lines = [f"Startup profile (total {data['total_ms']:.1f} ms):"]
+        width = max((len(p["name"]) for p in data["phases"]), default=0)
+        for p in data["phases"]:
+            lines.append(f"  {p['name']:<{width}}  {p['ms']:8.1f} ms")
+
+        if data["imports"]:
+            lines.append(f"Slowest imports (cumulative / self, {len(data['imports'])} modules):")
+            slowest = data["imports"][:SLOWEST_IMPORTS]
+            width = max(len(i["module"]) for i in slowest)
+            for i in slowest:
+                lines.append(
+                    f"  {i['module']:<{width}}  {i['cumulative_ms']:8.1f} ms  {i['self_ms']:8.1f} ms"
+                )
+        return "\n".join(lines)
+
+
+class _ImportTimer(MetaPathFinder):
+    """A meta path finder that wraps found loaders to time module execution."""
+
+    def __init__(self, profiler: StartupProfiler):
+        self.profiler = profiler
+        # One [start, children_ms] frame per module currently executing.
+        self.stack: List[List[float]] = []
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        # Builtin and frozen importers are shared classes; leave them alone.
+        loader = spec.loader
+        if loader is not None and not isinstance(loader, type) and hasattr(loader, "exec_module"):
+            spec.loader = _TimedLoader(loader, fullname, self)
+        return spec
+
+    def record(self, name: str, cumulative_ms: float, self_ms: float):
+        self.profiler.imports.append(
+            {"module": name, "cumulative_ms": cumulative_ms, "self_ms": self_ms}
+        )
+
+
+class _TimedLoader:
+    """Delegates to the real loader, timing exec_module."""
+
+    def __init__(self, loader, name: str, timer: _ImportTimer):
+        self._loader = loader
+        self._name = name
+        self._timer = timer
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        stack = self._timer.stack
+        frame = [time.perf_counter(), 0.0]
+        stack.append(frame)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            stack.pop()
+            cumulative = (time.perf_counter() - frame[0]) * 1000
+            if stack:
+                stack[-1][1] += cumulative
+            self._timer.record(self._name, cumulative, cumulative - frame[1])
+
+
+def main():
+    """
+    Console entry point. Import tracking has to start before the CLI modules
+    are imported, so '--profile-startup' is checked here, ahead of argparse.
+    """
+    profiler = StartupProfiler()
+    if PROFILE_FLAG in sys.argv[1:]:
+        profiler.start_import_tracking()
+
+    with profiler.phase("import"):
+        from .main import run
+
+    return run(profiler)
@@ -1,3 +1,3 @@
-from .node import CommandSpec
+from .node import CommandSpec, FAILED
 from .tree import CommandTree
 from .builder import ArgparseBuilder
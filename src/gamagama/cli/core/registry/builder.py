@@ -1,5 +1,6 @@
 import argparse
-from ..tree import MapBranch, NodeVisitor
+from typing import List, Optional
+from ..tree import Branch, MapBranch, NodeVisitor
 from .node import CommandSpec
 
 
@@ -9,19 +10,51 @@ class ArgparseBuilder(NodeVisitor):
         self.node_parsers = {}
         self.node_actions = {}
 
-    def build(self, root_parser):
-        """Builds the argparse tree using the CommandTree."""
+    def build(self, root_parser, path: Optional[List[str]] = None):
+        """
+        Builds the argparse tree using the CommandTree.
+        If 'path' is given, only the subparser chain leading to that node is built.
+        """
         # Map: Node -> ArgumentParser
         self.node_parsers = {self.tree.root: root_parser}
         self.node_actions = {}
 
-        # walk() guarantees parents are visited before children (Pre-Order)
-        for node in self.tree.walk():
+        # Both preorder() and the path chain visit parents before children
+        nodes = self.tree.preorder() if path is None else self._path_nodes(path)
+        for node in nodes:
             if node is self.tree.root:
                 continue
             # Dispatch using reflection (visit_MapBranch, visit_CommandSpec, etc.)
             self.visit(node)
 
+    def command_path(self, cli_args: List[str]) -> Optional[List[str]]:
+        """
+        Returns the path of the command named by the leading words of cli_args,
+        or None if they do not name a command (e.g. '--help' or a group).
+        """
+        path = []
+        current = self.tree.root
+        for arg in cli_args:
+            if not isinstance(current, Branch) or arg.startswith("-"):
+                break
+            child = current.get_child(arg)
+            if child is None:
+                break
+            path.append(arg)
+            current = child
+
+        if isinstance(current, CommandSpec):
+            return path
+        return None
+
+    def _path_nodes(self, path: List[str]):
+        current = self.tree.root
+        for part in path:
+            current = current.get_child(part)
+            if current is None:
+                raise ValueError(f"No node at path '{' '.join(path)}'.")
+            yield current
+
     def _get_parent_action(self, node):
         """Helper to get or create the subparsers action for the parent node."""
         parent_node = node.parent
@@ -1,8 +1,21 @@
+import argparse
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Optional
 from ..tree.node import Node
 
 
+class _Failed:
+    """The type of FAILED; there is only one instance."""
+
+    def __repr__(self):
+        return "FAILED"
+
+
+# Returned by a command handler to report that the command failed, so script
+# mode can count it and stop on it with --stop-on-error.
+FAILED = _Failed()
+
+
 @dataclass(eq=False)
 class CommandSpec(Node):
     """Payload for a command leaf, defining its handler and arguments."""
@@ -11,7 +24,47 @@ class CommandSpec(Node):
     help: str = ""
     description: str = ""
     dynamic_help: Callable = None
+    _parser: Optional[argparse.ArgumentParser] = field(default=None, init=False, repr=False)
+    # Shallow snapshot of (name, help, arguments) the cached parser was built from
+    _parser_key: Optional[tuple] = field(default=None, init=False, repr=False)
 
     def add_argument(self, *args, **kwargs):
         """Stores argument defs to be applied to argparse later."""
         self.arguments.append({"args": args, "kwargs": kwargs})
+
+    def get_parser(self) -> argparse.ArgumentParser:
+        """
+        Returns a standalone parser for this command (as used in interactive mode).
+        It is built once and rebuilt only if the name, help or arguments change,
+        including arguments replaced or edited in place.
+        """
+        key = (self.name, self.help, self._argument_items())
+        if (self._parser is None or self._parser_key[:2] != key[:2]
+                or not _same_items(self._parser_key[2], key[2])):
+            parser = argparse.ArgumentParser(
+                prog=self.name,
+                description=self.help
+            )
+            for arg in self.arguments:
+                parser.add_argument(*arg['args'], **arg['kwargs'])
+            self._parser = parser
+            self._parser_key = key
+        return self._parser
+
+    def _argument_items(self) -> tuple:
+        """
+        Flattens each argument's dict, args, kwargs and kwargs items into a
+        tuple, without copying any value, to be compared by identity.
+        """
+        flat = []
+        for arg in self.arguments:
+            kwargs = arg['kwargs']
+            flat += (arg, arg['args'], kwargs)
+            for item in kwargs.items():
+                flat += item
+        return tuple(flat)
+
+
+def _same_items(a: tuple, b: tuple) -> bool:
+    """True if both tuples hold the very same objects (identity, not equality)."""
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
@@ -0,0 +1,175 @@
+import argparse
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from gamagama.cli.characters import Store, default_store
+from gamagama.cli.systems import SYSTEMS
+from .client import default_socket_path
+from .main import _add_global_arguments, _get_cli_parser
+from .registry import FAILED
+from .session import Session
+
+
+class CommandServer(socketserver.UnixStreamServer):
+    """
+    Runs one-shot commands against a warm command tree for clients connecting
+    over a Unix socket.
+
+    Each request is a JSON line {"argv": [...], "session": key or null}. Output
+    is streamed back as {"stream": "out"|"err", "data": ...} lines, followed by
+    {"exit": status}. Requests naming a session share its state; others get a
+    transient session, as in CLI mode.
+
+    Requests are handled one at a time, since command output is captured by
+    redirecting the process-wide sys.stdout.
+    """
+
+    def __init__(self, socket_path, tree, system_class, store: Optional[Store] = None):
+        self.tree = tree
+        self.system_class = system_class
+        # One store for every session, so its caches survive between requests.
+        self.store = store if store is not None else default_store()
+        self.sessions: Dict[str, Session] = {}
+
+        self._global_parser = argparse.ArgumentParser(add_help=False)
+        _add_global_arguments(self._global_parser)
+
+        # Create the socket readable and writable by its owner only.
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def execute(self, argv: List[str], session_key: Optional[str] = None) -> int:
+        """Runs argv as 'gg-cli' would and returns the exit status."""
+        try:
+            global_args, cli_args = self._global_parser.parse_known_args(argv)
+            parser = _get_cli_parser(self.tree, cli_args)
+            args = parser.parse_args(cli_args)
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else 1
+
+        if global_args.script is not None or global_args.stop_on_error or global_args.profile_startup:
+            print("Error: --script, --stop-on-error and --profile-startup are not supported by the server; "
+                  "run 'gg-cli' instead.", file=sys.stderr)
+            return 2
+
+        if not hasattr(args, "func"):
+            parser.print_help()
+            return 0
+
+        setattr(args, "_session", self._get_session(session_key, global_args.system))
+        setattr(args, "_interactive", False)
+
+        try:
+            result = args.func(args)
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        return 1 if result is FAILED else 0
+
+    def _get_session(self, key: Optional[str], system_name: Optional[str]) -> Session:
+        """Returns the named session (created on first use) or a transient one."""
+        if key in self.sessions:
+            return self.sessions[key]
+
+        system_class = SYSTEMS[system_name] if system_name else self.system_class
+        session = Session(self.tree, system=system_class(), store=self.store)
+        if key is not None:
+            self.sessions[key] = session
+        return session
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        try:
+            line = self.rfile.readline()
+        except OSError:
+            return
+        if not line:
+            # A connection closed without a request, e.g. serve() checking
+            # whether a server is listening.
+            return
+
+        try:
+            request = json.loads(line)
+            argv = [str(arg) for arg in request["argv"]]
+        except (ValueError, KeyError, TypeError):
+            try:
+                self._send({"stream": "err", "data": "Error: Malformed request.\n"})
+                self._send({"exit": 2})
+            except OSError:
+                pass
+            return
+
+        out = _FrameWriter(self, "out")
+        err = _FrameWriter(self, "err")
+        try:
+            with redirect_stdout(out), redirect_stderr(err):
+                status = self.server.execute(argv, request.get("session"))
+            self._send({"exit": status})
+        except OSError:
+            # The client went away mid-response.
+            pass
+
+    def _send(self, frame):
+        self.wfile.write(json.dumps(frame).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+class _FrameWriter(io.TextIOBase):
+    """A text stream that forwards each write to the client as an output frame."""
+
+    def __init__(self, handler: _RequestHandler, stream: str):
+        self.handler = handler
+        self.stream = stream
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: str) -> int:
+        if data:
+            self.handler._send({"stream": self.stream, "data": data})
+        return len(data)
+
+
+def serve(tree, system_class, socket_path: Optional[Path] = None) -> int:
+    """Serves commands on socket_path until interrupted. Returns the exit status."""
+    path = Path(socket_path or default_socket_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if path.exists():
+        if _is_listening(path):
+            print(f"Error: A server is already listening on {path}.", file=sys.stderr)
+            return 1
+        # Left behind by a server that did not shut down cleanly.
+        path.unlink()
+
+    server = CommandServer(path, tree, system_class)
+    print(f"Serving on {path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+    return 0
+
+
+def _is_listening(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+    return True
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Dict, Optional
 
-from gamagama.cli.characters import Character, CharacterStore
+from gamagama.cli.characters import Character, Store, default_store
 from gamagama.cli.core.registry import CommandTree
 from gamagama.cli.core.tree import Node
 from gamagama.core import GameSystem
@@ -15,7 +15,7 @@ class Session:
     current_node: Node = field(init=False)
     should_exit: bool = False
     system: GameSystem = field(default_factory=GenericSystem)
-    store: CharacterStore = field(default_factory=CharacterStore)
+    store: Store = field(default_factory=default_store)
     players: Dict[str, Character] = field(default_factory=dict)
     active_player: Optional[str] = None
     active_schema: Optional[str] = None
@@ -0,0 +1,130 @@
+import asyncio
+import errno
+import io
+import os
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import List, Optional
+
+from gamagama.cli.characters import Store, default_store
+from .main import _build_prompt_path, _execute_line
+from .server import _is_listening
+from .session import Session
+
+
+class SessionServer:
+    """
+    Hosts many interactive sessions in one process over a line protocol.
+
+    Each connection gets its own Session (current node, players, actives) and
+    talks to it exactly as to the interactive prompt: one command per line,
+    answered by the command's output and the next prompt. All sessions share
+    one command tree and one character store.
+
+    Commands run on the event loop one at a time, which is what makes it safe
+    to capture their output by redirecting sys.stdout.
+    """
+
+    def __init__(self, tree, system_class, store: Optional[Store] = None):
+        self.tree = tree
+        self.system_class = system_class
+        self.store = store if store is not None else default_store()
+        self.sessions: List[Session] = []
+
+    def new_session(self) -> Session:
+        return Session(self.tree, system=self.system_class(), store=self.store)
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def start_unix(self, path) -> asyncio.AbstractServer:
+        """
+        Listens on a Unix socket. Raises OSError (EADDRINUSE) if another server
+        is already listening on path; a stale socket file is replaced.
+        """
+        path = Path(path)
+        if path.exists():
+            if _is_listening(path):
+                raise OSError(errno.EADDRINUSE, f"A server is already listening on {path}.")
+            # Left behind by a server that did not shut down cleanly.
+            path.unlink()
+
+        # Create the socket readable and writable by its owner only.
+        old_umask = os.umask(0o177)
+        try:
+            return await asyncio.start_unix_server(self.handle_connection, str(path))
+        finally:
+            os.umask(old_umask)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        session = self.new_session()
+        self.sessions.append(session)
+        try:
+            writer.write(
+                f"Welcome to gamagama! (System: {session.system.name})\n"
+                f"Type 'quit' to exit.\n{self._prompt(session)}".encode("utf-8")
+            )
+            await writer.drain()
+
+            while not session.should_exit:
+                data = await reader.readline()
+                if not data:
+                    break
+
+                output = self.execute(session, data.decode("utf-8", errors="replace"))
+                if not session.should_exit:
+                    output += self._prompt(session)
+                writer.write(output.encode("utf-8"))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            # Sessions compare by value, so remove this one by identity.
+            self.sessions = [s for s in self.sessions if s is not session]
+            writer.close()
+
+    def execute(self, session: Session, line: str) -> str:
+        """Runs one line against the session and returns what it printed."""
+        output = io.StringIO()
+        with redirect_stdout(output), redirect_stderr(output):
+            try:
+                _execute_line(line, session)
+            except Exception as e:
+                print(f"Error: {e}")
+        return output.getvalue()
+
+    def _prompt(self, session: Session) -> str:
+        return f"{_build_prompt_path(session.current_node, session)}> "
+
+
+def host(tree, system_class, socket_path: Optional[Path] = None,
+         host_name: str = "127.0.0.1", port: Optional[int] = None) -> int:
+    """Hosts sessions on a Unix socket or TCP port until interrupted. Returns the exit status."""
+    server = SessionServer(tree, system_class)
+    # Set once this process has created the socket file, which is then its to remove.
+    bound = False
+
+    async def serve_forever():
+        nonlocal bound
+        if socket_path is not None:
+            listener = await server.start_unix(socket_path)
+            bound = True
+        else:
+            listener = await server.start_tcp(host_name, port or 0)
+        names = ", ".join(str(sock.getsockname()) for sock in listener.sockets)
+        print(f"Hosting sessions on {names}", file=sys.stderr)
+        async with listener:
+            await listener.serve_forever()
+
+    try:
+        asyncio.run(serve_forever())
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"Error: {e.strerror or e}", file=sys.stderr)
+        return 1
+    finally:
+        if bound:
+            Path(socket_path).unlink(missing_ok=True)
+    return 0
@@ -0,0 +1,297 @@
+import os
+import struct
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from gamagama.cli.characters import Character
+
+# Snapshot layout (all integers little-endian):
+#   header   magic b"GGSS", format u16, reserved u16
+#   meta     system, active_player, active_schema (optional strings),
+#            current node path (u16 count + strings)
+#   players  u32 count, then per player: name, blob offset u32, blob length u32
+#   blobs    one encoded character per player, offsets relative to the blob section
+# Strings are a u32 byte length + UTF-8; an optional string of length 0xFFFFFFFF is None.
+MAGIC = b"GGSS"
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_SUFFIX = ".ggs"
+
+_HEADER = struct.Struct("<4sHH")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_SPAN = struct.Struct("<II")
+_NONE = 0xFFFFFFFF
+
+
+class SnapshotError(ValueError):
+    """Raised for unreadable, corrupt or incompatible snapshot files."""
+
+
+def default_snapshot_dir() -> Path:
+    """Returns the directory session snapshots are saved in."""
+    return Path.home() / ".config" / "gg-cli" / "sessions"
+
+
+def snapshot_path(name: str, directory: Optional[Path] = None) -> Path:
+    """Returns the file for a snapshot name, which must be a plain file name."""
+    if not name or name in (".", "..") or Path(name).name != name:
+        raise SnapshotError(f"Invalid snapshot name: '{name}'.")
+    return (directory or default_snapshot_dir()) / f"{name}{SNAPSHOT_SUFFIX}"
+
+
+def list_snapshots(directory: Optional[Path] = None) -> List[str]:
+    """Returns the sorted names of the saved snapshots."""
+    try:
+        entries = os.listdir(directory or default_snapshot_dir())
+    except OSError:
+        return []
+    return sorted(e[:-len(SNAPSHOT_SUFFIX)] for e in entries if e.endswith(SNAPSHOT_SUFFIX))
+
+
+def save_snapshot(session, path: Path):
+    """Writes the session's players, actives, location and system to path."""
+    out = bytearray(_HEADER.pack(MAGIC, SNAPSHOT_FORMAT, 0))
+    _put_str(out, session.system.name)
+    _put_str(out, session.active_player)
+    _put_str(out, session.active_schema)
+
+    node_path = _node_path(session.current_node)
+    out += _U16.pack(len(node_path))
+    for part in node_path:
+        _put_str(out, part)
+
+    blobs = bytearray()
+    table = bytearray(_U32.pack(len(session.players)))
+    players = session.players
+    for name in players:
+        if isinstance(players, SnapshotPlayers) and players.is_pending(name):
+            # Never decoded, so it cannot have changed: copy its bytes as they are.
+            blob = players.raw(name)
+        else:
+            blob = encode_character(players[name])
+        _put_str(table, name)
+        table += _SPAN.pack(len(blobs), len(blob))
+        blobs += blob
+
+    out += table
+    out += blobs
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(out)
+    os.replace(tmp_path, path)
+
+
+def restore_snapshot(session, path: Path, systems) -> List[str]:
+    """
+    Replaces the session's state with the snapshot at path. Players are decoded
+    lazily, on first access. 'systems' maps system names to classes. Returns
+    warnings about state that could not be restored.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    reader = _Reader(data)
+    magic, version, _ = reader.unpack(_HEADER)
+    if magic != MAGIC:
+        raise SnapshotError(f"{path} is not a session snapshot.")
+    if version > SNAPSHOT_FORMAT:
+        raise SnapshotError(f"{path} was written by a newer version (format {version}).")
+
+    system_name = reader.str()
+    active_player = reader.str()
+    active_schema = reader.str()
+    node_path = [reader.str() for _ in range(reader.unpack(_U16)[0])]
+
+    spans: Dict[str, Tuple[int, int]] = {}
+    for _ in range(reader.unpack(_U32)[0]):
+        name = reader.str()
+        spans[name] = reader.unpack(_SPAN)
+    blobs = memoryview(data)[reader.pos:]
+    for offset, length in spans.values():
+        if offset + length > len(blobs):
+            raise SnapshotError(f"{path} is truncated.")
+
+    warnings = []
+    if system_name in systems:
+        if system_name != session.system.name:
+            session.system = systems[system_name]()
+    else:
+        warnings.append(f"System '{system_name}' is not installed; keeping '{session.system.name}'.")
+
+    session.players = SnapshotPlayers(blobs, spans)
+    session.active_player = active_player if active_player in spans else None
+    session.active_schema = active_schema
+
+    node = session.tree.get(node_path) if node_path else session.tree.root
+    if node is None:
+        warnings.append(f"Location '{' '.join(node_path)}' no longer exists; returning to root.")
+        node = session.tree.root
+    session.current_node = node
+    return warnings
+
+
+class SnapshotPlayers(MutableMapping):
+    """
+    The players of a restored snapshot. Each character stays encoded until it
+    is first looked up; players added later are held as usual. A player whose
+    data turns out to be corrupt is reported and dropped when looked up.
+    """
+
+    def __init__(self, blobs: memoryview, spans: Dict[str, Tuple[int, int]]):
+        self._blobs = blobs
+        self._pending = dict(spans)
+        # One dict keeps insertion order for decoded and pending players alike.
+        self._players: Dict[str, Optional[Character]] = {name: None for name in spans}
+
+    def is_pending(self, name: str) -> bool:
+        return name in self._pending
+
+    def raw(self, name: str) -> bytes:
+        offset, length = self._pending[name]
+        return bytes(self._blobs[offset:offset + length])
+
+    def __getitem__(self, name: str) -> Character:
+        character = self._players[name]
+        if character is None:
+            try:
+                character = decode_character(self.raw(name))
+            except SnapshotError as e:
+                print(f"Warning: Player '{name}' in the snapshot is corrupt and was dropped ({e}).")
+                del self[name]
+                raise KeyError(name) from e
+            self._players[name] = character
+            del self._pending[name]
+        return character
+
+    def __setitem__(self, name: str, character: Character):
+        self._pending.pop(name, None)
+        self._players[name] = character
+
+    def __delitem__(self, name: str):
+        del self._players[name]
+        self._pending.pop(name, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._players)
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def __contains__(self, name) -> bool:
+        return name in self._players
+
+    def __repr__(self) -> str:
+        return f"SnapshotPlayers({list(self._players)}, pending={len(self._pending)})"
+
+
+def encode_character(character: Character) -> bytes:
+    """Encodes a character as name, system and four length-prefixed sections."""
+    out = bytearray()
+    _put_str(out, character.name)
+    _put_str(out, character.system)
+
+    out += _U32.pack(len(character.strings))
+    for key, value in character.strings.items():
+        _put_str(out, key)
+        _put_value(out, value)
+
+    for section in (character.stats, character.skills):
+        out += _U32.pack(len(section))
+        for key, value in section.items():
+            _put_str(out, key)
+            _put_value(out, value)
+
+    out += _U32.pack(len(character.counts))
+    for key, (current, maximum) in character.counts.items():
+        _put_str(out, key)
+        _put_value(out, current)
+        _put_value(out, maximum)
+    return bytes(out)
+
+
+def decode_character(data: bytes) -> Character:
+    reader = _Reader(data)
+    name = reader.str()
+    system = reader.str()
+    strings = {reader.str(): reader.value() for _ in range(reader.unpack(_U32)[0])}
+    stats = {reader.str(): reader.value() for _ in range(reader.unpack(_U32)[0])}
+    skills = {reader.str(): reader.value() for _ in range(reader.unpack(_U32)[0])}
+    counts = {reader.str(): (reader.value(), reader.value()) for _ in range(reader.unpack(_U32)[0])}
+    return Character(name=name, system=system, strings=strings, stats=stats, skills=skills, counts=counts)
+
+
+def _node_path(node) -> List[str]:
+    """Returns the names from below the root down to node."""
+    path = []
+    while node.parent is not None:
+        path.append(node.name)
+        node = node.parent
+    return path[::-1]
+
+
+def _put_str(out: bytearray, value: Optional[str]):
+    if value is None:
+        out += _U32.pack(_NONE)
+        return
+    encoded = value.encode("utf-8")
+    out += _U32.pack(len(encoded))
+    out += encoded
+
+
+def _put_value(out: bytearray, value):
+    """Writes a tagged value: b"i" int, b"f" float, b"s" string, b"n" None."""
+    if value is None:
+        out += b"n"
+    elif isinstance(value, int) and -(1 << 63) <= value < (1 << 63):
+        out += b"i" + _I64.pack(value)
+    elif isinstance(value, float):
+        out += b"f" + _F64.pack(value)
+    else:
+        out += b"s"
+        _put_str(out, str(value))
+
+
+class _Reader:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def unpack(self, fmt: struct.Struct) -> tuple:
+        try:
+            values = fmt.unpack_from(self.data, self.pos)
+        except struct.error as e:
+            raise SnapshotError(f"Corrupt snapshot: {e}") from e
+        self.pos += fmt.size
+        return values
+
+    def str(self) -> Optional[str]:
+        (length,) = self.unpack(_U32)
+        if length == _NONE:
+            return None
+        end = self.pos + length
+        if end > len(self.data):
+            raise SnapshotError("Corrupt snapshot: string runs past the end.")
+        try:
+            value = bytes(self.data[self.pos:end]).decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise SnapshotError(f"Corrupt snapshot: {e}") from e
+        self.pos = end
+        return value
+
+    def value(self):
+        tag = bytes(self.data[self.pos:self.pos + 1])
+        self.pos += 1
+        if tag == b"i":
+            return self.unpack(_I64)[0]
+        if tag == b"f":
+            return self.unpack(_F64)[0]
+        if tag == b"s":
+            return self.str()
+        if tag == b"n":
+            return None
+        raise SnapshotError(f"Corrupt snapshot: unknown value tag {tag!r}.")
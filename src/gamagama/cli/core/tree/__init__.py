@@ -4,4 +4,4 @@ from .map_branch import MapBranch
 from .seq_branch import SeqBranch
 from .leaf import Leaf
 from .tree import Tree
-from .visitor import NodeVisitor
+from .visitor import NodeVisitor, visits
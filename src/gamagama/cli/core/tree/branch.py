@@ -1,18 +1,67 @@
-from dataclasses import dataclass
-from typing import Iterator, Optional
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
 from .node import Node
 
 
+class _Version:
+    """
+    The structure version shared by the branches of one tree. When a subtree
+    is attached, its counter forwards to the tree's rather than every branch
+    in it being updated.
+    """
+
+    __slots__ = ("value", "forward")
+
+    def __init__(self):
+        self.value = 0
+        self.forward: Optional["_Version"] = None
+
+    def resolve(self) -> "_Version":
+        """Returns the counter this one forwards to, shortening the chain for next time."""
+        root = self
+        while root.forward is not None:
+            root = root.forward
+        counter = self
+        while counter.forward is not None and counter.forward is not root:
+            counter.forward, counter = root, counter.forward
+        return root
+
+
 @dataclass(eq=False)
 class Branch(Node):
     """Abstract base for nodes that contain children."""
 
+    # Sorted child names for prefix lookups, built on first use.
+    _sorted_names: Optional[List[str]] = field(default=None, init=False, repr=False)
+    # Shared with the rest of the tree and bumped whenever a branch in it gains a child (see Tree.version).
+    _counter: Optional[_Version] = field(default=None, init=False, repr=False)
+
     def add_child(self, node: Node):
         """Adds a child node, enforcing single-parent rules."""
         if node.parent is not None:
             raise ValueError(f"Node '{node.name}' already has a parent: '{node.parent.name}'.")
         self._add_child_impl(node)
         node.parent = self
+        self._sorted_names = None
+
+        counter = self.version_counter()
+        if isinstance(node, Branch):
+            if node._counter is None:
+                node._counter = counter
+            else:
+                subtree = node._counter.resolve()
+                if subtree is not counter:
+                    subtree.forward = counter
+        counter.value += 1
+
+    def version_counter(self) -> _Version:
+        """Returns the structure version counter of the tree this branch is in."""
+        if self._counter is None:
+            self._counter = _Version()
+        else:
+            self._counter = self._counter.resolve()
+        return self._counter
 
     def _add_child_impl(self, node: Node):
         """Subclasses implement specific storage logic."""
@@ -22,6 +71,16 @@ class Branch(Node):
         """Retrieves a child node by key, if supported."""
         return None
 
+    def names_with_prefix(self, prefix: str) -> List[str]:
+        """Returns the sorted names of the children starting with prefix."""
+        names = self._sorted_names
+        if names is None:
+            names = self._sorted_names = sorted(node.name for node in self if node.name)
+        start = end = bisect_left(names, prefix)
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+        return names[start:end]
+
     def __iter__(self) -> Iterator[Node]:
         """Subclasses must yield children."""
         raise NotImplementedError
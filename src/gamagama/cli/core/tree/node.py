@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 
 @dataclass(eq=False)
@@ -7,3 +7,6 @@ class Node:
     """Base class for all nodes in the tree."""
     name: str
     parent: Optional['Node'] = None
+
+    # Nodes of an indexed class can be looked up by name with Tree.find_indexed().
+    indexed: ClassVar[bool] = False
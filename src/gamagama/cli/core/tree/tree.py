@@ -1,9 +1,13 @@
-from typing import List, Any, Optional, Iterator
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from .node import Node
 from .branch import Branch
 from .map_branch import MapBranch
 from .leaf import Leaf
 
+# Memoized resolve_prefix() results kept per tree.
+RESOLVE_CACHE_SIZE = 1024
+
 
 class Tree:
     """A generic hierarchical structure."""
@@ -11,6 +15,22 @@ class Tree:
     def __init__(self, root_name: str = "root"):
         # The default Tree implementation uses a MapBranch (named nodes)
         self.root = MapBranch(name=root_name)
+        # Name -> node for nodes whose class is 'indexed' (e.g. domains)
+        self._index: Dict[str, Node] = {}
+        # The version at which the whole tree was last scanned for indexed nodes
+        self._scanned_version: Optional[int] = None
+        self._resolved: "OrderedDict[Tuple[Node, Tuple[str, ...]], Tuple[Optional[Node], int]]" = OrderedDict()
+        self._resolved_version = self.version
+        self._preorder: Optional[Tuple[Node, ...]] = None
+        self._preorder_version = self.version
+
+    @property
+    def version(self) -> int:
+        """
+        Changes whenever the structure of this tree changes (a branch in it
+        gains a child), so caches built from the tree know to rebuild.
+        """
+        return self.root.version_counter().value
 
     def insert(self, path: List[str], data: Any) -> Node:
         """
@@ -55,9 +75,101 @@ class Tree:
         else:
             node = Leaf(name=leaf_name, data=data)
 
+        indexed = self._indexed_nodes(node)
         current.add_child(node)
+        self._index.update(indexed)
+        return node
+
+    def attach(self, parent: Branch, node: Node) -> Node:
+        """
+        Adds 'node' (and any subtree under it) as a child of 'parent', which
+        must already be in this tree, keeping the name index up to date.
+        Returns the attached Node.
+        """
+        indexed = self._indexed_nodes(node)
+        parent.add_child(node)
+        self._index.update(indexed)
+        return node
+
+    def resolve_prefix(self, start_node: Node, parts: Sequence[str]) -> Tuple[Optional[Node], int]:
+        """
+        Resolves as many leading 'parts' as possible. The first name bubbles up
+        from start_node through its ancestors; each later name must be a child
+        of the node before it. Returns the node reached and how many parts it
+        used, (start_node, 0) for no parts, or (None, 0) if the first name is
+        not found. Results are memoized until the tree's version changes.
+        """
+        if self._resolved_version != self.version:
+            self._resolved.clear()
+            self._resolved_version = self.version
+
+        key = (start_node, tuple(parts))
+        result = self._resolved.get(key)
+        if result is not None:
+            self._resolved.move_to_end(key)
+            return result
+
+        result = self._resolve_uncached(start_node, parts)
+        self._resolved[key] = result
+        if len(self._resolved) > RESOLVE_CACHE_SIZE:
+            self._resolved.popitem(last=False)
+        return result
+
+    def resolve(self, start_node: Node, path: Sequence[str]) -> Optional[Node]:
+        """Resolves the whole of 'path' as resolve_prefix() does, or returns None."""
+        node, used = self.resolve_prefix(start_node, path)
+        return node if used == len(path) else None
+
+    def _resolve_uncached(self, start_node: Node, parts: Sequence[str]) -> Tuple[Optional[Node], int]:
+        if not parts:
+            return start_node, 0
+
+        current = start_node
+        while current is not None:
+            child = current.get_child(parts[0]) if isinstance(current, Branch) else None
+            if child is not None:
+                break
+            current = current.parent
+        else:
+            return None, 0
+
+        used = 1
+        for part in parts[1:]:
+            next_child = child.get_child(part) if isinstance(child, Branch) else None
+            if next_child is None:
+                break
+            child = next_child
+            used += 1
+        return child, used
+
+    def find_indexed(self, name: str) -> Optional[Node]:
+        """Returns the indexed node (see Node.indexed) with this name, or None."""
+        node = self._index.get(name)
+        if node is None and self._scanned_version != self.version:
+            # Nodes attached with Branch.add_child bypass the index. Pick them
+            # all up with one scan per structure change, so that later misses
+            # are answered from the index alone.
+            for n in self.preorder():
+                if n.indexed:
+                    self._index.setdefault(n.name, n)
+            self._scanned_version = self.version
+            node = self._index.get(name)
         return node
 
+    def _indexed_nodes(self, node: Node) -> Dict[str, Node]:
+        """
+        Returns the indexed nodes in the subtree at 'node' by name. Raises
+        ValueError, before anything is attached, if a name is already taken.
+        """
+        found: Dict[str, Node] = {}
+        for n in self.walk(node):
+            if n.indexed:
+                existing = found.get(n.name) or self._index.get(n.name)
+                if existing is not None and existing is not n:
+                    raise ValueError(f"A node named '{n.name}' is already indexed in this tree.")
+                found[n.name] = n
+        return found
+
     def get(self, path: List[str]) -> Optional[Node]:
         """Retrieves a Node at the specified path, or None."""
         current = self.root
@@ -73,11 +185,29 @@ class Tree:
     def walk(self, start_node: Node = None) -> Iterator[Node]:
         """
         Yields nodes in the subtree starting at start_node (default: root).
-        Traversal is Depth-First Pre-Order, respecting insertion order.
+        Traversal is Depth-First Pre-Order, respecting insertion order. It uses
+        an explicit stack, so deep trees cost O(n) and do not hit the recursion limit.
         """
-        node = start_node or self.root
+        node = start_node if start_node is not None else self.root
         yield node
 
-        if isinstance(node, Branch):
-            for child in node:
-                yield from self.walk(child)
+        # One iterator per open branch on the path down to the current node
+        stack = [iter(node)] if isinstance(node, Branch) else []
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
+            yield child
+            if isinstance(child, Branch):
+                stack.append(iter(child))
+
+    def preorder(self) -> Tuple[Node, ...]:
+        """
+        Returns every node in the tree in walk() order. The tuple is cached
+        until the tree's version changes.
+        """
+        if self._preorder is None or self._preorder_version != self.version:
+            self._preorder = tuple(self.walk())
+            self._preorder_version = self.version
+        return self._preorder
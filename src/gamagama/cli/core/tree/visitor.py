@@ -1,27 +1,74 @@
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .node import Node
 
 
+def visits(*node_classes: type) -> Callable:
+    """
+    Registers the decorated visitor method for the given node classes, as an
+    alternative to naming it 'visit_ClassName':
+
+        @visits(MapBranch, SeqBranch)
+        def visit_branch(self, node): ...
+    """
+    def decorator(method: Callable) -> Callable:
+        method._visits = getattr(method, "_visits", ()) + node_classes
+        return method
+    return decorator
+
+
 class NodeVisitor:
     """
     A generic Visitor class that uses reflection to dispatch methods.
-    
-    It looks for a method named 'visit_ClassName' (e.g., 'visit_MapBranch').
-    It walks the Method Resolution Order (MRO) to find the most specific handler.
+
+    It looks for a method named 'visit_ClassName' (e.g., 'visit_MapBranch'),
+    or one registered for the class with @visits.
+    It walks the node's Method Resolution Order (MRO) to find the most specific
+    handler, and for each node class the visitor's MRO, so the most derived
+    visitor class that handles it wins, however it is declared.
     If not found, it calls 'generic_visit'.
+
+    The name of the handler found for each node class is kept in a dispatch
+    table per visitor class, so the MRO is only searched the first time a
+    class is seen. The handler is looked up by that name on the visitor, so
+    static and class methods and per-instance overrides work as usual.
     """
 
+    # Node class -> handler attribute name (None: use generic_visit).
+    # Each subclass gets its own table.
+    _dispatch: Dict[type, Optional[str]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {}
+
     def visit(self, node: 'Node') -> Any:
         """Visit a node, dispatching to the most specific visitor method found."""
-        for cls in node.__class__.__mro__:
-            method_name = 'visit_' + cls.__name__
-            visitor = getattr(self, method_name, None)
-            if visitor:
-                return visitor(node)
-        
-        return self.generic_visit(node)
+        table = type(self)._dispatch
+        node_class = node.__class__
+        try:
+            name = table[node_class]
+        except KeyError:
+            name = table[node_class] = type(self)._find_handler(node_class)
+
+        if name is None:
+            return self.generic_visit(node)
+        return getattr(self, name)(node)
+
+    @classmethod
+    def _find_handler(cls, node_class: type) -> Optional[str]:
+        """Returns the attribute name of the handler for node_class, or None."""
+        for node_klass in node_class.__mro__:
+            name = 'visit_' + node_klass.__name__
+            for klass in cls.__mro__:
+                members = vars(klass)
+                for attr, member in members.items():
+                    if node_klass in getattr(member, "_visits", ()):
+                        return attr
+                if members.get(name):
+                    return name
+        return None
 
     def generic_visit(self, node: 'Node') -> Any:
         """Called if no explicit visitor function exists for a node."""
@@ -1,13 +1,115 @@
-from importlib.metadata import entry_points
+import json
+import os
+import sys
+from collections.abc import Mapping
+from importlib.metadata import EntryPoint, entry_points
+from pathlib import Path
+from typing import Dict, List, Optional
+
 from gamagama.core import GameSystem
 from .generic import GenericSystem
 
+ENTRY_POINT_GROUP = "gamagama.systems"
+
+
+def default_index_path() -> Path:
+    """Returns the default location of the cached system entry-point index."""
+    return Path.home() / ".cache" / "gg-cli" / "systems.json"
+
+
+class SystemRegistry(Mapping):
+    """
+    A lazy mapping of system name -> GameSystem class.
+
+    Names come from an index of the 'gamagama.systems' entry points, and a
+    plugin system is only imported when it is first looked up. If
+    'index_path' is set, the index is persisted there and reused until the
+    installed distributions change.
+    """
+
+    def __init__(self, builtins: Dict[str, type], index_path: Optional[Path] = None):
+        self.builtins = dict(builtins)
+        self.index_path = index_path
+        self._index: Optional[Dict[str, str]] = None
+        self._loaded: Dict[str, type] = {}
+
+    def __getitem__(self, name: str) -> type:
+        index = self._get_index()
+        if name in index:
+            if name not in self._loaded:
+                ep = EntryPoint(name=name, value=index[name], group=ENTRY_POINT_GROUP)
+                self._loaded[name] = ep.load()
+            return self._loaded[name]
+        return self.builtins[name]
+
+    def __contains__(self, name) -> bool:
+        return name in self._get_index() or name in self.builtins
+
+    def __iter__(self):
+        index = self._get_index()
+        yield from (name for name in self.builtins if name not in index)
+        yield from index
+
+    def __len__(self) -> int:
+        return len(set(self.builtins) | set(self._get_index()))
+
+    def invalidate(self):
+        """Forgets the in-memory index so the next lookup re-reads it."""
+        self._index = None
+
+    def _get_index(self) -> Dict[str, str]:
+        if self._index is None:
+            self._index = _load_index(self.index_path)
+        return self._index
+
+
+def _load_index(index_path: Optional[Path]) -> Dict[str, str]:
+    """Returns the name -> entry point value index, from the cache file when still valid."""
+    fingerprint = _distributions_fingerprint()
+
+    if index_path is not None:
+        try:
+            with open(index_path, "r") as f:
+                data = json.load(f)
+            if data.get("fingerprint") == fingerprint:
+                return data["systems"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    index = {ep.name: ep.value for ep in entry_points(group=ENTRY_POINT_GROUP)}
+
+    if index_path is not None:
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({"fingerprint": fingerprint, "systems": index}, f)
+            os.replace(tmp_path, index_path)
+        except OSError:
+            pass
+
+    return index
+
+
+def _distributions_fingerprint() -> List[List]:
+    """
+    Identifies the set of installed distributions without reading their metadata.
+    Installing or removing a distribution changes the mtime of the sys.path
+    directory its metadata lives in.
+    """
+    fingerprint = []
+    for entry in sys.path:
+        # The working directory ('') holds no installed distributions.
+        try:
+            mtime = os.stat(entry).st_mtime_ns if entry else None
+        except OSError:
+            mtime = None
+        fingerprint.append([entry, mtime])
+    return fingerprint
+
 
-def load_systems():
-    systems = {"generic": GenericSystem}
-    for ep in entry_points(group="gamagama.systems"):
-        systems[ep.name] = ep.load()
-    return systems
+def load_systems(index_path: Optional[Path] = None) -> SystemRegistry:
+    return SystemRegistry({"generic": GenericSystem}, index_path=index_path)
 
 
 SYSTEMS = load_systems()
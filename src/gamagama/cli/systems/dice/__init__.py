@@ -1,3 +1,20 @@
 from gamagama.core import DiceEngine
 
-__all__ = ["DiceEngine"]
+from .expression import (
+    ConstantTerm,
+    DiceExpression,
+    DiceSpecError,
+    DiceTerm,
+    RollResult,
+    compile_spec,
+)
+
+__all__ = [
+    "DiceEngine",
+    "ConstantTerm",
+    "DiceExpression",
+    "DiceSpecError",
+    "DiceTerm",
+    "RollResult",
+    "compile_spec",
+]
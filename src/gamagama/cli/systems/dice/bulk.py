@@ -0,0 +1,121 @@
+import math
+import operator
+import random
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .expression import DiceExpression
+from .explode import DEFAULT_EXPLODE_DEPTH, ExplosionStats, explode_array, explode_list
+
+_NUMPY = None
+
+
+def _numpy():
+    """Imports NumPy on first use. Returns None if it is not installed."""
+    global _NUMPY
+    if _NUMPY is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _NUMPY = numpy
+    return _NUMPY or None
+
+
+@dataclass(frozen=True)
+class RollSummary:
+    """Summary statistics for a batch of rolled totals."""
+
+    count: int
+    mean: float
+    stdev: float
+    minimum: int
+    maximum: int
+
+
+def roll_many(
+    expression: DiceExpression,
+    times: int,
+    use_numpy: Optional[bool] = None,
+    rng=None,
+    max_depth: int = DEFAULT_EXPLODE_DEPTH,
+    stats: Optional[ExplosionStats] = None,
+):
+    """
+    Rolls the expression 'times' times and returns the totals.
+
+    Each dice group is drawn in a single batch instead of die by die. NumPy is
+    used when available (returning an array); otherwise a pure-Python path
+    based on random.choices is used (returning a list). Pass use_numpy=False
+    to force the pure-Python path, and 'rng' (a random.Random) to seed it.
+
+    Exploding chains stop after 'max_depth' rerolls; pass an ExplosionStats
+    to collect chain-length statistics.
+    """
+    np = _numpy() if use_numpy is None or use_numpy else None
+    if use_numpy and np is None:
+        raise RuntimeError("NumPy is not installed.")
+
+    if np is not None:
+        return _roll_many_numpy(np, expression, times, max_depth, stats)
+    return _roll_many_python(expression, times, rng or random, max_depth, stats)
+
+
+def summarize(totals) -> RollSummary:
+    """Computes summary statistics for the totals returned by roll_many."""
+    return summarize_counts(count_totals(totals))
+
+
+def count_totals(totals) -> Dict[int, int]:
+    """Returns a mapping of total -> number of occurrences."""
+    np = _numpy()
+    if np is not None and isinstance(totals, np.ndarray):
+        values, counts = np.unique(totals, return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist()))
+    return dict(Counter(totals))
+
+
+def summarize_counts(counts: Dict[int, int]) -> RollSummary:
+    """Computes summary statistics from a total -> occurrences mapping."""
+    n = sum(counts.values())
+    mean = sum(value * k for value, k in counts.items()) / n
+    variance = sum(k * (value - mean) ** 2 for value, k in counts.items()) / n
+    return RollSummary(
+        count=n,
+        mean=mean,
+        stdev=math.sqrt(variance),
+        minimum=min(counts),
+        maximum=max(counts),
+    )
+
+
+def _roll_many_python(expression, times, rng, max_depth, stats) -> List[int]:
+    totals = [expression.modifier] * times
+    combine = {1: operator.add, -1: operator.sub}
+
+    for term in expression.dice:
+        faces = range(1, term.sides + 1)
+        for _ in range(term.count):
+            column = rng.choices(faces, k=times)
+            if term.explode:
+                explode_list(column, term.sides, lambda k: rng.choices(faces, k=k), max_depth, stats)
+            totals = list(map(combine[term.sign], totals, column))
+
+    return totals
+
+
+def _roll_many_numpy(np, expression, times, max_depth, stats):
+    gen = np.random.default_rng()
+    totals = np.full(times, expression.modifier, dtype=np.int64)
+
+    for term in expression.dice:
+        if term.count == 0:
+            continue
+        draws = gen.integers(1, term.sides + 1, size=(term.count, times), dtype=np.int64)
+        if term.explode:
+            draw = lambda k: gen.integers(1, term.sides + 1, size=k, dtype=np.int64)
+            explode_array(np, draws, term.sides, draw, max_depth, stats)
+        totals += term.sign * draws.sum(axis=0)
+
+    return totals
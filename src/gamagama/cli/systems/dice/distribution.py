@@ -0,0 +1,135 @@
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, Tuple
+
+from .bulk import _numpy
+from .explode import DEFAULT_EXPLODE_DEPTH
+from .expression import DiceExpression
+
+# Exploding chains are modelled up to the depth cutoff, or until the probability
+# of reaching the next reroll drops below this.
+TAIL_EPSILON = 1e-12
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """An exact discrete distribution over consecutive integers starting at 'offset'."""
+
+    offset: int
+    probabilities: Tuple[float, ...]
+
+    @property
+    def minimum(self) -> int:
+        return self.offset
+
+    @property
+    def maximum(self) -> int:
+        return self.offset + len(self.probabilities) - 1
+
+    def items(self) -> Iterator[Tuple[int, float]]:
+        """Yields (value, probability) pairs in ascending order of value."""
+        for i, p in enumerate(self.probabilities):
+            yield self.offset + i, p
+
+    @property
+    def mean(self) -> float:
+        return sum(value * p for value, p in self.items())
+
+    @property
+    def variance(self) -> float:
+        mean = self.mean
+        return sum(p * (value - mean) ** 2 for value, p in self.items())
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def percentile(self, q: float) -> int:
+        """Returns the smallest value whose cumulative probability reaches q (0 < q <= 1)."""
+        cumulative = 0.0
+        for value, p in self.items():
+            cumulative += p
+            if cumulative >= q - 1e-12:
+                return value
+        return self.maximum
+
+    def convolve(self, other: "Distribution") -> "Distribution":
+        """Returns the distribution of the sum of two independent outcomes."""
+        return Distribution(
+            offset=self.offset + other.offset,
+            probabilities=_convolve(self.probabilities, other.probabilities),
+        )
+
+    def negate(self) -> "Distribution":
+        return Distribution(offset=-self.maximum, probabilities=self.probabilities[::-1])
+
+    def shift(self, amount: int) -> "Distribution":
+        return Distribution(offset=self.offset + amount, probabilities=self.probabilities)
+
+
+def distribution(expression: DiceExpression, max_depth: int = DEFAULT_EXPLODE_DEPTH) -> Distribution:
+    """Computes the exact outcome distribution of a compiled dice expression."""
+    result = Distribution(offset=expression.modifier, probabilities=(1.0,))
+    for term in expression.dice:
+        depth = explode_depth(term.sides, max_depth) if term.explode else 0
+        group = group_distribution(term.count, term.sides, term.explode, depth)
+        result = result.convolve(group if term.sign > 0 else group.negate())
+    return result
+
+
+def explode_depth(sides: int, max_depth: int) -> int:
+    """The number of rerolls to model per die before the chain's tail becomes negligible."""
+    depth = 0
+    tail = 1.0 / sides
+    while depth < max_depth and tail >= TAIL_EPSILON:
+        depth += 1
+        tail /= sides
+    return depth
+
+
+@lru_cache(maxsize=256)
+def group_distribution(count: int, sides: int, explode: bool = False, depth: int = 0) -> Distribution:
+    """The distribution of the sum of 'count' identical dice, memoized per group."""
+    if count == 0:
+        return Distribution(offset=0, probabilities=(1.0,))
+    if count == 1:
+        return die_distribution(sides, explode, depth)
+
+    half = count // 2
+    left = group_distribution(half, sides, explode, depth)
+    right = group_distribution(count - half, sides, explode, depth)
+    return left.convolve(right)
+
+
+def die_distribution(sides: int, explode: bool = False, depth: int = 0) -> Distribution:
+    """
+    The distribution of a single die. An exploding die rerolls its maximum at
+    most 'depth' times; the last reroll in the chain is kept as rolled.
+    """
+    face = 1.0 / sides
+    if not explode or depth == 0:
+        return Distribution(offset=1, probabilities=(face,) * sides)
+
+    probabilities = []
+    reach = 1.0  # Probability of the chain reaching this reroll.
+    for _ in range(depth):
+        probabilities.extend([reach * face] * (sides - 1))
+        probabilities.append(0.0)  # A maximum here always explodes further.
+        reach *= face
+    probabilities.extend([reach * face] * sides)
+    return Distribution(offset=1, probabilities=tuple(probabilities))
+
+
+def _convolve(a, b) -> Tuple[float, ...]:
+    np = _numpy()
+    if np is not None:
+        return tuple(np.convolve(a, b).tolist())
+
+    result = [0.0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if not x:
+            continue
+        for j, y in enumerate(b):
+            result[i + j] += x * y
+    return tuple(result)
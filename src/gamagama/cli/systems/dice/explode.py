@@ -0,0 +1,101 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+# Exploding chains are cut off after this many rerolls per die.
+DEFAULT_EXPLODE_DEPTH = 20
+
+
+@dataclass
+class ExplosionStats:
+    """Chain-length statistics collected while evaluating exploding dice."""
+
+    dice: int = 0
+    capped: int = 0
+    # reached[d - 1] is the number of dice whose chain reached at least d rerolls.
+    reached: List[int] = field(default_factory=list)
+
+    def record_step(self, depth: int, live: int):
+        """Records that 'live' dice are being rerolled for the depth-th time."""
+        if len(self.reached) < depth:
+            self.reached.append(0)
+        self.reached[depth - 1] += live
+
+    @property
+    def exploded(self) -> int:
+        """Number of dice that exploded at least once."""
+        return self.reached[0] if self.reached else 0
+
+    @property
+    def longest_chain(self) -> int:
+        return len(self.reached)
+
+    @property
+    def mean_chain(self) -> float:
+        """Mean number of rerolls per die."""
+        return sum(self.reached) / self.dice if self.dice else 0.0
+
+    def chain_lengths(self) -> Dict[int, int]:
+        """Returns a mapping of chain length (rerolls, >= 1) -> number of dice."""
+        lengths = {}
+        for depth, count in enumerate(self.reached, start=1):
+            deeper = self.reached[depth] if depth < len(self.reached) else 0
+            if count - deeper:
+                lengths[depth] = count - deeper
+        return lengths
+
+
+def explode_list(
+    column: List[int],
+    sides: int,
+    draw: Callable[[int], List[int]],
+    max_depth: int = DEFAULT_EXPLODE_DEPTH,
+    stats: Optional[ExplosionStats] = None,
+) -> List[int]:
+    """
+    Explodes a column of die faces in place and returns it.
+
+    Rather than recursing per die, every die that is still exploding is
+    rerolled in one batch per chain step via draw(k). Chains stop after
+    'max_depth' rerolls; the last reroll is kept as rolled.
+    """
+    live = [i for i, value in enumerate(column) if value == sides]
+    depth = 0
+    while live and depth < max_depth:
+        depth += 1
+        if stats is not None:
+            stats.record_step(depth, len(live))
+        rerolls = draw(len(live))
+        for i, value in zip(live, rerolls):
+            column[i] += value
+        live = [i for i, value in zip(live, rerolls) if value == sides]
+
+    if stats is not None:
+        stats.dice += len(column)
+        stats.capped += len(live)
+    return column
+
+
+def explode_array(
+    np,
+    draws,
+    sides: int,
+    draw,
+    max_depth: int = DEFAULT_EXPLODE_DEPTH,
+    stats: Optional[ExplosionStats] = None,
+):
+    """The NumPy counterpart of explode_list, for an integer array of any shape."""
+    flat = draws.reshape(-1)
+    live = np.flatnonzero(flat == sides)
+    depth = 0
+    while live.size and depth < max_depth:
+        depth += 1
+        if stats is not None:
+            stats.record_step(depth, int(live.size))
+        rerolls = draw(live.size)
+        flat[live] += rerolls
+        live = live[rerolls == sides]
+
+    if stats is not None:
+        stats.dice += int(flat.size)
+        stats.capped += int(live.size)
+    return draws
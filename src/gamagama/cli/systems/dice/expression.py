@@ -0,0 +1,119 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Tuple, Union
+
+# Matches one term of a dice expression, with its optional leading operator:
+# either a dice group ([count]d[sides][!]) or a flat number.
+_TERM_RE = re.compile(r"([+-]?)(?:(\d*)d(\d+|%)(!?)|(\d+))", re.IGNORECASE)
+
+COMPILE_CACHE_SIZE = 256
+
+
+class DiceSpecError(ValueError):
+    """Raised when a dice specification cannot be compiled."""
+
+
+@dataclass(frozen=True)
+class DiceTerm:
+    """A group of identical dice, e.g. '3d6!'. A sign of -1 subtracts the group."""
+
+    count: int
+    sides: int
+    explode: bool = False
+    sign: int = 1
+
+
+@dataclass(frozen=True)
+class ConstantTerm:
+    """A flat (signed) modifier, e.g. '+5' or '-2'."""
+
+    value: int
+
+
+Term = Union[DiceTerm, ConstantTerm]
+
+
+@dataclass(frozen=True)
+class RollResult:
+    """The outcome of evaluating a DiceExpression once."""
+
+    total: int
+    rolls: List[int]
+
+
+@dataclass(frozen=True)
+class DiceExpression:
+    """A compiled dice specification, ready to be evaluated many times."""
+
+    spec: str
+    terms: Tuple[Term, ...]
+    dice: Tuple[DiceTerm, ...]
+    modifier: int
+
+    @property
+    def explodes(self) -> bool:
+        """True if any dice group in the expression explodes."""
+        return any(term.explode for term in self.dice)
+
+    def evaluate(self, engine) -> RollResult:
+        """Rolls every die through the given DiceEngine and sums the result."""
+        rolls = []
+        total = self.modifier
+        for term in self.dice:
+            for _ in range(term.count):
+                value = engine.roll(term.sides, term.explode)
+                rolls.append(value)
+                total += term.sign * value
+        return RollResult(total=total, rolls=rolls)
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_spec(spec: str) -> DiceExpression:
+    """
+    Compiles a dice specification such as '2d6+1d4+3' into a DiceExpression.
+    Results are cached, so repeated specs are only parsed once.
+    Raises DiceSpecError if the specification is invalid.
+    """
+    terms = []
+    pos = 0
+    while pos < len(spec):
+        match = _TERM_RE.match(spec, pos)
+        if not match or match.end() == pos:
+            raise DiceSpecError("Invalid dice specification.")
+
+        sign_str, count_str, sides_str, explode_str, constant_str = match.groups()
+
+        # The first term has no operator; every following term needs one.
+        if bool(sign_str) != bool(terms):
+            raise DiceSpecError("Invalid dice specification.")
+        sign = -1 if sign_str == "-" else 1
+
+        if constant_str is not None:
+            terms.append(ConstantTerm(value=sign * int(constant_str)))
+        else:
+            terms.append(_compile_dice_term(count_str, sides_str, explode_str, sign))
+
+        pos = match.end()
+
+    dice = tuple(term for term in terms if isinstance(term, DiceTerm))
+    if not dice:
+        raise DiceSpecError("Invalid dice specification.")
+
+    modifier = sum(term.value for term in terms if isinstance(term, ConstantTerm))
+
+    return DiceExpression(spec=spec, terms=tuple(terms), dice=dice, modifier=modifier)
+
+
+def _compile_dice_term(count_str, sides_str, explode_str, sign) -> DiceTerm:
+    count = int(count_str) if count_str else 1
+    sides = 100 if sides_str == "%" else int(sides_str)
+    explode = bool(explode_str)
+
+    if sides == 0:
+        raise DiceSpecError("Cannot roll a 0-sided die.")
+
+    if sides == 1 and explode:
+        raise DiceSpecError("Cannot explode a 1-sided die (infinite loop).")
+
+    return DiceTerm(count=count, sides=sides, explode=explode, sign=sign)
@@ -0,0 +1,105 @@
+import json
+import os
+
+from gamagama.cli.characters import CharacterCatalog, CharacterStore
+from gamagama.cli.characters.catalog import CATALOG_FILE
+
+
+def _write(path, data, mtime_ns=None):
+    path.write_text(json.dumps(data))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_catalog_lists_characters_without_loading(tmp_path):
+    _write(tmp_path / "gandalf.json", {"name": "Gandalf", "system": "rolemaster", "strings": {"race": "Maia"}})
+    _write(tmp_path / "frodo.json", {"name": "Frodo", "strings": {"race": "Hobbit"}})
+    (tmp_path / "broken.json").write_text("{")
+    (tmp_path / "notes.txt").write_text("")
+
+    catalog = CharacterCatalog(tmp_path)
+    entries = catalog.entries()
+
+    assert [e.name for e in entries] == ["frodo", "gandalf"]
+    assert entries[1].character_name == "Gandalf"
+    assert entries[1].system == "rolemaster"
+    assert entries[1].strings == {"race": "Maia"}
+    assert (tmp_path / CATALOG_FILE).exists()
+
+
+def test_catalog_search(tmp_path):
+    _write(tmp_path / "gandalf.json", {"name": "Gandalf", "strings": {"race": "Maia"}})
+    _write(tmp_path / "frodo.json", {"name": "Frodo", "strings": {"race": "Hobbit"}})
+
+    catalog = CharacterCatalog(tmp_path)
+
+    assert [e.name for e in catalog.search("hob")] == ["frodo"]
+    assert [e.name for e in catalog.search("GANDALF")] == ["gandalf"]
+
+
+def test_catalog_refresh_is_incremental(tmp_path, monkeypatch):
+    _write(tmp_path / "gandalf.json", {"name": "Gandalf"}, mtime_ns=1_000_000_000)
+    _write(tmp_path / "frodo.json", {"name": "Frodo"}, mtime_ns=1_000_000_000)
+    CharacterCatalog(tmp_path).refresh()
+
+    _write(tmp_path / "frodo.json", {"name": "Frodo Baggins"}, mtime_ns=2_000_000_000)
+    _write(tmp_path / "sam.json", {"name": "Sam"})
+    (tmp_path / "gandalf.json").unlink()
+
+    parsed = []
+    import gamagama.cli.characters.catalog as catalog_module
+    original = catalog_module._read_entry
+    monkeypatch.setattr(
+        catalog_module, "_read_entry",
+        lambda name, path, st: parsed.append(name) or original(name, path, st)
+    )
+
+    # A new catalog picks up the index file and only reads what changed.
+    entries = CharacterCatalog(tmp_path).refresh()
+
+    assert sorted(parsed) == ["frodo", "sam"]
+    assert sorted(entries) == ["frodo", "sam"]
+    assert entries["frodo"].character_name == "Frodo Baggins"
+
+
+def test_catalog_indexes_invalid_files_until_they_change(tmp_path, monkeypatch):
+    _write(tmp_path / "frodo.json", {"name": "Frodo"})
+    (tmp_path / "broken.json").write_text("{")
+    CharacterCatalog(tmp_path).refresh()
+
+    parsed = []
+    writes = []
+    import gamagama.cli.characters.catalog as catalog_module
+    original = catalog_module._read_entry
+    monkeypatch.setattr(
+        catalog_module, "_read_entry",
+        lambda name, path, st: parsed.append(name) or original(name, path, st)
+    )
+    monkeypatch.setattr(CharacterCatalog, "_write_index", lambda self: writes.append(self))
+
+    # The invalid file is remembered: nothing is parsed or rewritten.
+    catalog = CharacterCatalog(tmp_path)
+    assert catalog.names() == ["frodo"]
+    assert parsed == [] and writes == []
+
+    # Once it changes it is parsed again, and listed if it became valid.
+    _write(tmp_path / "broken.json", {"name": "Sam"}, mtime_ns=2_000_000_000)
+    assert catalog.names() == ["broken", "frodo"]
+    assert parsed == ["broken"]
+    assert len(writes) == 1
+
+
+def test_catalog_ignores_corrupt_index(tmp_path):
+    _write(tmp_path / "frodo.json", {"name": "Frodo"})
+    (tmp_path / CATALOG_FILE).write_text("not json")
+
+    assert CharacterCatalog(tmp_path).names() == ["frodo"]
+
+
+def test_store_catalog_follows_base_dir(tmp_path):
+    store = CharacterStore(base_dir=tmp_path)
+    assert store.catalog is store.catalog
+
+    store.base_dir = tmp_path / "other"
+    assert store.catalog.base_dir == tmp_path / "other"
+    assert store.catalog.names() == []
@@ -47,3 +47,96 @@ def test_character_from_dict_full():
     assert char.stats == {"strength": 75, "agility": 60}
     assert char.skills == {"channeling": 85, "perception": 70}
     assert char.counts == {"hit_points": (25, 45), "power_points": (12, 30)}
+
+
+def test_character_copy_is_independent():
+    char = Character.from_dict({"name": "Gimli", "stats": {"strength": 90}, "counts": {"hp": [30, 30]}})
+    clone = char.copy()
+
+    clone.stats["strength"] = 10
+    clone.counts["hp"] = (5, 30)
+
+    assert clone == Character.from_dict({"name": "Gimli", "stats": {"strength": 10}, "counts": {"hp": [5, 30]}})
+    assert char.stats == {"strength": 90}
+    assert char.counts == {"hp": (30, 30)}
+
+
+def test_character_is_slotted():
+    char = Character(name="Test")
+    assert not hasattr(char, "__dict__")
+
+
+def test_character_shares_key_layout():
+    a = Character.from_dict({"name": "A", "stats": {"strength": 1, "agility": 2}})
+    b = Character.from_dict({"name": "B", "stats": {"strength": 3, "agility": 4}})
+
+    assert a.stats._layout is b.stats._layout
+    assert a.stats._values.typecode == "i"
+
+
+def test_character_mappings_behave_like_dicts():
+    char = Character.from_dict({"name": "Aragorn", "stats": {"strength": 80}, "counts": {"hp": [40, 50]}})
+
+    char.stats["agility"] = 70
+    char.stats["strength"] = 85
+    del char.stats["agility"]
+    char.counts["hp"] = (30, 50)
+    char.skills["huge"] = 2 ** 40
+    char.skills["odd"] = 1.5
+
+    assert char.stats == {"strength": 85}
+    assert list(char.stats) == ["strength"]
+    assert char.counts["hp"] == (30, 50)
+    assert char.skills == {"huge": 2 ** 40, "odd": 1.5}
+    assert "strength" in char.stats and "agility" not in char.stats
+
+
+def test_character_assigned_mapping_is_compacted():
+    char = Character(name="Legolas")
+    char.stats = {"agility": 99}
+
+    assert char.stats == {"agility": 99}
+    assert type(char.stats) is not dict
+
+
+def test_character_to_dict_round_trip():
+    data = {
+        "name": "Boromir",
+        "system": "rolemaster",
+        "strings": {"race": "Human"},
+        "stats": {"strength": 90},
+        "skills": {"swords": 80},
+        "counts": {"hit_points": [60, 70]},
+    }
+
+    assert Character.from_dict(data).to_dict() == data
+
+
+def test_character_mapping_rejected_value_leaves_block_intact():
+    char = Character.from_dict({"name": "Gimli", "counts": {"hp": [10, 12]}})
+
+    char.counts["mp"] = (3, 4.5)
+    char.stats["big"] = 2 ** 40
+    char.stats["huge"] = 2 ** 70
+
+    assert char.counts == {"hp": (10, 12), "mp": (3, 4.5)}
+    assert char.stats == {"big": 2 ** 40, "huge": 2 ** 70}
+
+
+def test_character_booleans_round_trip():
+    data = {
+        "name": "Pippin",
+        "system": "generic",
+        "strings": {},
+        "stats": {"tall": False},
+        "skills": {"lore": 5, "sneaky": True},
+        "counts": {"hp": [True, 3]},
+    }
+
+    char = Character.from_dict(data)
+    char.stats["brave"] = True
+
+    assert char.skills["sneaky"] is True
+    assert char.stats["brave"] is True
+    assert char.to_dict()["skills"] == {"lore": 5, "sneaky": True}
+    assert char.to_dict()["counts"] == {"hp": [True, 3]}
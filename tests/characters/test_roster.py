@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+from gamagama.cli.characters import RosterStore, Store, open_store
+from gamagama.cli.characters import roster as roster_module
+
+CHARACTERS = [
+    {"name": "Grishnákh", "system": "rolemaster", "stats": {"strength": 60}},
+    {"name": "Uglúk", "counts": {"hit_points": [40, 45]}},
+    {"name": "Shagrat", "strings": {"race": "Orc"}},
+]
+
+
+@pytest.fixture(params=["jsonl", "array"])
+def roster_path(request, tmp_path):
+    if request.param == "jsonl":
+        path = tmp_path / "orcs.jsonl"
+        path.write_text("".join(json.dumps(c, ensure_ascii=False) + "\n" for c in CHARACTERS), encoding="utf-8")
+    else:
+        path = tmp_path / "orcs.json"
+        path.write_text("[\n  " + ",\n  ".join(json.dumps(c, ensure_ascii=False) for c in CHARACTERS) + "\n]\n", encoding="utf-8")
+    return path
+
+
+def test_roster_index_and_load(roster_path):
+    store = RosterStore(roster_path)
+
+    assert isinstance(store, Store)
+    assert store.find() == ["Grishnákh", "Shagrat", "Uglúk"]
+    assert store.load("Uglúk").counts == {"hit_points": (40, 45)}
+    assert store.load("Grishnákh").stats == {"strength": 60}
+
+
+def test_roster_load_not_found(roster_path, capsys):
+    assert RosterStore(roster_path).load("Gothmog") is None
+    assert "Character not found" in capsys.readouterr().out
+
+
+def test_roster_load_many(roster_path):
+    results = RosterStore(roster_path).load_many(["Shagrat", "Gothmog", "Grishnákh"])
+
+    assert [r.name for r in results] == ["Shagrat", "Gothmog", "Grishnákh"]
+    assert results[0].character.strings == {"race": "Orc"}
+    assert results[1].error == "not found"
+    assert results[2].character.system == "rolemaster"
+
+
+def test_roster_array_scan_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(roster_module, "CHUNK_SIZE", 7)
+    path = tmp_path / "big.json"
+    characters = [{"name": f"Orc ñ{i}", "stats": {"strength": i}} for i in range(50)]
+    path.write_text(json.dumps(characters, ensure_ascii=False), encoding="utf-8")
+
+    store = RosterStore(path)
+
+    assert len(store.find()) == 50
+    assert store.load("Orc ñ37").stats == {"strength": 37}
+
+
+def test_roster_index_file_reused(roster_path, monkeypatch):
+    RosterStore(roster_path).index()
+    assert RosterStore(roster_path).index_path.exists()
+
+    def fail(f):
+        raise AssertionError("roster was rescanned")
+    monkeypatch.setattr(roster_module, "_scan_records", fail)
+
+    assert RosterStore(roster_path).load("Shagrat").name == "Shagrat"
+
+
+def test_roster_rescanned_after_change(tmp_path):
+    path = tmp_path / "orcs.jsonl"
+    path.write_text(json.dumps({"name": "Shagrat"}) + "\n")
+    store = RosterStore(path)
+    assert store.find() == ["Shagrat"]
+
+    path.write_text(json.dumps({"name": "Gorbag"}) + "\n" + json.dumps({"name": "Shagrat"}) + "\n")
+
+    assert store.find() == ["Gorbag", "Shagrat"]
+    assert store.load("Shagrat").name == "Shagrat"
+
+
+def test_roster_duplicates_and_empty(tmp_path):
+    path = tmp_path / "dupes.json"
+    path.write_text(json.dumps([{"name": "A", "system": "first"}, {"name": "A", "system": "second"}]))
+    store = RosterStore(path)
+
+    assert store.load("A").system == "first"
+    assert store.duplicates == ["A"]
+
+    empty = tmp_path / "empty.json"
+    empty.write_text("[ ]")
+    assert RosterStore(empty).find() == []
+
+
+def test_roster_invalid_file(tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_text('[{"name": "A"}, 3]')
+
+    with pytest.raises(ValueError, match="not a character"):
+        RosterStore(path).index()
+
+
+def test_roster_invalid_file_is_reported_not_raised(tmp_path, capsys):
+    path = tmp_path / "bad.json"
+    path.write_text('[{"name": "A"}, 3]')
+    store = RosterStore(path)
+
+    assert store.load("A") is None
+    assert store.find() == []
+    assert store.available("a") == []
+    assert "not a character" in capsys.readouterr().out
+
+    [result] = store.load_many(["A"])
+    assert result.character is None
+    assert "not a character" in result.error
+
+
+def test_open_roster_store(tmp_path):
+    store = open_store({"store": "roster", "path": str(tmp_path / "npcs.jsonl")})
+    assert isinstance(store, RosterStore)
+    assert store.path == tmp_path / "npcs.jsonl"
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from gamagama.cli.characters import (
+    CharacterStore,
+    SQLiteCharacterStore,
+    Store,
+    configure_store,
+    default_store,
+    open_store,
+)
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data))
+
+
+@pytest.fixture
+def json_dir(tmp_path):
+    directory = tmp_path / "characters"
+    directory.mkdir()
+    _write(directory / "gandalf.json", {"name": "Gandalf", "system": "rolemaster", "strings": {"race": "Maia"}})
+    _write(directory / "frodo.json", {"name": "Frodo", "strings": {"race": "Hobbit"}, "counts": {"hp": [10, 12]}})
+    _write(directory / "gimli.json", {"name": "Gimli", "system": "rolemaster"})
+    return directory
+
+
+@pytest.fixture
+def store(tmp_path, json_dir):
+    store = SQLiteCharacterStore(tmp_path / "characters.db")
+    store.import_directory(json_dir)
+    yield store
+    store.close()
+
+
+def test_sqlite_store_is_a_store(tmp_path):
+    assert isinstance(SQLiteCharacterStore(tmp_path / "c.db"), Store)
+    assert isinstance(CharacterStore(base_dir=tmp_path), Store)
+
+
+def test_sqlite_load(store):
+    char = store.load("frodo")
+
+    assert char.name == "Frodo"
+    assert char.strings == {"race": "Hobbit"}
+    assert char.counts == {"hp": (10, 12)}
+
+
+def test_sqlite_load_not_found(store, capsys):
+    assert store.load("sauron") is None
+    assert "Character not found" in capsys.readouterr().out
+
+
+def test_sqlite_lookups(store):
+    assert store.find() == ["frodo", "gandalf", "gimli"]
+    assert store.find("g*") == ["gandalf", "gimli"]
+    assert store.find_by_system("rolemaster") == ["gandalf", "gimli"]
+    assert store.available("HOBBIT") == ["frodo"]
+
+
+def test_sqlite_load_many(store):
+    results = store.load_many(["gimli", "sauron", "frodo"])
+
+    assert [r.name for r in results] == ["gimli", "sauron", "frodo"]
+    assert results[0].character.name == "Gimli"
+    assert results[1].error == "not found"
+    assert results[2].character.name == "Frodo"
+
+
+def test_sqlite_import_is_transactional(tmp_path, json_dir):
+    (json_dir / "zz_broken.json").write_text("{")
+    store = SQLiteCharacterStore(tmp_path / "characters.db")
+
+    with pytest.raises(ValueError, match="zz_broken.json"):
+        store.import_directory(json_dir)
+
+    assert store.find() == []
+
+
+def test_sqlite_reimport_replaces(store, json_dir):
+    _write(json_dir / "frodo.json", {"name": "Frodo Baggins"})
+
+    assert store.import_directory(json_dir) == 3
+    assert store.load("frodo").name == "Frodo Baggins"
+    assert store.find() == ["frodo", "gandalf", "gimli"]
+
+
+def test_open_store_from_config(tmp_path):
+    sqlite_store = open_store({"store": "sqlite", "path": str(tmp_path / "c.db")})
+    json_store = open_store({"path": str(tmp_path)})
+
+    assert isinstance(sqlite_store, SQLiteCharacterStore)
+    assert sqlite_store.path == tmp_path / "c.db"
+    assert isinstance(json_store, CharacterStore)
+    assert json_store.base_dir == tmp_path
+
+
+def test_default_store_uses_configuration(tmp_path):
+    try:
+        configure_store({"store": "sqlite", "path": str(tmp_path / "c.db")})
+        assert isinstance(default_store(), SQLiteCharacterStore)
+    finally:
+        configure_store({})
+    assert isinstance(default_store(), CharacterStore)
@@ -1,7 +1,11 @@
 import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 from gamagama.cli.characters import CharacterStore
+from gamagama.cli.characters.store import CacheInfo
 
 
 def test_store_load_success(tmp_path):
@@ -41,3 +45,112 @@ def test_store_default_base_dir():
     store = CharacterStore()
     expected = Path.home() / ".config" / "gg-cli" / "characters"
     assert store.base_dir == expected
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data))
+
+
+def test_store_cache_hits_unchanged_file(tmp_path):
+    _write(tmp_path / "sam.json", {"name": "Sam", "stats": {"strength": 60}})
+    store = CharacterStore(base_dir=tmp_path)
+
+    first = store.load("sam")
+    second = store.load("sam")
+
+    info = store.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    assert first == second
+    # Every load returns its own copy
+    first.stats["strength"] = 1
+    assert store.load("sam").stats == {"strength": 60}
+
+
+def test_store_cache_invalidated_by_change(tmp_path):
+    char_file = tmp_path / "sam.json"
+    _write(char_file, {"name": "Sam"})
+    store = CharacterStore(base_dir=tmp_path)
+    store.load("sam")
+
+    _write(char_file, {"name": "Samwise Gamgee"})
+
+    assert store.load("sam").name == "Samwise Gamgee"
+    assert store.cache_info().misses == 2
+
+
+def test_store_cache_evicts_least_recently_used(tmp_path):
+    for name in ("a", "b", "c"):
+        _write(tmp_path / f"{name}.json", {"name": name})
+    store = CharacterStore(base_dir=tmp_path, cache_size=2)
+
+    store.load("a")
+    store.load("b")
+    store.load("a")  # 'b' is now least recently used
+    store.load("c")
+    store.load("a")
+    store.load("b")
+
+    info = store.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 4, 2)
+
+
+def test_store_cache_disabled(tmp_path):
+    _write(tmp_path / "sam.json", {"name": "Sam"})
+    store = CharacterStore(base_dir=tmp_path, cache_size=0)
+
+    store.load("sam")
+    store.load("sam")
+
+    assert store.cache_info().hits == 0
+    assert store.cache_info().currsize == 0
+
+
+def test_store_cache_clear(tmp_path):
+    _write(tmp_path / "sam.json", {"name": "Sam"})
+    store = CharacterStore(base_dir=tmp_path)
+    store.load("sam")
+
+    store.cache_clear()
+
+    assert store.cache_info() == CacheInfo(hits=0, misses=0, maxsize=store.cache_size, currsize=0)
+
+
+def test_store_find(tmp_path):
+    for name in ("goblin_2", "goblin_1", "orc"):
+        _write(tmp_path / f"{name}.json", {"name": name})
+    (tmp_path / "notes.txt").write_text("")
+    store = CharacterStore(base_dir=tmp_path)
+
+    assert store.find() == ["goblin_1", "goblin_2", "orc"]
+    assert store.find("goblin_*") == ["goblin_1", "goblin_2"]
+    assert CharacterStore(base_dir=tmp_path / "missing").find() == []
+
+
+def test_store_load_many(tmp_path):
+    names = [f"npc_{i}" for i in range(20)]
+    for name in names:
+        _write(tmp_path / f"{name}.json", {"name": name.upper()})
+    (tmp_path / "broken.json").write_text("[")
+    store = CharacterStore(base_dir=tmp_path)
+
+    results = store.load_many(names + ["broken", "missing"], max_workers=4)
+
+    assert [r.name for r in results] == names + ["broken", "missing"]
+    assert [r.character.name for r in results[:20]] == [n.upper() for n in names]
+    assert results[20].character is None and results[20].error
+    assert results[21].error == "file not found"
+    assert store.cache_info().currsize == 20
+
+
+def test_store_backends_are_imported_on_use():
+    """Importing the package does not load the optional backends or sqlite3."""
+    code = (
+        "import sys, gamagama.cli.characters as c\n"
+        "lazy = ['sqlite3', 'gamagama.cli.characters.sqlite_store', 'gamagama.cli.characters.roster']\n"
+        "assert not [m for m in lazy if m in sys.modules], sys.modules.keys()\n"
+        "c.open_store({'store': 'sqlite', 'path': ':memory:'})\n"
+        "assert 'sqlite3' in sys.modules\n"
+        "assert c.RosterStore.__module__ == 'gamagama.cli.characters.roster'\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
@@ -73,3 +73,59 @@ def test_help_bubbling_lookup(parser_and_tree, capsys):
     assert "Help for 'roll':" in captured.out
     # Verify detailed description is shown
     assert "Syntax: [count]d[sides][!][modifier]" in captured.out
+
+
+def _help_command(tree):
+    cmd = HelpCommand()
+    cmd.tree = tree
+    return cmd
+
+
+def test_help_static_lines_cached_dynamic_recomputed(parser_and_tree, capsys):
+    """Static help is rendered once per tree version; dynamic help every time."""
+    from gamagama.cli.core.registry import CommandSpec
+
+    _, tree = parser_and_tree
+    calls = []
+    spec = CommandSpec(name="probe", help="Probe things.",
+                       dynamic_help=lambda session: calls.append(session) or "dynamic part")
+    tree.register_command(["probe"], spec)
+
+    session = Session(tree)
+    cmd = _help_command(tree)
+    args = argparse.Namespace(command_name=["probe"], _session=session)
+    cmd.handle(args)
+    first = capsys.readouterr().out
+    cmd.handle(args)
+    assert capsys.readouterr().out == first
+    assert "Probe things." in first and "dynamic part" in first
+    assert len(calls) == 2
+    assert cmd._rendered[spec] == ["Help for 'probe':", "  Probe things."]
+
+    # A change to the tree drops the cached help
+    tree.register_command(["probe2"], CommandSpec(name="probe2", help="More."))
+    cmd.handle(argparse.Namespace(command_name=[], _session=session))
+    assert "probe2" in capsys.readouterr().out
+
+
+def test_help_all_lists_every_command(parser_and_tree, capsys):
+    _, tree = parser_and_tree
+    cmd = _help_command(tree)
+    cmd.handle(argparse.Namespace(command_name=["player"], all=True, page=None, page_size=20))
+    output = capsys.readouterr().out
+    assert "Help for 'player import':" in output
+    assert "Help for 'roll':" not in output
+
+
+def test_help_all_paged(parser_and_tree, capsys):
+    _, tree = parser_and_tree
+    cmd = _help_command(tree)
+    total = len(cmd._commands_under(tree.root))
+
+    cmd.handle(argparse.Namespace(command_name=[], all=True, page=1, page_size=2))
+    output = capsys.readouterr().out
+    assert output.count("Help for '") == 2
+    assert f"Page 1 of {-(-total // 2)}." in output
+
+    cmd.handle(argparse.Namespace(command_name=[], all=True, page=999, page_size=2))
+    assert "There are only" in capsys.readouterr().out
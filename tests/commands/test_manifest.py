@@ -0,0 +1,90 @@
+"""Tests for manifest-backed command discovery."""
+import argparse
+import json
+import os
+
+from gamagama.cli.commands import discover_commands, manifest
+from gamagama.cli.commands.manifest import LazyCommand
+from gamagama.cli.core.domain import DomainBranch
+from gamagama.cli.core.registry import CommandSpec, CommandTree
+
+
+def _names(tree):
+    return [node.name for node in tree.walk()]
+
+
+def test_discovery_writes_manifest(tmp_path):
+    path = tmp_path / "commands.json"
+    tree = CommandTree()
+    discover_commands(tree, manifest_path=path)
+
+    data = json.loads(path.read_text())
+    paths = [entry["path"] for entry in data["entries"]]
+    assert ["roll"] in paths
+    assert ["system", "schema"] in paths
+
+
+def test_manifest_builds_same_tree(tmp_path):
+    path = tmp_path / "commands.json"
+    eager = CommandTree()
+    discover_commands(eager, manifest_path=path)
+
+    lazy = CommandTree()
+    discover_commands(lazy, manifest_path=path)
+
+    assert _names(lazy) == _names(eager)
+    assert isinstance(lazy.get(["system", "schema"]), DomainBranch)
+
+    roll = lazy.get(["roll"])
+    assert isinstance(roll, CommandSpec)
+    assert isinstance(roll.handler.__self__, LazyCommand)
+    assert not roll.handler.__self__.loaded
+    assert roll.arguments == eager.get(["roll"]).arguments
+    assert roll.description == eager.get(["roll"]).description
+
+
+def test_lazy_command_runs_handler(tmp_path, capsys):
+    path = tmp_path / "commands.json"
+    discover_commands(CommandTree(), manifest_path=path)
+    tree = CommandTree()
+    discover_commands(tree, manifest_path=path)
+
+    # HelpCommand needs the tree injected, exactly as in eager discovery.
+    help_spec = tree.get(["help"])
+    help_spec.handler(argparse.Namespace(command_name=["roll"]))
+
+    captured = capsys.readouterr()
+    assert "Help for 'roll':" in captured.out
+    assert help_spec.handler.__self__.loaded
+
+
+def test_stale_manifest_is_rebuilt(tmp_path):
+    path = tmp_path / "commands.json"
+    path.write_text(json.dumps({"key": {"format": 0}, "entries": []}))
+
+    tree = CommandTree()
+    discover_commands(tree, manifest_path=path)
+
+    assert tree.get(["roll"]) is not None
+    data = json.loads(path.read_text())
+    assert data["key"]["format"] == manifest.MANIFEST_FORMAT
+    assert data["entries"]
+
+
+def test_manifest_key_covers_modules_commands_read_defaults_from(tmp_path):
+    from gamagama.cli.commands import _cli_package_paths
+
+    modules = manifest.manifest_key(_cli_package_paths())["modules"]
+    # roll's --explode-depth default comes from the dice package
+    assert os.path.join("systems", "dice", "explode.py") in modules
+    assert os.path.join("commands", "roll", "__init__.py") in modules
+
+
+def test_unserializable_arguments_skip_manifest(tmp_path):
+    path = tmp_path / "commands.json"
+    spec = CommandSpec(name="custom")
+    spec.add_argument("value", type=lambda s: s.upper())
+    entry = manifest.command_entry(CommandSpec, ["custom"], spec)
+
+    assert manifest.write_manifest(path, {"format": 1}, [entry]) is False
+    assert not path.exists()
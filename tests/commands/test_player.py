@@ -219,3 +219,71 @@ class TestPlayerShow:
         result = domain.show_item(session, None)
 
         assert "Name: Gandalf" in result
+
+
+class TestPlayerLoadMatching:
+    def test_load_matching_pattern(self, tmp_path, capsys):
+        for name in ("goblin_1", "goblin_2", "orc_1"):
+            _create_char_file(tmp_path, name, {"name": name.title()})
+
+        session = _create_session(tmp_path)
+        domain = PlayerDomain()
+
+        result = domain.load_matching(session, "goblin_*")
+
+        assert result is True
+        assert sorted(session.players) == ["goblin_1", "goblin_2"]
+        assert "Loaded 2 of 2 characters." in capsys.readouterr().out
+
+    def test_load_matching_reports_bad_files(self, tmp_path, capsys):
+        _create_char_file(tmp_path, "good", {"name": "Good"})
+        (tmp_path / "broken.json").write_text("{not json")
+        _create_char_file(tmp_path, "nameless", {"system": "generic"})
+
+        session = _create_session(tmp_path)
+        domain = PlayerDomain()
+
+        result = domain.load_matching(session, "*")
+
+        assert result is False
+        assert list(session.players) == ["good"]
+        captured = capsys.readouterr()
+        assert "Loaded 1 of 3 characters." in captured.out
+        assert "  broken:" in captured.out
+        assert "  nameless: invalid character data" in captured.out
+
+    def test_load_matching_skips_loaded(self, tmp_path, capsys):
+        _create_char_file(tmp_path, "gandalf", {"name": "Gandalf"})
+        session = _create_session(tmp_path)
+        session.players["gandalf"] = Character(name="Gandalf")
+        domain = PlayerDomain()
+
+        result = domain.load_matching(session, "*")
+
+        assert result is False
+        assert "No unloaded characters match '*'." in capsys.readouterr().out
+
+
+class TestPlayerImport:
+    def test_import_into_sqlite(self, tmp_path, capsys):
+        from gamagama.cli.characters import SQLiteCharacterStore
+        from gamagama.cli.commands.player import ImportCommand
+
+        _create_char_file(tmp_path, "gandalf", {"name": "Gandalf"})
+        session = _create_session()
+        session.store = SQLiteCharacterStore(tmp_path / "characters.db")
+
+        args = argparse.Namespace(_session=session, directory=str(tmp_path))
+        ImportCommand().handle(args)
+
+        assert "Imported 1 characters" in capsys.readouterr().out
+        assert session.store.find() == ["gandalf"]
+
+    def test_import_json_store_is_a_no_op(self, tmp_path, capsys):
+        from gamagama.cli.commands.player import ImportCommand
+
+        session = _create_session(tmp_path)
+        args = argparse.Namespace(_session=session, directory=str(tmp_path))
+        ImportCommand().handle(args)
+
+        assert "nothing to import" in capsys.readouterr().out
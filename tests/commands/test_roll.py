@@ -70,3 +70,139 @@ def test_roll_exploding_infinite_loop_prevention(capsys):
     
     captured = capsys.readouterr()
     assert "Cannot explode a 1-sided die" in captured.out
+
+
+def test_roll_multi_term(capsys):
+    """Tests that several dice groups and modifiers can be chained."""
+    cmd = RollCommand()
+    args = _create_args(["2d1+1d1+3"])
+    cmd.handle(args)
+    captured = capsys.readouterr()
+    assert captured.out == "2d1+1d1+3: 6 [1, 1, 1]\n"
+
+
+def test_roll_subtracted_dice(capsys):
+    """Tests that a subtracted dice group lowers the total."""
+    cmd = RollCommand()
+    args = _create_args(["3d1-1d1"])
+    cmd.handle(args)
+    captured = capsys.readouterr()
+    assert captured.out == "3d1-1d1: 2 [1, 1, 1, 1]\n"
+
+
+def test_roll_invalid_spec(capsys):
+    """Tests that malformed specs are reported without rolling."""
+    cmd = RollCommand()
+    args = _create_args(["2d6++3"])
+    cmd.handle(args)
+    captured = capsys.readouterr()
+    assert captured.out == "2d6++3: Invalid dice specification.\n"
+
+
+def test_roll_times_summary(capsys):
+    """Tests that --times prints summary statistics for the batch."""
+    cmd = RollCommand()
+    args = _create_args(["2d1+1"])
+    args.times = 100
+    cmd.handle(args)
+    captured = capsys.readouterr()
+    assert captured.out == "2d1+1 x100: mean 3.00, stdev 0.00, min 3, max 3\n"
+
+
+def test_roll_times_raw(capsys):
+    """Tests that --times --raw prints every total."""
+    cmd = RollCommand()
+    args = _create_args(["1d1"])
+    args.times = 3
+    args.raw = True
+    cmd.handle(args)
+    captured = capsys.readouterr()
+    assert captured.out == "1\n1\n1\n"
+
+
+def test_roll_times_invalid(capsys):
+    """Tests that a non-positive --times is rejected."""
+    cmd = RollCommand()
+    args = _create_args(["1d6"])
+    args.times = 0
+    cmd.handle(args)
+    captured = capsys.readouterr()
+    assert "--times must be at least 1" in captured.out
+
+
+def test_roll_dist(capsys):
+    """Tests that --dist prints the exact distribution without rolling."""
+    cmd = RollCommand()
+    args = _create_args(["2d2"])
+    args.dist = True
+    cmd.handle(args)
+    captured = capsys.readouterr()
+    assert captured.out == (
+        "2d2: mean 3.00, variance 0.50, stdev 0.71\n"
+        "  percentiles: p5 2, p25 2, p50 3, p75 3, p95 4\n"
+        "  2  25.00% ####################\n"
+        "  3  50.00% ########################################\n"
+        "  4  25.00% ####################\n"
+    )
+
+
+def test_roll_dist_and_times(capsys):
+    """Tests that --dist and --times are mutually exclusive."""
+    cmd = RollCommand()
+    args = _create_args(["1d6"])
+    args.dist = True
+    args.times = 10
+    cmd.handle(args)
+    captured = capsys.readouterr()
+    assert "cannot be combined" in captured.out
+
+
+def test_roll_times_exploding_reports_chains(capsys):
+    """Tests that bulk exploding rolls report chain-length statistics."""
+    cmd = RollCommand()
+    args = _create_args(["2d2!"])
+    args.times = 1000
+    args.explode_depth = 2
+    cmd.handle(args)
+    captured = capsys.readouterr()
+    assert captured.out.startswith("2d2! x1000: mean ")
+    assert "capped at depth 2" in captured.out
+    assert "chain lengths: 1: " in captured.out
+
+
+class _LoadedDice:
+    """A dice engine with its own rules: every die rolls its maximum."""
+
+    help_text = ""
+
+    def roll(self, sides, explode=False):
+        return sides
+
+
+def _custom_system():
+    from gamagama.cli.systems import GenericSystem
+
+    system = GenericSystem()
+    system.dice = _LoadedDice()
+    return system
+
+
+def test_roll_times_uses_custom_dice_engine(capsys):
+    """Tests that --times rolls through a system's own dice rules."""
+    cmd = RollCommand()
+    args = _create_args(["2d6"], system=_custom_system())
+    args.times = 5
+    args.raw = True
+    cmd.handle(args)
+    captured = capsys.readouterr()
+    assert captured.out == "12\n12\n12\n12\n12\n"
+
+
+def test_roll_dist_refuses_custom_dice_engine(capsys):
+    """Tests that --dist refuses systems whose dice it cannot model."""
+    cmd = RollCommand()
+    args = _create_args(["2d6"], system=_custom_system())
+    args.dist = True
+    cmd.handle(args)
+    captured = capsys.readouterr()
+    assert "only available for standard dice" in captured.out
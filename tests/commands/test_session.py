@@ -0,0 +1,183 @@
+import argparse
+
+import pytest
+
+from gamagama.cli.characters import Character
+from gamagama.cli.commands.player import PlayerDomain
+from gamagama.cli.commands.session import RestoreCommand, SaveCommand, SnapshotsCommand
+from gamagama.cli.core import snapshot
+from gamagama.cli.core.registry import CommandTree
+from gamagama.cli.core.session import Session
+from gamagama.cli.core.snapshot import (
+    SnapshotError,
+    SnapshotPlayers,
+    decode_character,
+    encode_character,
+    restore_snapshot,
+    save_snapshot,
+)
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "default_snapshot_dir", lambda: tmp_path)
+    return tmp_path
+
+
+def _create_session():
+    tree = CommandTree()
+    tree.insert(["player", "load"], object())
+    return Session(tree)
+
+
+def _gandalf():
+    return Character(
+        name="Gandalf",
+        strings={"race": "Maia", "title": None},
+        stats={"str": 70, "int": 100},
+        skills={"lore": 25, "big": 1 << 40},
+        counts={"hp": (40, 55), "luck": (0.5, 1.5)},
+    )
+
+
+def _args(session, **kwargs):
+    return argparse.Namespace(_session=session, **kwargs)
+
+
+def test_character_round_trip():
+    character = _gandalf()
+    assert decode_character(encode_character(character)) == character
+
+
+def test_save_and_restore_session(tmp_path):
+    session = _create_session()
+    session.players["gandalf"] = _gandalf()
+    session.players["frodo"] = Character(name="Frodo")
+    session.active_player = "gandalf"
+    session.active_schema = "default"
+    session.current_node = session.tree.get(["player"])
+    save_snapshot(session, tmp_path / "s.ggs")
+
+    restored = _create_session()
+    warnings = restore_snapshot(restored, tmp_path / "s.ggs", {"generic": type(session.system)})
+
+    assert warnings == []
+    assert list(restored.players) == ["gandalf", "frodo"]
+    assert restored.players["gandalf"] == session.players["gandalf"]
+    assert restored.active_player == "gandalf"
+    assert restored.active_schema == "default"
+    assert restored.current_node is restored.tree.get(["player"])
+
+
+def test_restore_decodes_players_lazily(tmp_path):
+    session = _create_session()
+    session.players["gandalf"] = _gandalf()
+    session.players["frodo"] = Character(name="Frodo")
+    save_snapshot(session, tmp_path / "s.ggs")
+
+    restored = _create_session()
+    restore_snapshot(restored, tmp_path / "s.ggs", {})
+    players = restored.players
+    assert isinstance(players, SnapshotPlayers)
+    assert players.is_pending("gandalf") and players.is_pending("frodo")
+
+    assert players["frodo"].name == "Frodo"
+    assert not players.is_pending("frodo")
+    assert players.is_pending("gandalf")
+
+    # Saving again copies untouched players through without decoding them.
+    players["frodo"].stats["str"] = 12
+    save_snapshot(restored, tmp_path / "t.ggs")
+    assert players.is_pending("gandalf")
+
+    again = _create_session()
+    restore_snapshot(again, tmp_path / "t.ggs", {})
+    assert again.players["gandalf"] == _gandalf()
+    assert again.players["frodo"].stats["str"] == 12
+
+
+def test_corrupt_player_is_reported_and_dropped(capsys):
+    good = encode_character(Character(name="Frodo"))
+    bad = b"\x40\x00\x00\x00Gan"
+    session = _create_session()
+    session.players = SnapshotPlayers(
+        memoryview(good + bad), {"frodo": (0, len(good)), "gandalf": (len(good), len(bad))}
+    )
+
+    assert PlayerDomain().show_item(session, "gandalf") is None
+
+    assert "Player 'gandalf' in the snapshot is corrupt" in capsys.readouterr().out
+    assert list(session.players) == ["frodo"]
+    assert session.players["frodo"].name == "Frodo"
+
+
+def test_restore_warns_about_missing_system_and_location(tmp_path):
+    session = _create_session()
+    session.current_node = session.tree.get(["player"])
+    save_snapshot(session, tmp_path / "s.ggs")
+
+    restored = Session(CommandTree())
+    warnings = restore_snapshot(restored, tmp_path / "s.ggs", {})
+
+    assert len(warnings) == 2
+    assert restored.current_node is restored.tree.root
+
+
+def test_restore_rejects_bad_files(tmp_path):
+    (tmp_path / "junk.ggs").write_bytes(b"not a snapshot")
+    with pytest.raises(SnapshotError):
+        restore_snapshot(_create_session(), tmp_path / "junk.ggs", {})
+
+    session = _create_session()
+    session.players["gandalf"] = _gandalf()
+    save_snapshot(session, tmp_path / "s.ggs")
+    data = (tmp_path / "s.ggs").read_bytes()
+
+    (tmp_path / "short.ggs").write_bytes(data[:-10])
+    with pytest.raises(SnapshotError, match="truncated"):
+        restore_snapshot(_create_session(), tmp_path / "short.ggs", {})
+
+    newer = data[:4] + (snapshot.SNAPSHOT_FORMAT + 1).to_bytes(2, "little") + data[6:]
+    (tmp_path / "newer.ggs").write_bytes(newer)
+    with pytest.raises(SnapshotError, match="newer version"):
+        restore_snapshot(_create_session(), tmp_path / "newer.ggs", {})
+
+
+def test_commands(snapshot_dir, capsys):
+    session = _create_session()
+    session.players["gandalf"] = _gandalf()
+    SaveCommand().handle(_args(session, snapshot="night1"))
+    assert "Saved session 'night1' (1 players)." in capsys.readouterr().out
+    assert (snapshot_dir / "night1.ggs").exists()
+
+    SnapshotsCommand().handle(_args(session))
+    assert capsys.readouterr().out == "night1\n"
+
+    fresh = _create_session()
+    RestoreCommand().handle(_args(fresh, snapshot="night1"))
+    assert "Restored session 'night1' (1 players)." in capsys.readouterr().out
+    assert fresh.players["gandalf"] == _gandalf()
+
+
+def test_restore_reports_undecodable_strings(snapshot_dir, capsys):
+    session = _create_session()
+    save_snapshot(session, snapshot_dir / "bad.ggs")
+    data = bytearray((snapshot_dir / "bad.ggs").read_bytes())
+    # The system name is the first string, right after the 8-byte header and its length.
+    data[12] = 0xFF
+    (snapshot_dir / "bad.ggs").write_bytes(data)
+
+    with pytest.raises(SnapshotError, match="Corrupt snapshot"):
+        restore_snapshot(_create_session(), snapshot_dir / "bad.ggs", {})
+
+    RestoreCommand().handle(_args(_create_session(), snapshot="bad"))
+    assert "Could not restore session" in capsys.readouterr().out
+
+
+def test_commands_reject_bad_names(snapshot_dir, capsys):
+    session = _create_session()
+    SaveCommand().handle(_args(session, snapshot="../escape"))
+    assert "Invalid snapshot name" in capsys.readouterr().out
+
+    RestoreCommand().handle(_args(session, snapshot="missing"))
+    assert "No saved session named 'missing'" in capsys.readouterr().out
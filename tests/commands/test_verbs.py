@@ -13,7 +13,7 @@ from gamagama.cli.commands.verbs import (
 from gamagama.cli.commands.player import PlayerDomain
 from gamagama.cli.commands.system import SystemDomain
 from gamagama.cli.core.session import Session
-from gamagama.cli.core.registry import CommandTree
+from gamagama.cli.core.registry import CommandTree, FAILED
 from gamagama.cli.commands import discover_commands
 
 
@@ -133,6 +133,43 @@ class TestListCommand:
         assert "rmu" in captured.out
 
 
+class TestListAvailable:
+    def test_list_available_players(self, tmp_path, capsys):
+        for name in ("frodo", "sam"):
+            (tmp_path / f"{name}.json").write_text(json.dumps({"name": name.title()}))
+
+        session = _create_session(tmp_path)
+        session.players["sam"] = Character(name="Sam")
+        cmd = ListCommand()
+        args = _create_args(session, domain="player", available=True)
+
+        cmd.handle(args)
+
+        captured = capsys.readouterr()
+        assert captured.out == "  frodo\n+ sam\n"
+
+    def test_list_available_search(self, tmp_path, capsys):
+        (tmp_path / "frodo.json").write_text(json.dumps({"name": "Frodo", "strings": {"race": "Hobbit"}}))
+        (tmp_path / "gandalf.json").write_text(json.dumps({"name": "Gandalf"}))
+
+        session = _create_session(tmp_path)
+        cmd = ListCommand()
+        args = _create_args(session, domain="player", search="hobbit")
+
+        cmd.handle(args)
+
+        assert capsys.readouterr().out == "  frodo\n"
+
+    def test_list_available_unsupported(self, capsys):
+        session = _create_session()
+        cmd = ListCommand()
+        args = _create_args(session, domain="system", available=True)
+
+        cmd.handle(args)
+
+        assert "not available" in capsys.readouterr().out
+
+
 class TestSetCommand:
     def test_set_system(self, capsys):
         session = _create_session()
@@ -150,7 +187,7 @@ class TestSetCommand:
         cmd = SetCommand()
         args = _create_args(session, target="player", name="gandalf")
 
-        cmd.handle(args)
+        assert cmd.handle(args) is FAILED
 
         captured = capsys.readouterr()
         assert "not found" in captured.out.lower()
@@ -182,12 +219,56 @@ class TestLoadCommand:
         cmd = LoadCommand()
         args = _create_args(session, target="player", name="gandalf")
 
-        cmd.handle(args)
+        assert cmd.handle(args) is None
 
         captured = capsys.readouterr()
         assert "Loaded character: Gandalf" in captured.out
         assert "gandalf" in session.players
 
+    def test_load_missing_player_fails(self, tmp_path, capsys):
+        session = _create_session(tmp_path)
+        cmd = LoadCommand()
+        args = _create_args(session, target="player", name="nobody", all=False)
+
+        assert cmd.handle(args) is FAILED
+        assert session.players == {}
+
+    def test_load_player_all(self, tmp_path, capsys):
+        for name in ("frodo", "sam"):
+            (tmp_path / f"{name}.json").write_text(json.dumps({"name": name.title()}))
+
+        session = _create_session(tmp_path)
+        cmd = LoadCommand()
+        args = _create_args(session, target="player", name=None, all=True)
+
+        cmd.handle(args)
+
+        assert sorted(session.players) == ["frodo", "sam"]
+        assert "Loaded 2 of 2 characters." in capsys.readouterr().out
+
+    def test_load_glob_in_domain_context(self, tmp_path, capsys):
+        for name in ("frodo", "sam"):
+            (tmp_path / f"{name}.json").write_text(json.dumps({"name": name.title()}))
+
+        session = _create_session(tmp_path)
+        session.current_node = session.tree.root.get_child("player")
+        cmd = LoadCommand()
+        args = _create_args(session, target="s*", name=None, all=False)
+
+        cmd.handle(args)
+
+        assert list(session.players) == ["sam"]
+
+    def test_load_all_with_name_rejected(self, tmp_path, capsys):
+        session = _create_session(tmp_path)
+        cmd = LoadCommand()
+        args = _create_args(session, target="player", name="sam", all=True)
+
+        cmd.handle(args)
+
+        assert "not both" in capsys.readouterr().out
+        assert session.players == {}
+
     def test_load_unsupported_verb(self, capsys):
         session = _create_session()
         cmd = LoadCommand()
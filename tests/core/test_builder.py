@@ -0,0 +1,76 @@
+import argparse
+
+import pytest
+from gamagama.cli.core.main import _get_cli_parser, run_cli_mode
+from gamagama.cli.core.registry import ArgparseBuilder, CommandSpec, CommandTree
+from gamagama.cli.systems import GenericSystem
+
+
+def _tree():
+    tree = CommandTree()
+    tree.register_command(["roll"], CommandSpec(name="roll", handler=lambda args: None))
+    spec = CommandSpec(name="add", handler=lambda args: print(f"added {args.who}"))
+    spec.add_argument("who")
+    tree.register_command(["player", "add"], spec)
+    tree.register_command(["player", "remove"], CommandSpec(name="remove"))
+    return tree
+
+
+def test_command_path():
+    builder = ArgparseBuilder(_tree())
+
+    assert builder.command_path(["roll", "3d6"]) == ["roll"]
+    assert builder.command_path(["player", "add", "bob"]) == ["player", "add"]
+    assert builder.command_path(["player"]) is None
+    assert builder.command_path(["--help"]) is None
+    assert builder.command_path(["unknown"]) is None
+    assert builder.command_path([]) is None
+
+
+def test_build_path_only():
+    tree = _tree()
+    builder = ArgparseBuilder(tree)
+    parser = argparse.ArgumentParser()
+
+    builder.build(parser, ["player", "add"])
+
+    assert set(builder.node_parsers) == {tree.root, tree.get(["player"])}
+    args = parser.parse_args(["player", "add", "bob"])
+    assert args.who == "bob"
+    with pytest.raises(SystemExit):
+        parser.parse_args(["roll"])
+
+
+def test_build_full_tree():
+    tree = _tree()
+    parser = argparse.ArgumentParser()
+    ArgparseBuilder(tree).build(parser)
+
+    assert parser.parse_args(["roll"]).func is not None
+    assert parser.parse_args(["player", "add", "bob"]).who == "bob"
+
+
+def test_cli_parser_cached_per_path():
+    tree = _tree()
+
+    add_parser = _get_cli_parser(tree, ["player", "add", "bob"])
+    assert _get_cli_parser(tree, ["player", "add", "alice"]) is add_parser
+    assert _get_cli_parser(tree, ["roll"]) is not add_parser
+    assert _get_cli_parser(tree, ["--help"]) is _get_cli_parser(tree, [])
+
+
+def test_cli_parser_cache_dropped_when_tree_changes():
+    tree = _tree()
+    full_parser = _get_cli_parser(tree, [])
+
+    tree.register_command(["rest"], CommandSpec(name="rest", handler=lambda args: None))
+
+    rebuilt = _get_cli_parser(tree, [])
+    assert rebuilt is not full_parser
+    assert rebuilt.parse_args(["rest"]).func is not None
+
+
+def test_run_cli_mode_partial(capsys):
+    run_cli_mode(_tree(), GenericSystem, ["player", "add", "bob"])
+    captured = capsys.readouterr()
+    assert captured.out == "added bob\n"
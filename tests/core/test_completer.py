@@ -50,3 +50,62 @@ def test_complete_path():
         
         res = completer.complete("a", 0)
         assert res == "add "
+
+def _player_session(tmp_path):
+    import json
+    from gamagama.cli.characters import Character, CharacterStore
+    from gamagama.cli.commands import discover_commands
+    from gamagama.cli.core.registry import CommandTree
+
+    for name in ("gandalf", "gimli", "frodo"):
+        (tmp_path / f"{name}.json").write_text(json.dumps({"name": name.title()}))
+
+    tree = CommandTree()
+    discover_commands(tree)
+    session = Session(tree)
+    session.store = CharacterStore(base_dir=tmp_path)
+    session.players["gimli"] = Character(name="Gimli")
+    return tree, session
+
+def _all_options(completer, text):
+    options = []
+    while True:
+        option = completer.complete(text, len(options))
+        if option is None:
+            return options
+        options.append(option)
+
+def test_complete_load_uses_catalog(tmp_path):
+    tree, session = _player_session(tmp_path)
+    completer = Completer(tree, session)
+
+    with patch("gamagama.cli.core.completer.readline") as mock_rl:
+        mock_rl.get_line_buffer.return_value = "load player g"
+        # Already loaded players are not offered again
+        assert _all_options(completer, "g") == ["gandalf "]
+
+def test_complete_item_in_domain_context(tmp_path):
+    tree, session = _player_session(tmp_path)
+    session.current_node = tree.root.get_child("player")
+    completer = Completer(tree, session)
+
+    with patch("gamagama.cli.core.completer.readline") as mock_rl:
+        mock_rl.get_line_buffer.return_value = "set "
+        assert _all_options(completer, "") == ["gimli "]
+
+def test_complete_computes_options_once_per_press():
+    tree = Tree()
+    for name in ("roll", "rest", "remove", "add"):
+        tree.insert([name], "cmd")
+    completer = Completer(tree, Session(tree))
+
+    with patch("gamagama.cli.core.completer.readline") as mock_rl, \
+            patch.object(completer, "_get_options", wraps=completer._get_options) as get_options:
+        mock_rl.get_line_buffer.return_value = "re"
+        assert _all_options(completer, "re") == ["remove ", "rest "]
+        assert get_options.call_count == 1
+
+        # A new Tab press starts again at state 0 and recomputes.
+        tree.insert(["reload"], "cmd")
+        assert _all_options(completer, "re") == ["reload ", "remove ", "rest "]
+        assert get_options.call_count == 2
@@ -1,4 +1,7 @@
-from gamagama.cli.core.main import _resolve_node, _build_prompt_path
+from unittest.mock import patch
+
+from gamagama.cli.core.main import _build_prompt_path, _execute_command
+from gamagama.cli.core.registry import CommandSpec
 from gamagama.cli.core.tree import MapBranch, Tree
 from gamagama.cli.core.session import Session
 from gamagama.cli.core.domain import DomainBranch
@@ -9,7 +12,7 @@ def test_resolve_node_local():
     child = tree.insert(["local"], "data")
 
     # Should find 'local' in root
-    found = _resolve_node(tree.root, "local")
+    found = tree.resolve(tree.root, ["local"])
     assert found == child
 
 
@@ -22,7 +25,7 @@ def test_resolve_node_bubbling():
     tree.root.add_child(branch)
 
     # Search for 'global' starting from 'branch'
-    found = _resolve_node(branch, "global")
+    found = tree.resolve(branch, ["global"])
     assert found == root_cmd
 
 
@@ -31,7 +34,7 @@ def test_resolve_node_not_found():
     branch = MapBranch(name="branch")
     tree.root.add_child(branch)
 
-    found = _resolve_node(branch, "nonexistent")
+    found = tree.resolve(branch, ["nonexistent"])
     assert found is None
 
 
@@ -77,3 +80,70 @@ def test_build_prompt_path_domain_no_active():
     tree.root.add_child(domain)
 
     assert _build_prompt_path(domain, session) == "player"
+
+
+def test_command_parser_is_cached():
+    spec = CommandSpec(name="greet")
+    spec.add_argument("who")
+
+    parser = spec.get_parser()
+    assert spec.get_parser() is parser
+
+    # Changing the arguments invalidates the cached parser
+    spec.add_argument("--loud", action="store_true")
+    rebuilt = spec.get_parser()
+    assert rebuilt is not parser
+    assert rebuilt.parse_args(["bob", "--loud"]).loud is True
+
+    # So does replacing or editing an argument in place
+    spec.arguments[1] = {"args": ("--m",), "kwargs": {"action": "store_true"}}
+    assert spec.get_parser().parse_args(["bob", "--m"]).m is True
+    spec.arguments[1]["kwargs"]["dest"] = "mode"
+    assert spec.get_parser().parse_args(["bob", "--m"]).mode is True
+
+
+def test_command_parser_accepts_uncopyable_arguments():
+    """Arguments are compared by identity, so values need not be copyable."""
+    spec = CommandSpec(name="pick")
+    spec.add_argument("--k", choices={"a": 1, "b": 2}.keys())
+
+    parser = spec.get_parser()
+    assert parser.parse_args(["--k", "a"]).k == "a"
+    assert spec.get_parser() is parser
+
+
+def test_execute_command_parses_args():
+    tree = Tree()
+    session = Session(tree)
+    seen = []
+    spec = CommandSpec(name="greet", handler=lambda args: seen.append(args.who))
+    spec.add_argument("who")
+
+    _execute_command(spec, ["bob"], session)
+    _execute_command(spec, ["alice"], session)
+
+    assert seen == ["bob", "alice"]
+
+
+def test_execute_command_fast_path_skips_argparse():
+    tree = Tree()
+    session = Session(tree)
+    spec = CommandSpec(name="quit", handler=lambda args: False)
+
+    with patch("argparse.ArgumentParser") as mock_parser:
+        _execute_command(spec, [], session)
+
+    mock_parser.assert_not_called()
+    assert session.should_exit is True
+
+
+def test_execute_command_no_args_rejects_extras(capsys):
+    tree = Tree()
+    session = Session(tree)
+    calls = []
+    spec = CommandSpec(name="quit", handler=lambda args: calls.append(args))
+
+    _execute_command(spec, ["extra"], session)
+
+    assert calls == []
+    assert "unrecognized arguments: extra" in capsys.readouterr().err
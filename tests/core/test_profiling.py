@@ -0,0 +1,69 @@
+import json
+import sys
+
+from gamagama.cli.core.main import run_cli_mode
+from gamagama.cli.core.profiling import StartupProfiler
+from gamagama.cli.core.registry import CommandTree
+from gamagama.cli.commands import discover_commands
+from gamagama.cli.systems import GenericSystem
+
+
+def test_phase_timing():
+    profiler = StartupProfiler()
+    with profiler.phase("config"):
+        pass
+    with profiler.phase("discover"):
+        pass
+
+    assert [p["name"] for p in profiler.phases] == ["config", "discover"]
+    assert all(p["ms"] >= 0 for p in profiler.phases)
+
+
+def test_import_tracking(tmp_path, monkeypatch):
+    (tmp_path / "gg_profiled_outer.py").write_text("import gg_profiled_inner\n")
+    (tmp_path / "gg_profiled_inner.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    profiler = StartupProfiler()
+    profiler.start_import_tracking()
+    try:
+        import gg_profiled_outer
+    finally:
+        profiler.stop_import_tracking()
+        sys.modules.pop("gg_profiled_outer", None)
+        sys.modules.pop("gg_profiled_inner", None)
+
+    imports = {i["module"]: i for i in profiler.imports}
+    assert set(imports) == {"gg_profiled_outer", "gg_profiled_inner"}
+    outer = imports["gg_profiled_outer"]
+    assert outer["cumulative_ms"] >= imports["gg_profiled_inner"]["cumulative_ms"]
+    assert outer["self_ms"] <= outer["cumulative_ms"]
+
+
+def test_report_formats():
+    profiler = StartupProfiler()
+    with profiler.phase("load_config"):
+        pass
+    profiler.imports.append({"module": "slow_mod", "cumulative_ms": 5.0, "self_ms": 2.0})
+
+    text = profiler.report()
+    assert text.startswith("Startup profile (total ")
+    assert "load_config" in text
+    assert "slow_mod" in text
+
+    data = json.loads(profiler.report("json"))
+    assert data["phases"][0]["name"] == "load_config"
+    assert data["imports"][0]["module"] == "slow_mod"
+
+
+def test_cli_mode_prints_profile_to_stderr(capsys):
+    tree = CommandTree()
+    discover_commands(tree)
+    profiler = StartupProfiler()
+
+    run_cli_mode(tree, GenericSystem, ["roll", "1d1"], profiler, "json")
+
+    captured = capsys.readouterr()
+    assert captured.out == "1d1: 1 [1]\n"
+    data = json.loads(captured.err)
+    assert [p["name"] for p in data["phases"]] == ["argparse_build", "argparse_parse"]
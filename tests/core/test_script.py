@@ -0,0 +1,96 @@
+import io
+from gamagama.cli.core.main import run_script_mode
+from gamagama.cli.core.registry import CommandTree
+from gamagama.cli.commands import discover_commands
+from gamagama.cli.systems import GenericSystem
+
+
+def _tree():
+    tree = CommandTree()
+    discover_commands(tree)
+    return tree
+
+
+def test_script_runs_lines_in_one_session(capsys):
+    """
+    Navigation on one line carries over to the next, as at the prompt.
+    """
+    script = io.StringIO("system\nshow\n")
+
+    errors = run_script_mode(_tree(), GenericSystem, script)
+
+    captured = capsys.readouterr()
+    assert errors == 0
+    assert "schema: (none)" in captured.out
+    assert "Welcome" not in captured.out
+
+
+def test_script_skips_blank_lines_and_comments(capsys):
+    script = io.StringIO("# an encounter\n\nroll d1\n")
+
+    errors = run_script_mode(_tree(), GenericSystem, script)
+
+    assert errors == 0
+    assert "d1: 1 [1]" in capsys.readouterr().out
+
+
+def test_script_continues_after_errors_by_default(capsys):
+    script = io.StringIO("bogus\nroll 'd1\nroll d1\n")
+
+    errors = run_script_mode(_tree(), GenericSystem, script)
+
+    captured = capsys.readouterr()
+    assert errors == 2
+    assert "Command not found: bogus" in captured.out
+    assert "Parse error" in captured.out
+    assert "d1: 1 [1]" in captured.out
+
+
+def test_script_stop_on_error(capsys):
+    script = io.StringIO("roll d1\nbogus\nroll d1\n")
+
+    errors = run_script_mode(_tree(), GenericSystem, script, stop_on_error=True)
+
+    captured = capsys.readouterr()
+    assert errors == 1
+    assert captured.out.count("d1: 1 [1]") == 1
+    assert "Stopped at line 2: bogus" in captured.err
+
+
+def test_script_counts_handler_failures(tmp_path, monkeypatch, capsys):
+    """
+    A command that parses but fails (an invalid spec, a missing character)
+    is an error, and --stop-on-error stops at it.
+    """
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    errors = run_script_mode(_tree(), GenericSystem, io.StringIO("roll bogus\nload player nobody\n"))
+    assert errors == 2
+
+    errors = run_script_mode(
+        _tree(), GenericSystem, io.StringIO("roll bogus\nroll d1\n"), stop_on_error=True
+    )
+    captured = capsys.readouterr()
+    assert errors == 1
+    assert "d1: 1 [1]" not in captured.out
+    assert "Stopped at line 1: roll bogus" in captured.err
+
+
+def test_script_counts_failed_domain_selection(capsys):
+    script = io.StringIO("player nobody\nroll d1\n")
+
+    errors = run_script_mode(_tree(), GenericSystem, script, stop_on_error=True)
+
+    captured = capsys.readouterr()
+    assert errors == 1
+    assert "'nobody' not found in player." in captured.out
+    assert "d1: 1 [1]" not in captured.out
+
+
+def test_script_stops_at_quit(capsys):
+    script = io.StringIO("roll d1\nquit\nroll d1\n")
+
+    errors = run_script_mode(_tree(), GenericSystem, script)
+
+    assert errors == 0
+    assert capsys.readouterr().out.count("d1: 1 [1]") == 1
@@ -0,0 +1,131 @@
+import io
+import json
+import socket
+import threading
+import pytest
+from gamagama.cli.core.client import _needs_local_run, send
+from gamagama.cli.core.server import CommandServer
+from gamagama.cli.core.registry import CommandTree
+from gamagama.cli.commands import discover_commands
+from gamagama.cli.systems import GenericSystem
+
+
+@pytest.fixture
+def server(tmp_path):
+    tree = CommandTree()
+    discover_commands(tree)
+    socket_path = tmp_path / "gg.sock"
+
+    server = CommandServer(socket_path, tree, GenericSystem)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, socket_path
+    server.shutdown()
+    server.server_close()
+
+
+def _call(socket_path, argv, session=None):
+    out, err = io.StringIO(), io.StringIO()
+    status = send(argv, socket_path, session=session, out=out, err=err)
+    return status, out.getvalue(), err.getvalue()
+
+
+def test_server_runs_command(server):
+    _, socket_path = server
+
+    status, out, err = _call(socket_path, ["roll", "d1"])
+
+    assert status == 0
+    assert out == "d1: 1 [1]\n"
+    assert err == ""
+
+
+def test_server_reports_parse_errors(server):
+    _, socket_path = server
+
+    status, out, err = _call(socket_path, ["roll", "d1", "--times", "x"])
+
+    assert status == 2
+    assert "invalid int value" in err
+
+
+def test_server_ignores_connections_without_a_request(server, monkeypatch):
+    srv, socket_path = server
+    errors = []
+    monkeypatch.setattr(srv, "handle_error", lambda request, address: errors.append(address))
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        probe.connect(str(socket_path))
+
+    # Requests are handled in order, so the probe has been handled by now.
+    assert _call(socket_path, ["roll", "d1"])[0] == 0
+    assert errors == []
+
+
+def test_server_rejects_malformed_requests(server):
+    _, socket_path = server
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        sock.sendall(b"not json\n")
+        frames = [json.loads(line) for line in sock.makefile("rb")]
+
+    assert frames[-1] == {"exit": 2}
+
+
+def test_server_reuses_parsers_across_calls(server):
+    _, socket_path = server
+
+    for _ in range(3):
+        assert _call(socket_path, ["roll", "d1"])[0] == 0
+
+
+def test_server_keeps_named_sessions(server):
+    srv, socket_path = server
+
+    _call(socket_path, ["roll", "d1"], session="table-1")
+    _call(socket_path, ["roll", "d1"], session="table-1")
+    _call(socket_path, ["roll", "d1"])
+
+    assert list(srv.sessions) == ["table-1"]
+
+
+def test_server_sessions_share_one_store(server):
+    srv, _ = server
+
+    named = srv._get_session("table-1", None)
+    transient = srv._get_session(None, None)
+
+    assert named.store is srv.store
+    assert transient.store is srv.store
+
+
+def test_server_refuses_options_it_cannot_honour(server):
+    _, socket_path = server
+
+    status, out, err = _call(socket_path, ["--script", "encounter.txt"])
+
+    assert status == 2
+    assert "not supported by the server" in err
+
+
+@pytest.mark.parametrize("argv, local", [
+    (["roll", "d6"], False),
+    (["--system", "generic", "roll", "d6"], False),
+    (["--system=generic", "roll", "d6"], False),
+    ([], True),
+    (["--system", "generic"], True),
+    (["--script", "encounter.txt"], True),
+    (["--script=-"], True),
+    (["roll", "d6", "--profile-startup"], True),
+    (["--stop", "--scr", "f"], True),
+    (["serve"], True),
+    (["--system", "generic", "host", "--port", "0"], True),
+])
+def test_client_runs_in_process_when_the_server_cannot(argv, local):
+    assert _needs_local_run(argv) is local
+
+
+def test_send_without_server_raises(tmp_path):
+    with pytest.raises(OSError):
+        send(["roll", "d1"], tmp_path / "missing.sock")
@@ -0,0 +1,130 @@
+import asyncio
+import socket
+
+import pytest
+
+from gamagama.cli.core.session_server import SessionServer, host
+from gamagama.cli.core.registry import CommandTree
+from gamagama.cli.commands import discover_commands
+from gamagama.cli.systems import GenericSystem
+
+
+def _server():
+    tree = CommandTree()
+    discover_commands(tree)
+    return SessionServer(tree, GenericSystem)
+
+
+async def _read_prompt(reader):
+    """Reads everything up to and including the next prompt."""
+    return (await reader.readuntil(b"> ")).decode("utf-8")
+
+
+async def _send(reader, writer, line):
+    writer.write(f"{line}\n".encode("utf-8"))
+    await writer.drain()
+    return await _read_prompt(reader)
+
+
+def test_connections_have_independent_sessions():
+    async def scenario():
+        server = _server()
+        listener = await server.start_tcp("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+
+        r1, w1 = await asyncio.open_connection("127.0.0.1", port)
+        r2, w2 = await asyncio.open_connection("127.0.0.1", port)
+        assert "Welcome" in await _read_prompt(r1)
+        await _read_prompt(r2)
+
+        # Navigating on one connection does not move the other.
+        assert await _send(r1, w1, "system") == "system (generic)> "
+        assert (await _send(r2, w2, "roll d1")) == "d1: 1 [1]\n> "
+        assert len(server.sessions) == 2
+
+        w1.close()
+        w2.close()
+        while server.sessions:
+            await asyncio.sleep(0.01)
+        listener.close()
+        await listener.wait_closed()
+
+    asyncio.run(scenario())
+
+
+def test_sessions_share_tree_and_store():
+    server = _server()
+
+    first = server.new_session()
+    second = server.new_session()
+
+    assert first.tree is second.tree is server.tree
+    assert first.store is second.store is server.store
+    assert first.players is not second.players
+
+
+def test_quit_closes_connection(tmp_path):
+    async def scenario():
+        server = _server()
+        listener = await server.start_unix(tmp_path / "tables.sock")
+
+        reader, writer = await asyncio.open_unix_connection(str(tmp_path / "tables.sock"))
+        await _read_prompt(reader)
+        writer.write(b"quit\n")
+        await writer.drain()
+        remaining = await reader.read()
+
+        while server.sessions:
+            await asyncio.sleep(0.01)
+        listener.close()
+        await listener.wait_closed()
+        return remaining
+
+    assert "> " not in asyncio.run(scenario()).decode("utf-8")
+
+
+def test_host_refuses_a_socket_another_server_listens_on(tmp_path, capsys):
+    path = tmp_path / "tables.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as other:
+        other.bind(str(path))
+        other.listen()
+
+        assert host(_server().tree, GenericSystem, path) == 1
+
+        assert "already listening" in capsys.readouterr().err
+        # The other server's socket is left alone.
+        assert path.exists()
+
+
+def test_start_unix_replaces_a_stale_socket(tmp_path):
+    path = tmp_path / "tables.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as dead:
+        dead.bind(str(path))
+
+    async def scenario():
+        listener = await _server().start_unix(path)
+        reader, writer = await asyncio.open_unix_connection(str(path))
+        prompt = await _read_prompt(reader)
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return prompt
+
+    assert "Welcome" in asyncio.run(scenario())
+
+
+def test_start_unix_refuses_a_live_socket(tmp_path):
+    path = tmp_path / "tables.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as other:
+        other.bind(str(path))
+        other.listen()
+
+        with pytest.raises(OSError, match="already listening"):
+            asyncio.run(_server().start_unix(path))
+
+
+def test_execute_captures_errors():
+    server = _server()
+    session = server.new_session()
+
+    assert server.execute(session, "bogus\n") == "Command not found: bogus\n"
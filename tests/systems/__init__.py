@@ -0,0 +1 @@
+# Tests for the gamagama.cli.systems package
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+from gamagama.cli.systems.dice import compile_spec
+from gamagama.cli.systems.dice.bulk import roll_many, summarize, summarize_counts
+from gamagama.cli.systems.dice.explode import ExplosionStats
+
+
+def test_roll_many_deterministic():
+    totals = roll_many(compile_spec("2d1+1d1-1d1+3"), 50, use_numpy=False)
+    assert list(totals) == [5] * 50
+
+
+def test_roll_many_range():
+    rng = random.Random(1234)
+    totals = roll_many(compile_spec("3d6"), 1000, use_numpy=False, rng=rng)
+    assert len(totals) == 1000
+    assert min(totals) >= 3
+    assert max(totals) <= 18
+
+
+def test_roll_many_exploding_exceeds_sides():
+    rng = random.Random(1234)
+    totals = roll_many(compile_spec("d2!"), 1000, use_numpy=False, rng=rng)
+    assert min(totals) >= 1
+    # With 1000 d2! rolls, some chain will certainly explode.
+    assert max(totals) > 2
+    # An exploded d2 can never total a multiple of 2 (each explosion adds 2, the last roll adds 1).
+    assert all(total % 2 == 1 for total in totals)
+
+
+def test_roll_many_numpy_path():
+    pytest.importorskip("numpy")
+    totals = roll_many(compile_spec("4d6!+1"), 1000, use_numpy=True)
+    assert len(totals) == 1000
+    assert totals.min() >= 5
+
+
+def test_summarize():
+    summary = summarize([1, 2, 3, 4])
+    assert summary.count == 4
+    assert summary.mean == 2.5
+    assert summary.minimum == 1
+    assert summary.maximum == 4
+    assert summary.stdev == pytest.approx(1.118, abs=1e-3)
+
+
+def test_summarize_counts():
+    summary = summarize_counts({10: 3, 20: 1})
+    assert summary.count == 4
+    assert summary.mean == 12.5
+
+
+def test_roll_many_explode_depth_and_stats():
+    rng = random.Random(1234)
+    stats = ExplosionStats()
+    totals = roll_many(compile_spec("2d2!"), 1000, use_numpy=False, rng=rng, max_depth=3, stats=stats)
+
+    # Each die is capped at 3 rerolls: 2 + 2 + 2 + 2.
+    assert max(totals) <= 16
+    assert stats.dice == 2000
+    assert 0 < stats.exploded < 2000
+    assert stats.longest_chain <= 3
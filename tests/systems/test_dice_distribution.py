@@ -0,0 +1,57 @@
+import pytest
+from gamagama.cli.systems.dice import compile_spec
+from gamagama.cli.systems.dice.distribution import (
+    die_distribution,
+    distribution,
+    explode_depth,
+    group_distribution,
+)
+
+
+def test_single_die():
+    dist = die_distribution(6)
+    assert dist.minimum == 1
+    assert dist.maximum == 6
+    assert dist.mean == pytest.approx(3.5)
+
+
+def test_three_d_six():
+    dist = distribution(compile_spec("3d6"))
+    assert dist.minimum == 3
+    assert dist.maximum == 18
+    assert sum(dist.probabilities) == pytest.approx(1.0)
+    assert dist.mean == pytest.approx(10.5)
+    assert dist.variance == pytest.approx(8.75)
+    assert dist.probabilities[10 - dist.offset] == pytest.approx(27 / 216)
+    assert dist.percentile(0.5) == 10
+    assert dist.percentile(0.05) == 6
+
+
+def test_modifier_and_subtraction():
+    dist = distribution(compile_spec("2d6-1d4+1"))
+    assert dist.minimum == 2 - 4 + 1
+    assert dist.maximum == 12 - 1 + 1
+    assert dist.mean == pytest.approx(7 - 2.5 + 1)
+
+
+def test_exploding_die_mean():
+    # E[d6!] = 3.5 / (1 - 1/6) = 4.2, up to the depth cutoff.
+    dist = distribution(compile_spec("1d6!"))
+    assert sum(dist.probabilities) == pytest.approx(1.0)
+    assert dist.mean == pytest.approx(4.2)
+    assert dist.probabilities[6 - dist.offset] == 0.0
+
+
+def test_exploding_depth_cutoff():
+    dist = die_distribution(2, explode=True, depth=1)
+    # 1 (1/2), 2+1 (1/4), 2+2 (1/4): the single reroll is kept as rolled.
+    assert dist.probabilities == (0.5, 0.0, 0.25, 0.25)
+
+
+def test_explode_depth_limits():
+    assert explode_depth(2, max_depth=5) == 5
+    assert explode_depth(100, max_depth=20) < 20
+
+
+def test_group_distribution_is_memoized():
+    assert group_distribution(4, 6) is group_distribution(4, 6)
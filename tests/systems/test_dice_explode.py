@@ -0,0 +1,55 @@
+from gamagama.cli.systems.dice.explode import ExplosionStats, explode_list
+
+
+def _draws(*batches):
+    """Returns a draw function that serves the given batches in order."""
+    batches = list(batches)
+    calls = []
+
+    def draw(k):
+        batch = batches.pop(0)
+        assert len(batch) == k
+        calls.append(k)
+        return list(batch)
+
+    draw.calls = calls
+    return draw
+
+
+def test_explode_batches_live_dice():
+    draw = _draws([6, 2], [6], [1])
+    stats = ExplosionStats()
+
+    column = explode_list([6, 3, 6], 6, draw, stats=stats)
+
+    # Both maxed dice are rerolled together, then only the one that maxed again.
+    assert draw.calls == [2, 1, 1]
+    assert column == [6 + 6 + 6 + 1, 3, 6 + 2]
+    assert stats.dice == 3
+    assert stats.exploded == 2
+    assert stats.longest_chain == 3
+    assert stats.chain_lengths() == {1: 1, 3: 1}
+    assert stats.mean_chain == (1 + 3) / 3
+    assert stats.capped == 0
+
+
+def test_explode_depth_cap():
+    draw = _draws([2], [2])
+    stats = ExplosionStats()
+
+    column = explode_list([2], 2, draw, max_depth=2, stats=stats)
+
+    # The second reroll maxed again but the chain is capped there.
+    assert column == [6]
+    assert stats.capped == 1
+    assert stats.chain_lengths() == {2: 1}
+
+
+def test_explode_no_explosions():
+    stats = ExplosionStats()
+    column = explode_list([1, 2, 3], 6, _draws(), stats=stats)
+
+    assert column == [1, 2, 3]
+    assert stats.exploded == 0
+    assert stats.mean_chain == 0.0
+    assert stats.chain_lengths() == {}
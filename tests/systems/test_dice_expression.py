@@ -0,0 +1,73 @@
+import pytest
+from gamagama.cli.systems.dice import (
+    ConstantTerm,
+    DiceSpecError,
+    DiceTerm,
+    compile_spec,
+)
+
+
+class FixedEngine:
+    """A DiceEngine stand-in that always rolls the same value."""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = []
+
+    def roll(self, sides, explode):
+        self.calls.append((sides, explode))
+        return self.value
+
+
+def test_compile_single_term():
+    expr = compile_spec("3d6!+5")
+    assert expr.dice == (DiceTerm(count=3, sides=6, explode=True),)
+    assert expr.modifier == 5
+    assert expr.explodes
+
+
+def test_compile_multi_term():
+    expr = compile_spec("2d6+1d4-1d8+3-1")
+    assert expr.terms == (
+        DiceTerm(count=2, sides=6),
+        DiceTerm(count=1, sides=4),
+        DiceTerm(count=1, sides=8, sign=-1),
+        ConstantTerm(value=3),
+        ConstantTerm(value=-1),
+    )
+    assert expr.modifier == 2
+    assert not expr.explodes
+
+
+def test_compile_percentile_and_case():
+    expr = compile_spec("D%")
+    assert expr.dice == (DiceTerm(count=1, sides=100),)
+
+
+@pytest.mark.parametrize("spec", ["", "abc", "5", "+d6", "2d6d4", "2d6++3", "d6+", "d"])
+def test_compile_invalid(spec):
+    with pytest.raises(DiceSpecError, match="Invalid dice specification"):
+        compile_spec(spec)
+
+
+def test_compile_rejects_zero_sides():
+    with pytest.raises(DiceSpecError, match="0-sided"):
+        compile_spec("1d6+2d0")
+
+
+def test_compile_rejects_exploding_d1():
+    with pytest.raises(DiceSpecError, match="1-sided"):
+        compile_spec("1d1!")
+
+
+def test_compile_is_cached():
+    assert compile_spec("4d10+2") is compile_spec("4d10+2")
+
+
+def test_evaluate_uses_engine():
+    engine = FixedEngine(3)
+    result = compile_spec("2d6!-1d4+1").evaluate(engine)
+
+    assert engine.calls == [(6, True), (6, True), (4, False)]
+    assert result.rolls == [3, 3, 3]
+    assert result.total == 3 + 3 - 3 + 1
@@ -0,0 +1,71 @@
+import json
+from importlib.metadata import EntryPoint
+
+import pytest
+import gamagama.cli.systems as systems
+from gamagama.cli.systems import GenericSystem, SystemRegistry
+
+
+def _fake_entry_points(calls):
+    def fake(group):
+        calls.append(group)
+        return [
+            EntryPoint(
+                name="fake",
+                value="gamagama.cli.systems.generic:GenericSystem",
+                group=group,
+            )
+        ]
+
+    return fake
+
+
+def test_registry_is_lazy(monkeypatch):
+    calls = []
+    monkeypatch.setattr(systems, "entry_points", _fake_entry_points(calls))
+    registry = SystemRegistry({"generic": GenericSystem})
+
+    assert calls == []
+    assert sorted(registry.keys()) == ["fake", "generic"]
+    assert "fake" in registry
+    assert registry._loaded == {}
+
+    assert registry["fake"] is GenericSystem
+    assert list(registry._loaded) == ["fake"]
+    assert registry.get("missing") is None
+    assert calls == [systems.ENTRY_POINT_GROUP]
+
+
+def test_registry_reuses_index_file(monkeypatch, tmp_path):
+    index_path = tmp_path / "systems.json"
+    calls = []
+    monkeypatch.setattr(systems, "entry_points", _fake_entry_points(calls))
+
+    list(SystemRegistry({"generic": GenericSystem}, index_path=index_path))
+    assert len(list(SystemRegistry({"generic": GenericSystem}, index_path).keys())) == 2
+    assert calls == [systems.ENTRY_POINT_GROUP]
+
+    data = json.loads(index_path.read_text())
+    assert data["systems"] == {"fake": "gamagama.cli.systems.generic:GenericSystem"}
+
+
+def test_registry_index_invalidated_by_distribution_change(monkeypatch, tmp_path):
+    index_path = tmp_path / "systems.json"
+    calls = []
+    monkeypatch.setattr(systems, "entry_points", _fake_entry_points(calls))
+
+    list(SystemRegistry({"generic": GenericSystem}, index_path=index_path))
+
+    # Simulate installing a distribution into a sys.path directory.
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    monkeypatch.syspath_prepend(str(site_dir))
+
+    list(SystemRegistry({"generic": GenericSystem}, index_path=index_path))
+    assert len(calls) == 2
+
+
+def test_registry_unknown_system():
+    registry = SystemRegistry({"generic": GenericSystem})
+    with pytest.raises(KeyError):
+        registry["definitely-not-installed"]
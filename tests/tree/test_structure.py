@@ -228,3 +228,173 @@ def test_get_child_abstraction():
     seq_branch.add_child(child2)
     
     assert seq_branch.get_child("child2") is None
+
+
+def test_names_with_prefix():
+    """Test the sorted prefix lookup, including after children are added."""
+    branch = MapBranch(name="root")
+    for name in ("roll", "add", "rest", "r"):
+        branch.add_child(Leaf(name=name))
+
+    assert branch.names_with_prefix("r") == ["r", "rest", "roll"]
+    assert branch.names_with_prefix("re") == ["rest"]
+    assert branch.names_with_prefix("x") == []
+    assert branch.names_with_prefix("") == ["add", "r", "rest", "roll"]
+
+    branch.add_child(Leaf(name="reset"))
+    assert branch.names_with_prefix("re") == ["reset", "rest"]
+
+
+@dataclass(eq=False)
+class IndexedBranch(MapBranch):
+    indexed = True
+
+
+def test_find_indexed():
+    """Test the name index kept by insert and attach."""
+    tree = Tree()
+    system = tree.insert(["system"], IndexedBranch(name="system"))
+    schema = tree.attach(system, IndexedBranch(name="schema"))
+    tree.insert(["roll"], "cmd")
+
+    assert tree.find_indexed("system") is system
+    assert tree.find_indexed("schema") is schema
+    # Only indexed node classes are found
+    assert tree.find_indexed("roll") is None
+    assert tree.find_indexed("missing") is None
+
+
+def test_find_indexed_subtree_and_direct_add_child():
+    """Nodes attached inside a subtree, or with add_child, are found too."""
+    tree = Tree()
+    group = MapBranch(name="group")
+    player = IndexedBranch(name="player")
+    group.add_child(player)
+    tree.insert(["group"], group)
+    assert tree.find_indexed("player") is player
+
+    late = IndexedBranch(name="late")
+    tree.root.add_child(late)
+    assert tree.find_indexed("late") is late
+
+
+def test_find_indexed_scans_once_per_structure_change(monkeypatch):
+    """Repeated misses do not rescan the tree until it changes."""
+    tree = Tree()
+    tree.insert(["player"], IndexedBranch(name="player"))
+    scans = []
+    preorder = tree.preorder
+    monkeypatch.setattr(tree, "preorder", lambda: scans.append(1) or preorder())
+
+    assert tree.find_indexed("gandalf") is None
+    assert tree.find_indexed("gandalf") is None
+    assert tree.find_indexed("frodo") is None
+    assert len(scans) == 1
+
+    late = IndexedBranch(name="gandalf")
+    tree.root.add_child(late)
+    assert tree.find_indexed("gandalf") is late
+    assert len(scans) == 2
+
+
+def test_find_indexed_rejects_duplicate_names():
+    """Two indexed nodes cannot share a name, wherever they are."""
+    tree = Tree()
+    tree.insert(["player"], IndexedBranch(name="player"))
+    with pytest.raises(ValueError, match="already indexed"):
+        tree.insert(["group", "player"], IndexedBranch(name="player"))
+
+    group = tree.get(["group"])
+    with pytest.raises(ValueError, match="already indexed"):
+        tree.attach(group, IndexedBranch(name="player"))
+    assert list(group) == []
+
+
+def test_resolve_prefix():
+    """The first name bubbles up; later names must be children."""
+    tree = Tree()
+    roll = tree.insert(["roll"], "cmd")
+    load = tree.insert(["player", "load"], "cmd")
+    player = tree.get(["player"])
+
+    assert tree.resolve_prefix(player, ["roll", "3d6"]) == (roll, 1)
+    assert tree.resolve_prefix(tree.root, ["player", "load", "gandalf"]) == (load, 2)
+    assert tree.resolve_prefix(player, ["load"]) == (load, 1)
+    assert tree.resolve_prefix(player, []) == (player, 0)
+    assert tree.resolve_prefix(player, ["missing"]) == (None, 0)
+
+    assert tree.resolve(tree.root, ["player", "load"]) is load
+    assert tree.resolve(tree.root, ["player", "missing"]) is None
+    assert tree.resolve(tree.root, ["roll", "extra"]) is None
+
+
+def test_resolve_cache_follows_structure_changes():
+    """Memoized results are dropped when the tree changes."""
+    tree = Tree()
+    player = tree.insert(["player", "load"], "cmd").parent
+    assert tree.resolve(player, ["save"]) is None
+
+    version = tree.version
+    save = tree.insert(["save"], "cmd")
+    assert tree.version != version
+    assert tree.resolve(player, ["save"]) is save
+
+    # A closer match added with add_child directly is seen too.
+    local_save = Leaf(name="save")
+    player.add_child(local_save)
+    assert tree.resolve(player, ["save"]) is local_save
+
+
+def test_version_is_per_tree():
+    """A change to one tree does not invalidate the caches of another."""
+    tree, other = Tree(), Tree()
+    player = tree.insert(["player", "load"], "cmd").parent
+    version = tree.version
+
+    other.insert(["roll"], "cmd")
+    assert tree.version == version
+
+    # Adding below an attached branch moves the version of the tree it is in.
+    player.add_child(Leaf(name="save"))
+    assert tree.version != version
+
+    # So does adding below a subtree that was built first and attached later.
+    group = MapBranch(name="group")
+    inner = MapBranch(name="inner")
+    group.add_child(inner)
+    tree.attach(tree.root, group)
+    version = tree.version
+    inner.add_child(Leaf(name="cmd"))
+    assert tree.version != version
+
+
+def test_walk_deep_tree():
+    """Walking a tree deeper than the recursion limit works."""
+    import sys
+
+    tree = Tree()
+    depth = sys.getrecursionlimit() + 500
+    branch = tree.root
+    for i in range(depth):
+        child = SeqBranch(name=str(i))
+        branch.add_child(child)
+        branch = child
+    branch.add_child(Leaf(name="bottom"))
+
+    nodes = list(tree.walk())
+    assert len(nodes) == depth + 2
+    assert nodes[-1].name == "bottom"
+
+
+def test_preorder_cached_until_tree_changes():
+    """preorder() matches walk() and is rebuilt only after a change."""
+    tree = Tree()
+    tree.insert(["a"], "data_a")
+    tree.insert(["b", "c"], "data_c")
+
+    nodes = tree.preorder()
+    assert list(nodes) == list(tree.walk())
+    assert tree.preorder() is nodes
+
+    tree.insert(["b", "d"], "data_d")
+    assert [n.name for n in tree.preorder()] == ["root", "a", "b", "c", "d"]
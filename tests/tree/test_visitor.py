@@ -92,3 +92,93 @@ def test_visitor_generic_fallback():
     visitor.visit(leaf)
     
     assert visitor.visited == ["generic:item"]
+
+
+def test_visitor_registration_decorator():
+    """Test that @visits registers a handler for several node classes."""
+    from gamagama.cli.core.tree import MapBranch, visits
+
+    class BranchVisitor(NodeVisitor):
+        @visits(MapBranch, SeqBranch)
+        def on_branch(self, node):
+            return f"branch:{node.name}"
+
+        def visit_Leaf(self, node):
+            return f"leaf:{node.name}"
+
+    class SubVisitor(BranchVisitor):
+        @visits(SeqBranch)
+        def on_seq(self, node):
+            return f"seq:{node.name}"
+
+    visitor = BranchVisitor()
+    assert visitor.visit(MapBranch(name="m")) == "branch:m"
+    assert visitor.visit(SeqBranch(name="s")) == "branch:s"
+    assert visitor.visit(Leaf(name="l")) == "leaf:l"
+
+    sub = SubVisitor()
+    assert sub.visit(SeqBranch(name="s")) == "seq:s"
+    assert sub.visit(MapBranch(name="m")) == "branch:m"
+
+
+def test_visitor_most_derived_handler_wins():
+    """Test that a subclass's handler beats its base's, whether named or registered."""
+    from gamagama.cli.core.tree import MapBranch, visits
+
+    class Base(NodeVisitor):
+        @visits(MapBranch)
+        def on_map(self, node):
+            return "base"
+
+        def visit_Leaf(self, node):
+            return "base"
+
+    class Sub(Base):
+        def visit_MapBranch(self, node):
+            return "sub"
+
+        @visits(Leaf)
+        def on_leaf(self, node):
+            return "sub"
+
+    assert Base().visit(MapBranch(name="m")) == "base"
+    assert Sub().visit(MapBranch(name="m")) == "sub"
+    assert Sub().visit(Leaf(name="l")) == "sub"
+
+
+def test_visitor_dispatch_is_cached_per_visitor_class():
+    """Test that the handler for a node class is looked up once per visitor class."""
+
+    class CountingVisitor(NodeVisitor):
+        def visit_Leaf(self, node):
+            return node.name
+
+    class OtherVisitor(NodeVisitor):
+        pass
+
+    assert CountingVisitor().visit(Leaf(name="a")) == "a"
+    assert CountingVisitor._dispatch == {Leaf: "visit_Leaf"}
+    assert OtherVisitor().visit(Leaf(name="a")) is None
+    assert OtherVisitor._dispatch == {Leaf: None}
+
+
+def test_visitor_static_class_and_instance_handlers():
+    """Test that handlers are looked up on the visitor like any attribute."""
+    from gamagama.cli.core.tree import MapBranch
+
+    class StaticVisitor(NodeVisitor):
+        @staticmethod
+        def visit_Leaf(node):
+            return f"static:{node.name}"
+
+        @classmethod
+        def visit_MapBranch(cls, node):
+            return f"{cls.__name__}:{node.name}"
+
+    visitor = StaticVisitor()
+    assert visitor.visit(Leaf(name="l")) == "static:l"
+    assert visitor.visit(MapBranch(name="m")) == "StaticVisitor:m"
+
+    visitor.visit_Leaf = lambda node: f"instance:{node.name}"
+    assert visitor.visit(Leaf(name="l")) == "instance:l"
+    assert StaticVisitor().visit(Leaf(name="l")) == "static:l"